@@ -0,0 +1,103 @@
+# benchmarks/bench_instancing.py
+"""
+Instanced vs. per-bone geometry: actors are built with and without the
+InstanceTable, then the first frame (buffer upload) and an orbit are timed
+offscreen. Without a model path a synthetic OBJ of repeated bones is used
+(see benchmarks.synthetic_models.write_repeated_obj).
+
+    python -m benchmarks.bench_instancing
+    python -m benchmarks.bench_instancing models/female_human_skeleton.obj --frames 100 --output instancing.json
+"""
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import vtk
+
+from benchmarks.synthetic_models import write_repeated_obj
+from model.mesh_cache import MeshCache
+from model.model_registry import LoadedModel
+from model.obj_loader import ObjLoader, make_actors
+
+
+def run(obj_path, frames, size):
+    cache_dir = tempfile.mkdtemp(prefix="bench_instancing_")
+    try:
+        loader = ObjLoader(obj_path, cache=MeshCache(cache_dir))
+        groups = loader.load_groups()
+        start = time.perf_counter()
+        instances = loader.load_instances(groups)
+        table_s = time.perf_counter() - start
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    print(f"{len(groups)} bones, {len(instances.instance_rows)} instanced "
+          f"({len(instances.prototype_rows)} distinct meshes), table built in {table_s * 1000:.1f} ms")
+
+    results = {"bones": len(groups), "instances": int(len(instances.instance_rows)), "table_ms": table_s * 1000}
+    for name, table in (("per-bone", None), ("instanced", instances)):
+        polydata = [group.to_polydata() for group in groups]
+        renderer = vtk.vtkRenderer()
+        window = vtk.vtkRenderWindow()
+        window.SetOffScreenRendering(1)
+        window.SetSize(size, size)
+        window.AddRenderer(renderer)
+        actors = make_actors(polydata, table)
+        for actor in actors:
+            renderer.AddActor(actor)
+        renderer.ResetCamera()
+        start = time.perf_counter()
+        window.Render()  # first frame uploads the buffers
+        first_frame_ms = (time.perf_counter() - start) * 1000
+
+        samples = []
+        for _ in range(frames):
+            renderer.GetActiveCamera().Azimuth(360.0 / frames)
+            frame_start = time.perf_counter()
+            window.Render()
+            samples.append(time.perf_counter() - frame_start)
+        window.Finalize()
+
+        mean_ms = sum(samples) / len(samples) * 1000
+        gpu_bytes = LoadedModel(obj_path, obj_path, groups, polydata, None, table).gpu_bytes
+        results[name] = {
+            "mappers": len({actor.GetMapper() for actor in actors}),
+            "gpu_bytes_estimate": gpu_bytes,
+            "first_frame_ms": first_frame_ms,
+            "mean_frame_ms": mean_ms,
+        }
+        print(f"{name:10s} mappers {results[name]['mappers']:5d}  GPU ~{gpu_bytes / (1 << 20):7.2f} MB  "
+              f"first frame {first_frame_ms:7.1f} ms  mean frame {mean_ms:6.2f} ms")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("obj_path", nargs="?", default=None, help="model to measure (default: synthetic)")
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--size", type=int, default=1024)
+    parser.add_argument("--groups", type=int, default=20, help="synthetic model: distinct bones")
+    parser.add_argument("--copies", type=int, default=3, help="synthetic model: copies of each bone")
+    parser.add_argument("--output", default=None, help="write results JSON here")
+    args = parser.parse_args(argv)
+
+    obj_dir = None
+    obj_path = args.obj_path
+    if obj_path is None:
+        obj_dir = tempfile.mkdtemp(prefix="bench_instancing_obj_")
+        obj_path = os.path.join(obj_dir, "repeated.obj")
+        write_repeated_obj(obj_path, groups=args.groups, copies=args.copies)
+    try:
+        results = run(obj_path, args.frames, args.size)
+    finally:
+        if obj_dir is not None:
+            shutil.rmtree(obj_dir, ignore_errors=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# benchmarks/bench_lod.py
+"""
+Frame time per LOD tier: builds (or reads cached) decimated tiers of a model and
+renders an orbiting camera offscreen at each tier.
+
+    python -m benchmarks.bench_lod models/female_human_skeleton.obj --frames 100
+"""
+import argparse
+import time
+
+import vtk
+
+from model.lod import LOD_REDUCTIONS, load_lod_tiers
+from model.mesh_cache import MeshCache
+from model.obj_loader import ObjLoader, build_polydata, make_actor
+
+
+def run(obj_path, frames, size, use_cache):
+    loader = ObjLoader(obj_path, cache=MeshCache() if use_cache else None)
+    start = time.perf_counter()
+    tiers = load_lod_tiers(loader)
+    print(f"Tier generation/loading: {time.perf_counter() - start:.2f} s")
+
+    results = {}
+    for tier, groups in enumerate(tiers):
+        renderer = vtk.vtkRenderer()
+        window = vtk.vtkRenderWindow()
+        window.SetOffScreenRendering(1)
+        window.SetSize(size, size)
+        window.AddRenderer(renderer)
+        triangles = 0
+        for _, vertices, offsets, connectivity in groups:
+            renderer.AddActor(make_actor(build_polydata(vertices, offsets, connectivity)))
+            triangles += len(offsets) - 1
+        renderer.ResetCamera()
+        window.Render()
+
+        samples = []
+        for _ in range(frames):
+            renderer.GetActiveCamera().Azimuth(360.0 / frames)
+            frame_start = time.perf_counter()
+            window.Render()
+            samples.append(time.perf_counter() - frame_start)
+        window.Finalize()
+
+        mean_ms = sum(samples) / len(samples) * 1000
+        reduction = 0.0 if tier == 0 else LOD_REDUCTIONS[tier - 1]
+        results[tier] = {"reduction": reduction, "triangles": triangles, "mean_ms": mean_ms}
+        print(f"tier {tier} (reduction {reduction:.2f}): {triangles:8d} triangles  mean {mean_ms:6.2f} ms")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("obj_path", nargs="?", default="models/female_human_skeleton.obj")
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--size", type=int, default=1024)
+    parser.add_argument("--no-cache", action="store_true", help="always decimate, never read/write the mesh cache")
+    args = parser.parse_args(argv)
+    run(args.obj_path, args.frames, args.size, not args.no_cache)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# benchmarks/bench_mesh_memory.py
+"""
+Resident memory per vertex and per face: the nested Python lists the legacy
+loader kept ([[x, y, z], ...] and [[i, j, k], ...] per group) against the packed
+MeshStore buffers ObjLoader and MeshCache share.
+
+    python -m benchmarks.bench_mesh_memory models/female_human_skeleton.obj
+"""
+import argparse
+import gc
+import tracemalloc
+
+from model.mesh_store import MeshStore
+from model.obj_loader import ObjLoader
+
+
+def _traced_bytes(build):
+    """Bytes still allocated by build() once it returns (the result is kept alive)."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def run(obj_path):
+    store = MeshStore.from_groups(ObjLoader(obj_path).parse_groups())
+    n_vertices = len(store.vertices)
+    n_faces = len(store.offsets) - len(store)
+
+    # Rebuilt from the parsed arrays so only the lists themselves are traced
+    vertex_lists, vertex_list_bytes = _traced_bytes(
+        lambda: [group.vertices.tolist() for group in store]
+    )
+    face_lists, face_list_bytes = _traced_bytes(lambda: [
+        [connectivity[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+        for connectivity, offsets in ((g.connectivity.tolist(), g.offsets.tolist()) for g in store)
+    ])
+    list_bytes = vertex_list_bytes + face_list_bytes
+    del vertex_lists, face_lists
+
+    results = {
+        "vertices": n_vertices,
+        "faces": n_faces,
+        "lists_bytes_per_vertex": vertex_list_bytes / max(n_vertices, 1),
+        "lists_bytes_per_face": face_list_bytes / max(n_faces, 1),
+        "store_bytes_per_vertex": store.vertices.nbytes / max(n_vertices, 1),
+        "store_bytes_per_face": (store.offsets.nbytes + store.connectivity.nbytes) / max(n_faces, 1),
+    }
+    print(f"{n_vertices} vertices, {n_faces} faces in {len(store)} groups")
+    print(f"nested lists: {results['lists_bytes_per_vertex']:7.1f} B/vertex  "
+          f"{results['lists_bytes_per_face']:7.1f} B/face  ({list_bytes / (1 << 20):.1f} MB)")
+    print(f"MeshStore:    {results['store_bytes_per_vertex']:7.1f} B/vertex  "
+          f"{results['store_bytes_per_face']:7.1f} B/face  ({store.nbytes / (1 << 20):.1f} MB)")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("obj_path", nargs="?", default="models/female_human_skeleton.obj")
+    args = parser.parse_args(argv)
+    run(args.obj_path)
+
+
+if __name__ == "__main__":
+    main()
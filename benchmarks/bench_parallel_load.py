@@ -0,0 +1,48 @@
+# benchmarks/bench_parallel_load.py
+"""
+Parallel OBJ decoding scaling: parses one synthetic many-group model with
+1..N worker processes and prints wall time and speed-up.
+
+    python -m benchmarks.bench_parallel_load --groups 400 --max-workers 8
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.synthetic_models import write_synthetic_obj
+from model.obj_loader import ObjLoader
+
+
+def run(groups, vertices_per_group, faces_per_group, max_workers, repeats):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "synthetic.obj")
+        write_synthetic_obj(path, groups, vertices_per_group, faces_per_group)
+        print(f"Model: {groups} groups, {os.path.getsize(path) / 1e6:.1f} MB")
+
+        results = {}
+        worker_counts = sorted({1, *range(2, max_workers + 1, 2), max_workers})
+        for workers in worker_counts:
+            best = float("inf")
+            for _ in range(repeats):
+                start = time.perf_counter()
+                ObjLoader(path, workers=workers).parse_groups()
+                best = min(best, time.perf_counter() - start)
+            results[workers] = best
+            print(f"workers={workers:2d}  {best:7.3f} s  speed-up x{results[1] / best:.2f}")
+        return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--groups", type=int, default=200)
+    parser.add_argument("--vertices-per-group", type=int, default=5000)
+    parser.add_argument("--faces-per-group", type=int, default=10000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args(argv)
+    run(args.groups, args.vertices_per_group, args.faces_per_group, args.max_workers, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
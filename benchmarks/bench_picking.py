@@ -0,0 +1,61 @@
+# benchmarks/bench_picking.py
+"""
+Picks per second on a model: vtkCellPicker without locators, with per-actor
+static cell locators, and the cached hardware selector.
+
+    python -m benchmarks.bench_picking models/female_human_skeleton.obj
+"""
+import argparse
+import time
+
+import vtk
+
+from model.obj_loader import ObjLoader
+from ui.pick_backends import CellPickBackend, HardwarePickBackend
+
+
+def run(obj_path, size, step):
+    actors, _ = ObjLoader(obj_path).load_grouped_obj()
+    renderer = vtk.vtkRenderer()
+    window = vtk.vtkRenderWindow()
+    window.SetOffScreenRendering(1)
+    window.SetSize(size, size)
+    window.AddRenderer(renderer)
+    for actor in actors:
+        renderer.AddActor(actor)
+    renderer.ResetCamera()
+    window.Render()
+
+    points = [(x, y) for x in range(0, size, step) for y in range(0, size, step)]
+    backends = {
+        "cpu": CellPickBackend(renderer, use_locators=False),
+        "cpu+locator": CellPickBackend(renderer),
+        "hardware": HardwarePickBackend(renderer),
+    }
+
+    results = {}
+    for label, backend in backends.items():
+        start = time.perf_counter()
+        backend.register_actors(actors)
+        setup = time.perf_counter() - start
+
+        start = time.perf_counter()
+        hits = sum(backend.pick(x, y)[0] is not None for x, y in points)
+        elapsed = time.perf_counter() - start
+        results[label] = {"picks_per_s": len(points) / elapsed, "setup_s": setup, "hits": hits}
+        print(f"{label:12s} {len(points) / elapsed:9.1f} picks/s  setup {setup * 1000:7.1f} ms  hits {hits}")
+    window.Finalize()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("obj_path", nargs="?", default="models/female_human_skeleton.obj")
+    parser.add_argument("--size", type=int, default=800, help="window size in pixels")
+    parser.add_argument("--step", type=int, default=20, help="pixel spacing of the pick grid")
+    args = parser.parse_args(argv)
+    run(args.obj_path, args.size, args.step)
+
+
+if __name__ == "__main__":
+    main()
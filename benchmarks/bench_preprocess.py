@@ -0,0 +1,111 @@
+# benchmarks/bench_preprocess.py
+"""
+Preprocessing cost vs. frame time: each configuration is loaded cold (parse +
+stages, written to a fresh cache) and warm (cache hit), then rendered from an
+orbiting camera offscreen.
+
+    python -m benchmarks.bench_preprocess models/female_human_skeleton.obj --frames 100
+    python -m benchmarks.bench_preprocess --output preprocess.json
+
+Configurations:
+    raw             no preprocessing (the mapper shades without normals)
+    normals         cached per-vertex normals
+    clean+normals   duplicate points merged first
+    normals+strips  normals, plus vtkStripper triangle strips built per actor at load time
+"""
+import argparse
+import json
+import shutil
+import tempfile
+import time
+
+import vtk
+
+from model.mesh_cache import MeshCache
+from model.obj_loader import ObjLoader, make_actor
+
+CONFIGS = {
+    "raw": dict(normals=False, clean=False),
+    "normals": dict(normals=True, clean=False),
+    "clean+normals": dict(normals=True, clean=True),
+    "normals+strips": dict(normals=True, clean=False),
+}
+
+
+def _strip(polydata):
+    stripper = vtk.vtkStripper()
+    stripper.SetInputData(polydata)
+    stripper.Update()
+    return stripper.GetOutput()
+
+
+def run(obj_path, frames, size):
+    results = {}
+    for name, options in CONFIGS.items():
+        cache_dir = tempfile.mkdtemp(prefix="bench_preprocess_")
+        try:
+            start = time.perf_counter()
+            ObjLoader(obj_path, cache=MeshCache(cache_dir), **options).load_groups()
+            cold_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            groups = ObjLoader(obj_path, cache=MeshCache(cache_dir), **options).load_groups()
+            warm_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            polydata = [group.to_polydata() for group in groups]
+            if name.endswith("+strips"):
+                polydata = [_strip(p) for p in polydata]
+            build_s = time.perf_counter() - start
+
+            renderer = vtk.vtkRenderer()
+            window = vtk.vtkRenderWindow()
+            window.SetOffScreenRendering(1)
+            window.SetSize(size, size)
+            window.AddRenderer(renderer)
+            for p in polydata:
+                renderer.AddActor(make_actor(p))
+            renderer.ResetCamera()
+            start = time.perf_counter()
+            window.Render()  # first frame uploads the buffers
+            first_frame_ms = (time.perf_counter() - start) * 1000
+
+            samples = []
+            for _ in range(frames):
+                renderer.GetActiveCamera().Azimuth(360.0 / frames)
+                frame_start = time.perf_counter()
+                window.Render()
+                samples.append(time.perf_counter() - frame_start)
+            window.Finalize()
+        finally:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+
+        mean_ms = sum(samples) / len(samples) * 1000
+        results[name] = {
+            "cold_load_s": cold_s,
+            "warm_load_s": warm_s,
+            "actor_build_s": build_s,
+            "first_frame_ms": first_frame_ms,
+            "mean_frame_ms": mean_ms,
+            "points": sum(p.GetNumberOfPoints() for p in polydata),
+        }
+        print(f"{name:15s} cold {cold_s:6.3f} s  warm {warm_s:6.3f} s  build {build_s:6.3f} s  "
+              f"first frame {first_frame_ms:7.1f} ms  mean frame {mean_ms:6.2f} ms")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("obj_path", nargs="?", default="models/female_human_skeleton.obj")
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--size", type=int, default=1024)
+    parser.add_argument("--output", default=None, help="write results JSON here")
+    args = parser.parse_args(argv)
+    results = run(args.obj_path, args.frames, args.size)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
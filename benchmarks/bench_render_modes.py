@@ -0,0 +1,71 @@
+# benchmarks/bench_render_modes.py
+"""
+Frame time of the per-bone actor path vs. the merged single-actor path.
+Renders an orbiting camera offscreen and reports mean / p95 frame time.
+
+    python -m benchmarks.bench_render_modes --groups 250 --frames 200
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import vtk
+
+from benchmarks.synthetic_models import write_synthetic_obj
+from model.merged_model import MergedModel
+from model.obj_loader import ObjLoader, build_polydata, make_actor
+
+
+def time_frames(actors, frames, size=(1280, 800)):
+    renderer = vtk.vtkRenderer()
+    window = vtk.vtkRenderWindow()
+    window.SetOffScreenRendering(1)
+    window.SetSize(*size)
+    window.AddRenderer(renderer)
+    for actor in actors:
+        renderer.AddActor(actor)
+    renderer.ResetCamera()
+    window.Render()  # first frame uploads buffers / compiles shaders
+
+    camera = renderer.GetActiveCamera()
+    samples = []
+    for _ in range(frames):
+        camera.Azimuth(360.0 / frames)
+        start = time.perf_counter()
+        window.Render()
+        samples.append(time.perf_counter() - start)
+    window.Finalize()
+    samples.sort()
+    return sum(samples) / len(samples), samples[int(len(samples) * 0.95) - 1]
+
+
+def run(groups, vertices_per_group, faces_per_group, frames):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "synthetic.obj")
+        write_synthetic_obj(path, groups, vertices_per_group, faces_per_group)
+        parsed = ObjLoader(path).parse_groups()
+
+    per_actor = [make_actor(build_polydata(v, o, c)) for _, v, o, c in parsed]
+    merged = MergedModel(parsed)
+
+    results = {}
+    for label, actors in (("per-actor", per_actor), ("merged", [merged.actor])):
+        mean, p95 = time_frames(actors, frames)
+        results[label] = {"mean_ms": mean * 1000, "p95_ms": p95 * 1000}
+        print(f"{label:10s} actors={len(actors):4d}  mean {mean * 1000:6.2f} ms  p95 {p95 * 1000:6.2f} ms")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--groups", type=int, default=250)
+    parser.add_argument("--vertices-per-group", type=int, default=400)
+    parser.add_argument("--faces-per-group", type=int, default=800)
+    parser.add_argument("--frames", type=int, default=200)
+    args = parser.parse_args(argv)
+    run(args.groups, args.vertices_per_group, args.faces_per_group, args.frames)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# benchmarks/bench_startup.py
+"""
+Startup import cost of the menu, measured with `python -X importtime` in a fresh
+interpreter. Fails (exit status 1) if the cumulative import time exceeds the
+budget or if a viewer-only module was imported eagerly.
+
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --budget-ms 400 --runs 5 --output startup.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ENTRY_MODULE = "ui.main_menu"
+DEFAULT_BUDGET_MS = 400.0
+# Must not be imported before the user picks the viewer
+DEFERRED_MODULES = ("vtk", "vtkmodules.all", "viewer_app", "model.obj_loader", "camera.camera_controller",
+                    "ui.picker_handler")
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_profile(module=ENTRY_MODULE):
+    """Imports `module` in a fresh interpreter. Returns {module: (self_us, cumulative_us)}."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    )
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        profile[name.strip()] = (int(self_us), int(cumulative_us))
+    return profile
+
+
+def run(budget_ms=DEFAULT_BUDGET_MS, runs=5, top=10):
+    totals = []
+    profile = {}
+    for _ in range(runs):
+        profile = import_profile()
+        totals.append(profile[ENTRY_MODULE][1] / 1000)
+    median = statistics.median(totals)
+
+    print(f"{ENTRY_MODULE}: median {median:.1f} ms over {runs} runs (budget {budget_ms:.0f} ms)")
+    print("Slowest imports (self time, last run):")
+    for name, (self_us, _) in sorted(profile.items(), key=lambda item: -item[1][0])[:top]:
+        print(f"    {self_us / 1000:8.1f} ms  {name}")
+
+    eager = [name for name in DEFERRED_MODULES if name in profile]
+    for name in eager:
+        print(f"Deferred module imported at startup: {name}")
+
+    return {
+        "startup_import_ms": median,
+        "budget_ms": budget_ms,
+        "eager_deferred_modules": eager,
+        "ok": median <= budget_ms and not eager,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--output", default=None, help="write results JSON here")
+    args = parser.parse_args(argv)
+
+    results = run(args.budget_ms, args.runs)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+    sys.exit(0 if results["ok"] else 1)
+
+
+if __name__ == "__main__":
+    main()
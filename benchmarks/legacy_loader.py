@@ -0,0 +1,96 @@
+# benchmarks/legacy_loader.py
+"""
+Frozen copy of the original skeleton_model.load_obj_groups (pure-Python line
+parser), kept as the reference ObjLoader is tested and benchmarked against.
+"""
+import vtk
+
+
+# Function to load OBJ as separate vtkPolyData objects per group
+def load_obj_groups(filename):
+    actors = []
+    actor_name_map = {}  # map actor -> bone_name
+
+    current_vertices = []
+    current_faces = []
+    current_group_name = None
+
+    actors_list = []
+
+    with open(filename, "r", encoding="utf-8") as f:
+        lines = f.readlines()
+
+    global_vertices = []
+
+    for line in lines:
+        line = line.strip()
+        if line.startswith("v "):
+            global_vertices.append([float(p) for p in line.split()[1:]])
+        elif line.startswith("g "):
+            # Save previous group if it had faces
+            if current_group_name and current_faces:
+                actors_list.append((current_group_name, current_vertices, current_faces))
+
+            # Get new group name and clean it
+            group_name = line[2:].strip()
+            group_name = group_name.replace("_", " ")
+
+            # Remove everything after the first dot (e.g. ".003", ".059", ".male human skeleton")
+            if "." in group_name:
+                group_name = group_name.split(".", 1)[0].strip()
+
+            # (Optional) Remove known trailing suffixes like "male human skeleton"
+            suffixes_to_remove = ["male human skeleton", "female human skeleton"]
+            for suffix in suffixes_to_remove:
+                if suffix.lower() in group_name.lower():
+                    group_name = group_name.lower().replace(suffix.lower(), "").strip()
+
+            current_group_name = group_name
+
+            # Start new group
+            current_group_name = group_name
+            current_vertices = []
+            current_faces = []
+            vertex_map = {}
+        elif line.startswith("f "):
+            face = []
+            for p in line[2:].split():
+                idx = int(p.split("/")[0]) - 1
+                if idx not in vertex_map:
+                    vertex_map[idx] = len(current_vertices)
+                    current_vertices.append(global_vertices[idx])
+                face.append(vertex_map[idx])
+            current_faces.append(face)
+
+    if current_group_name and current_faces:
+        actors_list.append((current_group_name, current_vertices, current_faces))
+
+    vtk_actors = []
+    for name, verts, faces in actors_list:
+        points = vtk.vtkPoints()
+        for v in verts:
+            points.InsertNextPoint(v)
+
+        polys = vtk.vtkCellArray()
+        for f in faces:
+            polys.InsertNextCell(len(f))
+            for idx in f:
+                polys.InsertCellPoint(idx)
+
+        polydata = vtk.vtkPolyData()
+        polydata.SetPoints(points)
+        polydata.SetPolys(polys)
+
+        mapper = vtk.vtkPolyDataMapper()
+        mapper.SetInputData(polydata)
+
+        actor = vtk.vtkActor()
+        actor.SetMapper(mapper)
+        actor.SetPickable(True)
+        actor.GetProperty().SetColor(1, 1, 1)
+        actor.GetProperty().BackfaceCullingOn()
+
+        vtk_actors.append(actor)
+        actor_name_map[actor] = name
+
+    return vtk_actors, actor_name_map
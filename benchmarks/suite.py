@@ -0,0 +1,273 @@
+# benchmarks/suite.py
+"""
+Headless benchmark suite for the viewer's hot paths (offscreen VTK, no display).
+
+    python -m benchmarks.suite run --output results.json
+    python -m benchmarks.suite run --only load pick --groups 100 --output new.json
+    python -m benchmarks.suite compare results.json new.json --threshold 0.10
+
+Benchmarks:
+    load        ObjLoader vs the legacy load_obj_groups: wall time, peak Python/numpy memory
+                and a parity check (same group names, sizes and bounds)
+    pick        PickerHandler hover throughput (raw picks and the full hover/highlight path)
+    animation   CameraController zoom-in/zoom-out frames per second
+    menu_hover  MainMenu._pick_text_actor cost per hover
+
+`compare` exits with status 1 if any metric regressed by more than the threshold.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import vtk
+
+from benchmarks.legacy_loader import load_obj_groups
+from benchmarks.synthetic_models import write_synthetic_obj
+from model.obj_loader import ObjLoader
+
+# Metrics where a bigger number is better; everything else (times, memory) is lower-is-better
+HIGHER_IS_BETTER_SUFFIXES = ("_per_s", "_fps")
+# Reported for context only, never scored (e.g. a frame count that follows from the animation duration)
+UNSCORED_METRICS = ("zoom_frames",)
+
+
+def offscreen_window(size=(1280, 800)):
+    renderer = vtk.vtkRenderer()
+    window = vtk.vtkRenderWindow()
+    window.SetOffScreenRendering(1)
+    window.SetSize(*size)
+    window.AddRenderer(renderer)
+    interactor = vtk.vtkRenderWindowInteractor()
+    interactor.SetRenderWindow(window)
+    return renderer, window, interactor
+
+
+def _measure(fn):
+    """Returns (result, seconds, peak traced MB)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak / (1 << 20)
+
+
+def _actor_signature(actors, actor_map):
+    """[(name, points, cells, rounded bounds)] in load order."""
+    signature = []
+    for actor in actors:
+        polydata = actor.GetMapper().GetInput()
+        bounds = tuple(round(b, 4) for b in polydata.GetBounds())
+        signature.append((actor_map[actor], polydata.GetNumberOfPoints(), polydata.GetNumberOfCells(), bounds))
+    return signature
+
+
+def parity_mismatches(new_result, legacy_result):
+    """Groups where ObjLoader and the legacy loader disagree on name, size or bounds."""
+    new, old = _actor_signature(*new_result), _actor_signature(*legacy_result)
+    mismatches = sum(a != b for a, b in zip(new, old)) + abs(len(new) - len(old))
+    if mismatches:
+        print(f"    parity: {mismatches} group(s) differ from the legacy loader")
+    return mismatches
+
+
+# --- Benchmarks ---
+def bench_load(obj_path, legacy=True):
+    # Raw groups, as the legacy loader produces them (no segmentation or normals stage)
+    new_result, elapsed, peak = _measure(
+        lambda: ObjLoader(obj_path, segment=False, normals=False).load_grouped_obj())
+    metrics = {"objloader_s": elapsed, "objloader_peak_mb": peak}
+    if legacy:
+        legacy_result, elapsed, peak = _measure(lambda: load_obj_groups(obj_path))
+        metrics.update({"legacy_s": elapsed, "legacy_peak_mb": peak,
+                        "parity_mismatches": parity_mismatches(new_result, legacy_result)})
+    return metrics
+
+
+def _viewer_scene(obj_path):
+    from camera.camera_controller import CameraController
+    from ui.picker_handler import PickerHandler
+    from ui.text_overlays import TextOverlayManager
+
+    renderer, window, interactor = offscreen_window()
+    actors, actor_map = ObjLoader(obj_path).load_grouped_obj()
+    for actor in actors:
+        renderer.AddActor(actor)
+    renderer.ResetCamera()
+    window.Render()
+
+    text_mgr = TextOverlayManager(renderer)
+    camera_ctrl = CameraController(renderer.GetActiveCamera(), renderer, interactor, text_overlay_manager=text_mgr)
+    picker = PickerHandler(interactor, renderer, actor_map, text_mgr, camera_ctrl, max_pick_rate=0)
+    return window, interactor, actors, camera_ctrl, picker
+
+
+def bench_pick(obj_path, step=20):
+    window, interactor, _, _, picker = _viewer_scene(obj_path)
+    width, height = window.GetSize()
+    points = [(x, y) for y in range(0, height, step) for x in range(0, width, step)]
+
+    start = time.perf_counter()
+    for x, y in points:
+        picker._pick(x, y)
+    pick_s = time.perf_counter() - start
+
+    # Full hover path: coalescing checks, highlight swap, overlay text, render requests
+    start = time.perf_counter()
+    for x, y in points:
+        interactor.SetEventPosition(x, y)
+        picker.on_mouse_move(interactor, "MouseMoveEvent")
+    hover_s = time.perf_counter() - start
+    window.Finalize()
+    return {"pick_per_s": len(points) / pick_s, "hover_per_s": len(points) / hover_s}
+
+
+def bench_animation(obj_path, zooms=3):
+    window, _, actors, camera_ctrl, _ = _viewer_scene(obj_path)
+    animator = camera_ctrl.animator
+    animator.render = window.Render  # no event loop here: render every tick directly
+    target = max(actors, key=lambda a: a.GetMapper().GetInput().GetNumberOfCells())
+
+    frames = 0
+    start = time.perf_counter()
+    for _ in range(zooms):
+        for actor in (target, None):
+            camera_ctrl.start_zoom_animation(actor)
+            while animator.active:
+                animator.tick()
+                frames += 1
+    elapsed = time.perf_counter() - start
+    animator.shutdown()
+    window.Finalize()
+    return {"zoom_fps": frames / elapsed, "zoom_frames": frames}
+
+
+def bench_menu_hover(repeats=20_000):
+    from ui.main_menu import MainMenu
+    from ui.scene_manager import SceneManager
+
+    # Menu scene on an offscreen window instead of the default fullscreen one
+    _, window, interactor = offscreen_window((1920, 1080))
+    menu = MainMenu(SceneManager(window, interactor))
+    menu.manager.switch("menu")
+
+    width, height = menu.render_window.GetSize()
+    points = [((i * 37) % width, (i * 53) % height) for i in range(repeats)]
+    start = time.perf_counter()
+    for x, y in points:
+        menu._pick_text_actor(x, y)
+    elapsed = time.perf_counter() - start
+    menu.render_window.Finalize()
+    return {"menu_hover_us": elapsed / repeats * 1e6}
+
+
+BENCHMARKS = ("load", "pick", "animation", "menu_hover")
+
+
+def run_suite(only=BENCHMARKS, obj_path=None, groups=60, vertices_per_group=2000,
+              faces_per_group=4000, legacy=True):
+    """Runs the selected benchmarks on obj_path (or a synthetic model). Returns the results dict."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model = {"path": obj_path}
+        if obj_path is None:
+            obj_path = os.path.join(tmp_dir, "synthetic.obj")
+            vertices, faces = write_synthetic_obj(obj_path, groups, vertices_per_group, faces_per_group)
+            model = {"synthetic": True, "groups": groups, "vertices": vertices, "faces": faces}
+
+        results = {}
+        for name in only:
+            print(f"[bench] {name} ...")
+            if name == "load":
+                results[name] = bench_load(obj_path, legacy=legacy)
+            elif name == "pick":
+                results[name] = bench_pick(obj_path)
+            elif name == "animation":
+                results[name] = bench_animation(obj_path)
+            elif name == "menu_hover":
+                results[name] = bench_menu_hover()
+            for metric, value in results[name].items():
+                print(f"    {metric:22s} {value:12.3f}")
+
+    return {
+        "meta": {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "vtk": vtk.vtkVersion.GetVTKVersion(),
+            "platform": platform.platform(),
+            "model": model,
+        },
+        "results": results,
+    }
+
+
+def compare(baseline, current, threshold=0.10):
+    """
+    Returns [(benchmark, metric, old, new, change)] for metrics that got worse by
+    more than `threshold` (relative). change > 0 always means "worse"; a
+    lower-is-better metric leaving a zero baseline (e.g. parity_mismatches) is
+    an infinite regression.
+    """
+    regressions = []
+    for bench, metrics in current["results"].items():
+        for metric, new in metrics.items():
+            old = baseline["results"].get(bench, {}).get(metric)
+            if old is None or metric in UNSCORED_METRICS:
+                continue
+            higher_is_better = metric.endswith(HIGHER_IS_BETTER_SUFFIXES)
+            if old == 0:
+                change = float("inf") if new != 0 and not higher_is_better else 0.0
+            else:
+                change = (new - old) / old
+                if higher_is_better:
+                    change = -change
+            status = "REGRESSION" if change > threshold else "ok"
+            print(f"{bench:11s} {metric:22s} {old:12.3f} → {new:12.3f}  {change * 100:+7.1f}%  {status}")
+            if change > threshold:
+                regressions.append((bench, metric, old, new, change))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run benchmarks and write JSON results")
+    run_parser.add_argument("--only", nargs="+", choices=BENCHMARKS, default=list(BENCHMARKS))
+    run_parser.add_argument("--model", default=None, help="OBJ to benchmark (default: a synthetic model)")
+    run_parser.add_argument("--groups", type=int, default=60)
+    run_parser.add_argument("--vertices-per-group", type=int, default=2000)
+    run_parser.add_argument("--faces-per-group", type=int, default=4000)
+    run_parser.add_argument("--no-legacy", action="store_true", help="skip the slow legacy loader")
+    run_parser.add_argument("--output", default=None, help="write results JSON here")
+
+    compare_parser = commands.add_parser("compare", help="flag regressions between two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.10, help="allowed relative slowdown")
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        results = run_suite(args.only, args.model, args.groups, args.vertices_per_group,
+                            args.faces_per_group, legacy=not args.no_legacy)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as file:
+                json.dump(results, file, indent=2)
+            print(f"[bench] Results written to {args.output}")
+    else:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        with open(args.current, encoding="utf-8") as file:
+            current = json.load(file)
+        regressions = compare(baseline, current, args.threshold)
+        print(f"[bench] {len(regressions)} regression(s) above {args.threshold * 100:.0f}%")
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
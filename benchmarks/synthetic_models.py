@@ -0,0 +1,59 @@
+# benchmarks/synthetic_models.py
+import numpy as np
+
+
+def write_synthetic_obj(path: str, groups: int = 200, vertices_per_group: int = 2000,
+                        faces_per_group: int = 4000, seed: int = 0):
+    """
+    Writes a ZBrush-style OBJ: every group emits its own 'v' block, then a 'g'
+    record and triangle 'f' records that only reference that block.
+    Returns: (total_vertices, total_faces)
+    """
+    rng = np.random.default_rng(seed)
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("# synthetic anatomy model\n")
+        base = 0
+        for g in range(groups):
+            verts = rng.random((vertices_per_group, 3), dtype=np.float32) + g
+            np.savetxt(file, verts, fmt="v %.6f %.6f %.6f")
+            file.write(f"g Bone_{g:04d}.001_male_human_skeleton\n")
+            faces = rng.integers(base + 1, base + vertices_per_group + 1, size=(faces_per_group, 3))
+            np.savetxt(file, faces, fmt="f %d %d %d")
+            base += vertices_per_group
+    return groups * vertices_per_group, groups * faces_per_group
+
+
+def write_repeated_obj(path: str, groups: int = 20, copies: int = 3, vertices_per_group: int = 500,
+                       faces_per_group: int = 1000, seed: int = 0):
+    """
+    Writes an OBJ whose groups come in sets of 1 + copies: a random bone, then
+    copies of it alternately mirrored (x → -x, winding reversed, as exporters
+    write left/right pairs) and rigidly rotated/translated (like vertebrae),
+    each with its vertices shuffled.
+    Returns: number of groups written
+    """
+    rng = np.random.default_rng(seed)
+    mirror = np.diag([-1.0, 1.0, 1.0])
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("# synthetic model with repeated bones\n")
+        base = 0
+        for g in range(groups):
+            verts = rng.random((vertices_per_group, 3)) * (1 + rng.random(3) * 3)
+            faces = rng.integers(0, vertices_per_group, size=(faces_per_group, 3))
+            for c in range(copies + 1):
+                if c == 0:
+                    transform, copy_faces = np.eye(3), faces
+                elif c % 2:
+                    transform, copy_faces = mirror, faces[:, ::-1]
+                else:
+                    q, _ = np.linalg.qr(rng.normal(size=(3, 3)))
+                    transform, copy_faces = q * np.sign(np.linalg.det(q)), faces
+                order = rng.permutation(vertices_per_group) if c else np.arange(vertices_per_group)
+                new_ids = np.empty_like(order)
+                new_ids[order] = np.arange(vertices_per_group)
+                copy_verts = verts[order] @ transform.T + (g * 10, c * 10, 0)
+                np.savetxt(file, copy_verts, fmt="v %.6f %.6f %.6f")
+                file.write(f"g Bone_{g:04d}_{c}\n")
+                np.savetxt(file, new_ids[copy_faces] + base + 1, fmt="f %d %d %d")
+                base += vertices_per_group
+    return groups * (copies + 1)
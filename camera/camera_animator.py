@@ -1,50 +1,157 @@
+# camera/camera_animator.py
+import math
+import time
+
+from utils.profiler import profiler
+
+# Default zoom duration in seconds (the old fixed 60 steps x 16 ms)
+DEFAULT_DURATION = 0.96
+TIMER_INTERVAL_MS = 16
+
+
+def _ease_in_out_cubic(t):
+    return 4 * t * t * t if t < 0.5 else 1 - (-2 * t + 2) ** 3 / 2
+
+
+EASINGS = {
+    "linear": lambda t: t,
+    "ease_out_cubic": lambda t: 1 - (1 - t) ** 3,
+    "ease_in_out_cubic": _ease_in_out_cubic,
+}
+
+
+def capture_camera_state(camera):
+    return {
+        "position": camera.GetPosition(),
+        "focal_point": camera.GetFocalPoint(),
+        "view_up": camera.GetViewUp(),
+        "view_angle": camera.GetViewAngle(),
+    }
+
+
+def apply_camera_state(camera, state):
+    camera.SetPosition(state["position"])
+    camera.SetFocalPoint(state["focal_point"])
+    camera.SetViewUp(state["view_up"])
+    camera.SetViewAngle(state["view_angle"])
+    camera.OrthogonalizeViewUp()
+
+
+def interpolate_camera_state(start, end, t):
+    """Blend two camera states; view-up is lerped and renormalised."""
+    def lerp(a, b):
+        return tuple(a[i] + t * (b[i] - a[i]) for i in range(3))
+
+    view_up = lerp(start["view_up"], end["view_up"])
+    length = math.sqrt(sum(c * c for c in view_up))
+    return {
+        "position": lerp(start["position"], end["position"]),
+        "focal_point": lerp(start["focal_point"], end["focal_point"]),
+        "view_up": tuple(c / length for c in view_up) if length > 1e-9 else tuple(end["view_up"]),
+        "view_angle": start["view_angle"] + t * (end["view_angle"] - start["view_angle"]),
+    }
+
+
 class CameraAnimator:
     """
-    Handles smooth camera animation over time, using a VTK timer.
-    Works together with CameraController.
+    Wall-clock camera animation engine.
+
+    Position, focal point, view-up and view angle are interpolated against elapsed
+    time, so a slow frame skips ahead instead of stretching the animation.
+    animate_to() while running retargets from the current interpolated state.
+    The animator owns one repeating timer (created on demand, destroyed when idle)
+    and one TimerEvent observer (removed by shutdown()).
+
+    Headless use: pass clock=<fake clock> and call tick() directly.
     """
 
-    def __init__(self, renderer, interactor, camera_controller, animation_steps=60):
+    def __init__(self, renderer, interactor, clock=time.perf_counter, render=None):
         self.renderer = renderer
         self.interactor = interactor
-        self.camera_controller = camera_controller
         self.camera = renderer.GetActiveCamera()
+        self.clock = clock
+        self.render = render or renderer.GetRenderWindow().Render
 
-        # Animation config
-        self.animation_steps = animation_steps
-        self.current_step = 0
+        self.start_state = None
+        self.end_state = None
+        self.start_time = 0.0
+        self.duration = DEFAULT_DURATION
+        self.easing = EASINGS["ease_in_out_cubic"]
+        self.on_finish = None
+        self.active = False
         self.timer_id = None
 
-    def start_animation(self):
-        """Start animation timer if not already running."""
+        self._observer_tag = None
+        self.attach()
+
+    def attach(self):
+        """(Re)installs the TimerEvent observer, e.g. when a scene is re-entered."""
+        if self._observer_tag is None:
+            self._observer_tag = self.interactor.AddObserver("TimerEvent", self._on_timer)
+
+    def animate_to(self, end_state, duration=DEFAULT_DURATION, easing="ease_in_out_cubic", on_finish=None):
+        """Start (or retarget) an animation from wherever the camera is right now."""
+        if self.active:
+            self._apply(self.clock())  # catch up, so the new leg starts from the true current state
+        self.start_state = capture_camera_state(self.camera)
+        self.end_state = end_state
+        self.start_time = self.clock()
+        self.duration = max(duration, 1e-6)
+        self.easing = EASINGS[easing]
+        self.on_finish = on_finish
+        self.active = True
+
+        # Interactive update rate while animating → LOD manager may use coarse tiers
+        self.renderer.GetRenderWindow().SetDesiredUpdateRate(self.interactor.GetDesiredUpdateRate())
         if self.timer_id is None:
-            self.current_step = 0
-            self.timer_id = self.interactor.CreateRepeatingTimer(16)
-
-    def update_animation(self, obj, event):
-        """Called each frame → smoothly updates camera position."""
-        if self.current_step >= self.animation_steps:
-            # Stop timer
-            if self.timer_id is not None:
-                self.interactor.DestroyTimer(self.timer_id)
-                self.timer_id = None
+            self.timer_id = self.interactor.CreateRepeatingTimer(TIMER_INTERVAL_MS)
+
+    def _apply(self, now):
+        """Puts the camera at its state for time `now`. Returns True once the end is reached."""
+        t = min(1.0, (now - self.start_time) / self.duration)
+        apply_camera_state(self.camera, interpolate_camera_state(self.start_state, self.end_state, self.easing(t)))
+        self.renderer.ResetCameraClippingRange()
+        return t >= 1.0
+
+    def tick(self):
+        """Advance to the current clock time and render one frame."""
+        if not self.active:
             return
+        with profiler.span("animation"):
+            finished = self._apply(self.clock())
+            if finished:
+                self._finish()
+            self.render()
 
-        t = (self.current_step + 1) / self.animation_steps
+    def _on_timer(self, obj, event):
+        if self.timer_id is not None and self.interactor.GetTimerEventId() == self.timer_id:
+            self.tick()
 
-        # Manual linear interpolation (like old code)
-        new_pos = [
-            self.camera_controller.start_pos[i] + t * (self.camera_controller.end_pos[i] - self.camera_controller.start_pos[i])
-            for i in range(3)
-        ]
-        new_focal = [
-            self.camera_controller.start_focal[i] + t * (self.camera_controller.end_focal[i] - self.camera_controller.start_focal[i])
-            for i in range(3)
-        ]
+    def _finish(self):
+        self.active = False
+        self._destroy_timer()
+        # Back to still rendering → the final frame is drawn at full detail
+        self.renderer.GetRenderWindow().SetDesiredUpdateRate(self.interactor.GetStillUpdateRate())
+        callback, self.on_finish = self.on_finish, None
+        if callback:
+            callback()
 
-        self.camera.SetPosition(new_pos)
-        self.camera.SetFocalPoint(new_focal)
-        self.renderer.ResetCameraClippingRange()
-        self.renderer.GetRenderWindow().Render()
+    def stop(self):
+        """Freeze the camera at its current in-between state."""
+        if self.active:
+            self._apply(self.clock())
+            self.active = False
+            self.on_finish = None
+            self._destroy_timer()
+            self.renderer.GetRenderWindow().SetDesiredUpdateRate(self.interactor.GetStillUpdateRate())
+
+    def _destroy_timer(self):
+        if self.timer_id is not None:
+            self.interactor.DestroyTimer(self.timer_id)
+            self.timer_id = None
 
-        self.current_step += 1
+    def shutdown(self):
+        self.stop()
+        if self._observer_tag is not None:
+            self.interactor.RemoveObserver(self._observer_tag)
+            self._observer_tag = None
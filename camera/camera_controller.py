@@ -1,61 +1,113 @@
 # camera/camera_controller.py
 import math
 import vtk
-from utils.helpers import get_actor_center
+from camera.camera_animator import DEFAULT_DURATION, CameraAnimator, apply_camera_state, capture_camera_state
+from ui.frame_scheduler import frame_scheduler_for
+from utils.helpers import get_actor_center, quiet_style
+
+# Zoomed-in camera distance, as a fraction of the reference view's distance
+ZOOM_DISTANCE_FACTOR = 0.3
+
+
+def zoom_target_state(focal_point, reference, distance=None):
+    """
+    Camera state looking at focal_point from the reference view's direction.
+    distance: camera-to-focal distance; default ZOOM_DISTANCE_FACTOR of the reference distance
+    """
+    position = reference["position"]
+    focal = reference["focal_point"]
+    direction = [position[i] - focal[i] for i in range(3)]
+    mag = sum(d * d for d in direction) ** 0.5
+    scale = ZOOM_DISTANCE_FACTOR * mag if distance is None else distance
+    return {
+        "position": tuple(focal_point[i] + direction[i] / mag * scale for i in range(3)),
+        "focal_point": tuple(focal_point),
+        "view_up": reference["view_up"],
+        "view_angle": reference["view_angle"],
+    }
 
 
 class CameraController:
-    def __init__(self, camera, renderer, interactor, text_overlay_manager=None):
+    def __init__(self, camera, renderer, interactor, text_overlay_manager=None, on_quit=None):
+        """on_quit: called on 'Q' instead of closing the window (e.g. back to the menu scene)"""
         self.camera = camera
         self.renderer = renderer
         self.interactor = interactor
         self.text_overlay = text_overlay_manager  # For updating rotation hints
+        self.on_quit = on_quit
+        self.scheduler = frame_scheduler_for(renderer.GetRenderWindow())
 
         # --- Rotation state ---
         self.rotation_enabled = False
-        self.interactor.SetInteractorStyle(vtk.vtkInteractorStyleUser())
 
         # --- Zoom animation state ---
         self.bone_zoom_state = False
         self.target_actor = None
-        self.animation_steps = 60
-        self.current_step = 0
-        self.start_pos = [0, 0, 0]
-        self.start_focal = [0, 0, 0]
-        self.end_pos = [0, 0, 0]
-        self.end_focal = [0, 0, 0]
-        self.timer_id = None
         self.pre_zoom_camera_state = None
+        self.zoom_duration = DEFAULT_DURATION
+        self.bone_index = None
+        self.bone_rows = {}  # actor (or MergedBone) → bone_index row
+        self.animator = CameraAnimator(renderer, interactor, render=self.scheduler.request)
 
         # --- Save initial camera state ---
-        self.initial_state = {
-            "position": camera.GetPosition(),
-            "focal_point": camera.GetFocalPoint(),
-            "view_up": camera.GetViewUp(),
-            "view_angle": camera.GetViewAngle()
-        }
+        self.initial_state = None
+        self.save_initial_state()
 
         # Bind key events
-        self.interactor.AddObserver("KeyPressEvent", self.on_key_press)
+        self._key_tag = None
+        self.attach()
+
+    def attach(self):
+        """Installs the interactor style and key/animation observers on the interactor."""
+        self._apply_style()
+        self.animator.attach()
+        if self._key_tag is None:
+            self._key_tag = self.interactor.AddObserver("KeyPressEvent", self.on_key_press)
+
+    def detach(self):
+        """Removes this controller's observers (the interactor is shared with other scenes)."""
+        self.animator.shutdown()
+        if self._key_tag is not None:
+            self.interactor.RemoveObserver(self._key_tag)
+            self._key_tag = None
+
+    def _apply_style(self):
+        if self.rotation_enabled:
+            style = vtk.vtkInteractorStyleTrackballCamera()
+        else:
+            style = vtk.vtkInteractorStyleUser()
+        self.interactor.SetInteractorStyle(quiet_style(style))
+
+    def set_bone_index(self, bone_index, actors):
+        """Zoom targets come from the index; actors[i] is the bone in row i."""
+        self.bone_index = bone_index
+        self.bone_rows = {actor: row for row, actor in enumerate(actors)}
+
+    def bone_center(self, actor):
+        """Precomputed bounds centre of the bone, or its live bounds if it is not indexed."""
+        row = self.bone_rows.get(actor)
+        if row is None:
+            return get_actor_center(actor)
+        return self.bone_index.center(row)
+
+    def save_initial_state(self):
+        """Remember the current camera as the 'F' reset target (e.g. after the model finished loading)."""
+        self.initial_state = capture_camera_state(self.camera)
 
     # --- Rotation toggle ---
     def toggle_rotation(self):
         self.rotation_enabled = not self.rotation_enabled
-        if self.rotation_enabled:
-            self.interactor.SetInteractorStyle(vtk.vtkInteractorStyleTrackballCamera())
-        else:
-            self.interactor.SetInteractorStyle(vtk.vtkInteractorStyleUser())
+        self._apply_style()
+        if not self.rotation_enabled:
             self.text_overlay.update_rotation_hint(self.rotation_enabled)
 
     # --- Reset camera ---
     def reset_camera(self):
         if not self.bone_zoom_state:
-            self.camera.SetPosition(self.initial_state["position"])
-            self.camera.SetFocalPoint(self.initial_state["focal_point"])
-            self.camera.SetViewUp(self.initial_state["view_up"])
-            self.camera.SetViewAngle(self.initial_state["view_angle"])
+            self.animator.stop()
+            apply_camera_state(self.camera, self.initial_state)
             self.renderer.ResetCameraClippingRange()
-            self.renderer.GetRenderWindow().Render()
+            self.scheduler.request()
         else:
             print("Cannot reset while zoomed in. Click empty space first.")
 
@@ -86,64 +138,37 @@ class CameraController:
         self.camera.SetPosition(new_pos)
         self.camera.SetFocalPoint(focal)
         self.renderer.ResetCameraClippingRange()
-        self.renderer.GetRenderWindow().Render()
+        self.scheduler.request()
 
     # --- Zoom animation ---
-    def start_zoom_animation(self, actor=None):
-        cam = self.camera
-        if not self.bone_zoom_state and actor:
-            self.pre_zoom_camera_state = {
-                "position": cam.GetPosition(),
-                "focal_point": cam.GetFocalPoint(),
-                "view_up": cam.GetViewUp(),
-                "view_angle": cam.GetViewAngle(),
-            }
-
-            self.start_pos = list(cam.GetPosition())
-            self.start_focal = list(cam.GetFocalPoint())
-            self.end_focal = get_actor_center(actor)
-            direction = [self.start_pos[i] - self.start_focal[i] for i in range(3)]
-            mag = sum(d * d for d in direction) ** 0.5
-            scale = 0.3 * mag
-            self.end_pos = [self.end_focal[i] + direction[i] / mag * scale for i in range(3)]
+    def _zoom_target(self, actor, reference):
+        """Camera state looking at the actor from 30% of the reference viewing distance."""
+        return zoom_target_state(self.bone_center(actor), reference)
 
+    def start_zoom_animation(self, actor=None):
+        """
+        Zooms into `actor`, or back out when actor is None.
+        Calling this mid-animation retargets from the camera's current in-between state.
+        """
+        if actor:
+            if not self.bone_zoom_state and not self.animator.active:
+                self.pre_zoom_camera_state = capture_camera_state(self.camera)
+            # Bone-to-bone zooms keep the framing of the overview the user zoomed in from
+            end_state = self._zoom_target(actor, self.pre_zoom_camera_state or self.initial_state)
             self.bone_zoom_state = True
             self.target_actor = actor
-
         elif self.bone_zoom_state:
-            self.start_pos = list(cam.GetPosition())
-            self.start_focal = list(cam.GetFocalPoint())
-            if self.pre_zoom_camera_state:
-                self.end_pos = list(self.pre_zoom_camera_state["position"])
-                self.end_focal = list(self.pre_zoom_camera_state["focal_point"])
-                cam.SetViewUp(self.pre_zoom_camera_state["view_up"])
-                cam.SetViewAngle(self.pre_zoom_camera_state["view_angle"])
-            else:
-                self.end_pos = list(self.initial_state["position"])
-                self.end_focal = list(self.initial_state["focal_point"])
+            end_state = self.pre_zoom_camera_state or self.initial_state
             self.bone_zoom_state = False
             self.target_actor = None
-
-        self.current_step = 0
-        if self.timer_id is None:
-            self.timer_id = self.interactor.CreateRepeatingTimer(16)
-            self.interactor.AddObserver("TimerEvent", self.animate_camera)
-
-    def animate_camera(self, obj, event):
-        if self.current_step >= self.animation_steps:
-            if self.timer_id is None:
-                self.timer_id = self.interactor.CreateRepeatingTimer(16)
-                self.interactor.AddObserver("TimerEvent", self.animate_camera)
+        else:
             return
 
-        t = (self.current_step + 1) / self.animation_steps
-        new_pos = [self.start_pos[i] + t * (self.end_pos[i] - self.start_pos[i]) for i in range(3)]
-        new_focal = [self.start_focal[i] + t * (self.end_focal[i] - self.start_focal[i]) for i in range(3)]
-        self.camera.SetPosition(new_pos)
-        self.camera.SetFocalPoint(new_focal)
-        self.renderer.ResetCameraClippingRange()
-        self.renderer.GetRenderWindow().Render()
-        self.current_step += 1
+        self.animator.animate_to(end_state, duration=self.zoom_duration)
+
+    def stop_animation(self):
+        """Stops any running zoom, leaving the camera where it is."""
+        self.animator.stop()
 
     # --- Keyboard handler ---
     def on_key_press(self, obj, event):
@@ -153,5 +178,8 @@ class CameraController:
         elif key == 'f':
             self.reset_camera()
         elif key == 'q':
+            if self.on_quit is not None:
+                self.on_quit()
+                return
             self.interactor.GetRenderWindow().Finalize()
             self.interactor.TerminateApp()
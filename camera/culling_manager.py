@@ -0,0 +1,190 @@
+# camera/culling_manager.py
+import numpy as np
+import vtk
+
+from ui.frame_scheduler import frame_scheduler_for
+from utils.profiler import profiler
+
+# Occlusion pass runs once the camera has been still for this long (ms)
+OCCLUSION_DELAY_MS = 150
+
+
+class CullingManager:
+    """
+    Hides registered actors that cannot contribute to the frame, so neither the
+    renderer nor vtkCellPicker traversal (culled actors are also made unpickable)
+    spends time on them.
+
+    • Frustum culling: at the start of every render whose camera or window size
+      changed, each actor's precomputed bounds are tested against the four side
+      planes of the view frustum, vectorised over all actors. Near/far are left
+      out on purpose: the clipping range is derived from the visible actors, so
+      testing against it would keep culled actors culled for good.
+    • Occlusion culling (optional): VTK does not expose GL occlusion queries, so
+      once the camera has settled one vtkHardwareSelector pass records which
+      actors own at least one pixel; the rest are hidden until the camera moves.
+      Cheaper frames then pay off on the idle re-renders (hover highlights).
+
+    The manager owns the visibility/pickability of the actors registered with it.
+    """
+
+    def __init__(self, renderer, interactor=None, occlusion=False, occlusion_delay_ms=OCCLUSION_DELAY_MS):
+        self.renderer = renderer
+        self.render_window = renderer.GetRenderWindow()
+        self.interactor = interactor
+        self.scheduler = frame_scheduler_for(self.render_window)
+        self.occlusion = occlusion and interactor is not None
+        self.occlusion_delay_ms = occlusion_delay_ms
+
+        self.actors = []
+        self.bounds = np.empty((0, 6))
+        self.in_frustum = np.empty(0, dtype=bool)
+        self.occluded = np.empty(0, dtype=bool)
+        self._shown = np.empty(0, dtype=bool)
+        self._view_key = None
+        self._occlusion_key = None
+        self._occlusion_timer_id = None
+        self._in_occlusion_pass = False
+
+        # Totals for report(): frames, drawn, frustum-culled, occluded
+        self.frames = 0
+        self.totals = np.zeros(3, dtype=np.int64)
+
+        self.render_window.AddObserver("StartEvent", self._on_render_start)
+        self.render_window.AddObserver("EndEvent", self._on_render_end)
+        if interactor is not None:
+            interactor.AddObserver("TimerEvent", self._on_timer)
+
+    def add_actors(self, actors, bounds=None):
+        """
+        Registers actors with their world bounds ((n, 6) xmin, xmax, ymin, ymax, zmin, zmax),
+        e.g. BoneIndex.bounds; without bounds each actor's own GetBounds() is used.
+        """
+        actors = list(actors)
+        if not actors:
+            return
+        if bounds is None:
+            bounds = [actor.GetBounds() for actor in actors]
+        self.actors.extend(actors)
+        self.bounds = np.vstack([self.bounds, np.asarray(bounds, dtype=np.float64).reshape(-1, 6)])
+        self.in_frustum = np.append(self.in_frustum, np.ones(len(actors), dtype=bool))
+        self.occluded = np.append(self.occluded, np.zeros(len(actors), dtype=bool))
+        self._shown = np.append(self._shown, np.ones(len(actors), dtype=bool))
+        self._view_key = None
+
+    # --- Frustum ---
+    def _current_view_key(self):
+        return self.renderer.GetActiveCamera().GetMTime(), tuple(self.render_window.GetSize())
+
+    def frustum_mask(self):
+        """True for actors whose bounds intersect the frustum's left/right/bottom/top planes."""
+        planes = [0.0] * 24
+        self.renderer.GetActiveCamera().GetFrustumPlanes(self.renderer.GetTiledAspectRatio(), planes)
+        planes = np.asarray(planes).reshape(6, 4)[:4]  # inward normals (a, b, c) and d
+        normals, offsets = planes[:, :3], planes[:, 3]
+        lo, hi = self.bounds[:, 0::2], self.bounds[:, 1::2]
+        # "Positive vertex" of each box per plane: the corner farthest along the plane normal
+        farthest = np.where(normals[None, :, :] > 0, hi[:, None, :], lo[:, None, :])
+        distances = np.einsum("npk,pk->np", farthest, normals) + offsets
+        return (distances >= 0).all(axis=1)
+
+    def _apply(self):
+        """Syncs actor visibility/pickability with the masks; returns True if anything changed."""
+        shown = self.in_frustum & ~self.occluded
+        changed = np.flatnonzero(shown != self._shown)
+        for index in changed:
+            actor = self.actors[index]
+            actor.SetVisibility(bool(shown[index]))
+            actor.SetPickable(bool(shown[index]))
+        self._shown = shown
+        if len(changed):
+            self.scheduler.scene_changed()
+        if len(changed) and shown.any():
+            # Newly shown actors must not fall outside a clipping range fitted to the old set
+            lo, hi = self.bounds[shown, 0::2].min(axis=0), self.bounds[shown, 1::2].max(axis=0)
+            self.renderer.ResetCameraClippingRange(lo[0], hi[0], lo[1], hi[1], lo[2], hi[2])
+        return len(changed) > 0
+
+    def update(self):
+        """Re-runs frustum culling if the view changed (called at the start of each render)."""
+        if self._current_view_key() == self._view_key or not self.actors:
+            return
+        self.in_frustum = self.frustum_mask()
+        # Any camera move invalidates the occlusion result; it is recomputed once the camera settles
+        self.occluded[:] = False
+        self._apply()
+        # Taken after _apply: refitting the clipping range modifies the camera
+        self._view_key = self._current_view_key()
+        if self.occlusion:
+            self._schedule_occlusion()
+
+    # --- Occlusion ---
+    def _schedule_occlusion(self):
+        if self._occlusion_timer_id is not None:
+            self.interactor.DestroyTimer(self._occlusion_timer_id)
+        self._occlusion_timer_id = self.interactor.CreateOneShotTimer(self.occlusion_delay_ms) or None
+
+    def _on_timer(self, obj, event):
+        if self._occlusion_timer_id is None or obj.GetTimerEventId() != self._occlusion_timer_id:
+            return
+        self._occlusion_timer_id = None
+        if self.renderer.GetDraw() and self._current_view_key() == self._view_key:
+            if self.update_occlusion():
+                self.scheduler.request()
+
+    def update_occlusion(self):
+        """Hides in-frustum actors that own no pixel from the current camera. Returns True if any changed."""
+        if not self.actors or self._current_view_key() == self._occlusion_key:
+            return False
+        self.update()
+        self.occluded[:] = False
+        self._apply()
+
+        width, height = self.render_window.GetSize()
+        selector = vtk.vtkHardwareSelector()
+        selector.SetRenderer(self.renderer)
+        selector.SetFieldAssociation(vtk.vtkDataObject.FIELD_ASSOCIATION_CELLS)
+        selector.SetArea(0, 0, width - 1, height - 1)
+        self._in_occlusion_pass = True
+        try:
+            with self.scheduler.selection_pass():
+                selection = selector.Select()
+        finally:
+            self._in_occlusion_pass = False
+
+        seen = set()
+        for i in range(selection.GetNumberOfNodes()):
+            prop = selection.GetNode(i).GetProperties().Get(vtk.vtkSelectionNode.PROP())
+            if prop is not None:
+                seen.add(prop)
+        if seen:  # an empty selection means the pass failed, not that everything is hidden
+            self.occluded = self.in_frustum & np.array([actor not in seen for actor in self.actors])
+        changed = self._apply()
+        self._view_key = self._occlusion_key = self._current_view_key()
+        return changed
+
+    # --- Render hooks ---
+    def _on_render_start(self, obj, event):
+        if not self._in_occlusion_pass and self.renderer.GetDraw():
+            self.update()
+
+    def _on_render_end(self, obj, event):
+        if self._in_occlusion_pass or not self.renderer.GetDraw() or not self.actors:
+            return
+        drawn = int(self._shown.sum())
+        frustum_culled = int((~self.in_frustum).sum())
+        occluded = int(self.occluded.sum())
+        self.frames += 1
+        self.totals += (drawn, frustum_culled, occluded)
+        profiler.counter("culling", drawn=drawn, frustum_culled=frustum_culled, occluded=occluded)
+
+    def report(self):
+        """Mean per-frame counts: {"frames", "actors", "drawn", "frustum_culled", "occluded"}."""
+        means = self.totals / self.frames if self.frames else self.totals * 0.0
+        return {
+            "frames": self.frames,
+            "actors": len(self.actors),
+            "drawn": float(means[0]),
+            "frustum_culled": float(means[1]),
+            "occluded": float(means[2]),
+        }
@@ -0,0 +1,99 @@
+# camera/lod_manager.py
+import time
+
+import vtk
+
+from ui.frame_scheduler import frame_scheduler_for
+
+# Frame budget used to pick the interactive tier (60 fps)
+DEFAULT_TARGET_FRAME_TIME = 1.0 / 60
+
+
+class LodManager:
+    """
+    Switches every registered actor between its LOD tiers.
+
+    Each tier has its own mapper (its own GPU buffers), so switching is just
+    actor.SetMapper(). The decision is made at the start of every render:
+      • still render (idle)  → tier 0, full detail
+      • interactive render   → finest tier whose measured frame time fits target_frame_time
+    A render is interactive when the window's desired update rate is above the
+    interactor's still update rate, the same signal VTK's own LOD actors use
+    (set by trackball styles during interaction, and by CameraController while animating).
+    """
+
+    def __init__(self, render_window, interactor, target_frame_time=DEFAULT_TARGET_FRAME_TIME):
+        self.render_window = render_window
+        self.interactor = interactor
+        self.scheduler = frame_scheduler_for(render_window)
+        self.target_frame_time = target_frame_time
+        self.tier_mappers = []  # per actor: (actor, [mapper_tier0, mapper_tier1, ...])
+        self._shared_mappers = {}  # tier polydata address → mapper (instanced bones draw the same tiers)
+        self.num_tiers = 1
+        self.current_tier = 0
+
+        # Per-tier frame-time stats: tier → [frames, total_seconds] (report),
+        # and a moving average that forgets one-off spikes like the first buffer upload (decisions)
+        self.frame_stats = {}
+        self.recent_frame_time = {}
+        self._frame_start = None
+
+        render_window.AddObserver("StartEvent", self._on_render_start)
+        render_window.AddObserver("EndEvent", self._on_render_end)
+
+    def add_actor(self, actor, tier_polydata):
+        """actor: the bone actor (tier 0 mapper already set); tier_polydata: [tier1, tier2, ...] polydata."""
+        mappers = [actor.GetMapper()]
+        for polydata in tier_polydata:
+            key = polydata.GetAddressAsString("vtkPolyData")
+            mapper = self._shared_mappers.get(key)
+            if mapper is None:
+                mapper = vtk.vtkPolyDataMapper()
+                mapper.SetInputData(polydata)
+                self._shared_mappers[key] = mapper
+            mappers.append(mapper)
+        self.tier_mappers.append((actor, mappers))
+        self.num_tiers = max(self.num_tiers, len(mappers))
+
+    def set_tier(self, tier):
+        if tier == self.current_tier:
+            return
+        for actor, mappers in self.tier_mappers:
+            actor.SetMapper(mappers[min(tier, len(mappers) - 1)])
+        self.current_tier = tier
+        self.scheduler.scene_changed()
+
+    def is_interactive(self):
+        return self.render_window.GetDesiredUpdateRate() > self.interactor.GetStillUpdateRate()
+
+    def choose_tier(self):
+        if not self.is_interactive():
+            return 0
+        for tier in range(self.num_tiers):
+            recent = self.recent_frame_time.get(tier)
+            # Unmeasured tiers are tried once so every tier gets a timing
+            if recent is None or recent <= self.target_frame_time:
+                return tier
+        return self.num_tiers - 1
+
+    def _on_render_start(self, obj, event):
+        self.set_tier(self.choose_tier())
+        self._frame_start = time.perf_counter()
+
+    def _on_render_end(self, obj, event):
+        if self._frame_start is None:
+            return
+        elapsed = time.perf_counter() - self._frame_start
+        self._frame_start = None
+        stats = self.frame_stats.setdefault(self.current_tier, [0, 0.0])
+        stats[0] += 1
+        stats[1] += elapsed
+        recent = self.recent_frame_time.get(self.current_tier, elapsed)
+        self.recent_frame_time[self.current_tier] = 0.8 * recent + 0.2 * elapsed
+
+    def report(self):
+        """{tier: {"frames": n, "mean_ms": ...}} for every tier rendered so far."""
+        return {
+            tier: {"frames": frames, "mean_ms": total / frames * 1000}
+            for tier, (frames, total) in sorted(self.frame_stats.items()) if frames
+        }
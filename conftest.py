@@ -0,0 +1,6 @@
+# conftest.py
+# Lets the tests import the top-level packages (model, camera, benchmarks, ...) the way main.py does
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -1,5 +1,24 @@
+import argparse
+
 from ui.main_menu import MainMenu
+from utils.profiler import DEFAULT_TRACE_PATH, profiler
 
 if __name__ == "__main__":
-    app = MainMenu()
+    parser = argparse.ArgumentParser(description="Basics of Anatomy skeleton viewer")
+    parser.add_argument("--profile", nargs="?", const=DEFAULT_TRACE_PATH, default=None, metavar="TRACE_JSON",
+                        help="show frame/pick/load timings and write a Chrome trace on exit")
+    parser.add_argument("--lod", action="store_true",
+                        help="draw decimated bones while rotating/animating, full detail when idle")
+    parser.add_argument("--target-frame-ms", type=float, default=None, metavar="MS",
+                        help="frame time the --lod tiers aim for while interacting (default: 60 fps)")
+    args = parser.parse_args()
+    if args.target_frame_ms is not None and not args.lod:
+        parser.error("--target-frame-ms only applies with --lod")
+    if args.profile:
+        profiler.enable(args.profile)
+
+    viewer_options = {"lod": args.lod}
+    if args.target_frame_ms is not None:
+        viewer_options["target_frame_time"] = args.target_frame_ms / 1000
+    app = MainMenu(viewer_options=viewer_options)
     app.run()
@@ -1,16 +1,63 @@
+# model/actor_registry.py
 class ActorRegistry:
-    def __init__(self):
+    """
+    actor ⇄ bone name index. Works as the actor_name_map PickerHandler expects
+    (`actor in registry`, `registry[actor]`), plus O(1) name → actor lookups.
+    Several actors may share a name (e.g. left/right bones cleaned to one name).
+    """
+
+    def __init__(self, mapping: dict = None):
         self.actor_to_name = {}
+        self.name_to_actors = {}
+        if mapping:
+            self.load_mapping(mapping)
 
     def load_mapping(self, mapping: dict):
         """Bulk load actor:name mapping"""
-        self.actor_to_name = mapping
+        self.actor_to_name = {}
+        self.name_to_actors = {}
+        for actor, name in mapping.items():
+            self.add(actor, name)
+
+    def add(self, actor, name):
+        previous = self.actor_to_name.get(actor)
+        if previous is not None:
+            self.name_to_actors[previous].remove(actor)
+        self.actor_to_name[actor] = name
+        self.name_to_actors.setdefault(name, []).append(actor)
 
     def get_bone_name(self, actor):
         return self.actor_to_name.get(actor, None)
 
+    def get_actor(self, name):
+        """First actor with this bone name, or None."""
+        actors = self.name_to_actors.get(name)
+        return actors[0] if actors else None
+
+    def get_actors(self, name):
+        return list(self.name_to_actors.get(name, ()))
+
     def get_all_actors(self):
         return list(self.actor_to_name.keys())
 
     def get_all_names(self):
         return list(self.actor_to_name.values())
+
+    # --- Mapping protocol (drop-in for the plain {actor: name} dicts) ---
+    def __setitem__(self, actor, name):
+        self.add(actor, name)
+
+    def __getitem__(self, actor):
+        return self.actor_to_name[actor]
+
+    def __contains__(self, actor):
+        return actor in self.actor_to_name
+
+    def __iter__(self):
+        return iter(self.actor_to_name)
+
+    def __len__(self):
+        return len(self.actor_to_name)
+
+    def get(self, actor, default=None):
+        return self.actor_to_name.get(actor, default)
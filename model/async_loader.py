@@ -0,0 +1,100 @@
+# model/async_loader.py
+import queue
+import threading
+
+from model.lod import load_lod_tiers
+from utils.profiler import profiler
+
+# Small chunks keep each regex pass short, so the UI thread gets the GIL back often
+ASYNC_CHUNK_SIZE = 1 << 20
+
+
+class AsyncModelLoader:
+    """
+    Parses a model on a background thread and hands finished groups to the UI thread.
+    The worker only produces numpy buffers; VTK objects are built by whoever calls poll().
+    """
+
+    def __init__(self, loader, chunk_size: int = ASYNC_CHUNK_SIZE, lod_reductions=None):
+        """
+        loader: ObjLoader (its cache, if any, is used and refreshed)
+        lod_reductions: also build (or read cached) decimated LOD tiers, see model.lod
+        """
+        self.loader = loader
+        self.chunk_size = chunk_size
+        self.lod_reductions = lod_reductions
+        self.progress = 0.0
+        self.error = None
+        self.bone_index = None  # BoneIndex, set before the loader reports finished
+        self.instances = None  # InstanceTable, likewise (applied to the streamed actors once all have arrived)
+        self.lod_tiers = None  # [tier1_groups, tier2_groups, ...] when lod_reductions was given, likewise
+        self._queue = queue.Queue()
+        self._done = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="model-loader", daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self):
+        try:
+            cache = self.loader.cache
+            with profiler.span("load.cache"):
+                groups = cache.load(self.loader.path, self.loader.variant) if cache is not None else None
+            if groups is not None:
+                for group in groups:
+                    self._queue.put(group)
+            else:
+                groups = []
+                with profiler.span("load.parse"):
+                    for group in self.loader.iter_groups(self.chunk_size, on_progress=self._on_progress):
+                        groups.append(group)
+                        # A lone group may still be split by segmentation, so hold the first one
+                        # back until a second group shows the model is already grouped
+                        if len(groups) == 2:
+                            groups[0] = self._emit(groups[0])
+                        if len(groups) >= 2:
+                            groups[-1] = self._emit(group)
+                if len(groups) == 1:
+                    groups = self.loader.apply_preprocessing(self.loader.apply_segmentation(groups))
+                    for group in groups:
+                        self._queue.put(group)
+                if cache is not None:
+                    with profiler.span("load.store"):
+                        cache.store(self.loader.path, groups, self.loader.variant)
+            self.bone_index = self.loader.load_bone_index(groups)
+            self.instances = self.loader.load_instances(groups)
+            if self.lod_reductions is not None:
+                with profiler.span("load.lod"):
+                    self.lod_tiers = load_lod_tiers(self.loader, self.lod_reductions, base=groups)[1:]
+        except Exception as exc:  # surfaced to the UI thread through self.error
+            self.error = exc
+        finally:
+            self.progress = 1.0
+            self._done.set()
+
+    def _emit(self, group):
+        """Preprocesses one streamed group, queues it and returns it (as stored in the cache)."""
+        group = self.loader.apply_preprocessing([group])[0]
+        self._queue.put(group)
+        return group
+
+    def _on_progress(self, bytes_read, total_bytes):
+        self.progress = bytes_read / total_bytes if total_bytes else 1.0
+
+    def poll(self, max_groups: int):
+        """Returns up to max_groups finished MeshGroups (unpack as name, vertices, offsets, connectivity)."""
+        ready = []
+        while len(ready) < max_groups:
+            try:
+                ready.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return ready
+
+    @property
+    def finished(self) -> bool:
+        """True once the worker has stopped and every group has been polled."""
+        return self._done.is_set() and self._queue.empty()
@@ -0,0 +1,107 @@
+# model/bone_index.py
+import math
+
+import numpy as np
+
+from model.mesh_store import MeshStore, fan_triangles
+
+# View angle (degrees) the stored framing distances are computed for — vtkCamera's default
+FRAMING_VIEW_ANGLE = 30.0
+# Space left around a bone's bounding sphere when it is framed (1.0 = sphere touches the view edges)
+FRAMING_MARGIN = 1.1
+INDEX_ARRAYS = ("names", "bounds", "centroids", "radii", "areas", "framing_distances")
+
+
+class BoneIndex:
+    """
+    Per-bone geometry, one row per group in load order: bounds (xmin, xmax, ymin,
+    ymax, zmin, zmax), surface centroid, bounding sphere (bounds centre + radius),
+    surface area and the camera distance that frames the bone.
+    Built once per model, vectorised over all groups, and persisted in the MeshCache.
+    """
+
+    def __init__(self, names, bounds, centroids, radii, areas, framing_distances=None):
+        self.names = list(names)
+        self.bounds = np.asarray(bounds, dtype=np.float64).reshape(-1, 6)
+        self.centroids = np.asarray(centroids, dtype=np.float64).reshape(-1, 3)
+        self.radii = np.asarray(radii, dtype=np.float64)
+        self.areas = np.asarray(areas, dtype=np.float64)
+        if framing_distances is None:
+            framing_distances = self.radii * FRAMING_MARGIN / math.sin(math.radians(FRAMING_VIEW_ANGLE) / 2)
+        self.framing_distances = np.asarray(framing_distances, dtype=np.float64)
+
+    @classmethod
+    def from_groups(cls, groups):
+        """Computes the index from a MeshStore or a list of MeshGroups."""
+        store = groups if isinstance(groups, MeshStore) else MeshStore.from_groups(groups)
+        n = len(store)
+        vertices = np.asarray(store.vertices, dtype=np.float64)
+        vertex_counts = store.vertex_ranges[:, 1] - store.vertex_ranges[:, 0]
+
+        # --- Bounds and bounding spheres (per-group reductions over the shared vertex buffer) ---
+        bounds = np.zeros((n, 6))
+        radii = np.zeros(n)
+        filled = vertex_counts > 0
+        starts = store.vertex_ranges[filled, 0]
+        if len(starts):
+            bounds[filled, 0::2] = np.minimum.reduceat(vertices, starts, axis=0)
+            bounds[filled, 1::2] = np.maximum.reduceat(vertices, starts, axis=0)
+        centers = (bounds[:, 0::2] + bounds[:, 1::2]) / 2
+        vertex_groups = np.repeat(np.arange(n), vertex_counts)
+        if len(starts):
+            distances = np.linalg.norm(vertices - centers[vertex_groups], axis=1)
+            radii[filled] = np.maximum.reduceat(distances, starts)
+
+        # --- Surface area and area-weighted centroid (fan-triangulated cells, all groups at once) ---
+        cell_starts, sizes, cell_groups, point_ids = store.global_cells()
+        tri_cells, positions = fan_triangles(cell_starts, sizes)
+        a, b, c = (vertices[point_ids[positions[:, i]]] for i in range(3))
+        tri_areas = 0.5 * np.linalg.norm(np.cross(b - a, c - a), axis=1)
+        tri_groups = cell_groups[tri_cells]
+        areas = np.bincount(tri_groups, weights=tri_areas, minlength=n)
+
+        weighted = (a + b + c) / 3 * tri_areas[:, None]
+        centroids = np.stack([np.bincount(tri_groups, weights=weighted[:, i], minlength=n) for i in range(3)], axis=1)
+        has_area = areas > 0
+        centroids[has_area] /= areas[has_area, None]
+        centroids[~has_area] = centers[~has_area]  # degenerate bones: fall back to the bounds centre
+        return cls(store.names, bounds, centroids, radii, areas)
+
+    def __len__(self):
+        return len(self.names)
+
+    @property
+    def centers(self):
+        """Bounding box (and bounding sphere) centres, (n, 3)."""
+        return (self.bounds[:, 0::2] + self.bounds[:, 1::2]) / 2
+
+    def center(self, row) -> tuple:
+        lo, hi = self.bounds[row, 0::2], self.bounds[row, 1::2]
+        return tuple(float(v) for v in (lo + hi) / 2)
+
+    def framing_distance(self, row, view_angle: float = FRAMING_VIEW_ANGLE) -> float:
+        """Camera-to-centre distance that fits the bone's bounding sphere in `view_angle` degrees."""
+        return float(self.radii[row] * FRAMING_MARGIN / math.sin(math.radians(view_angle) / 2))
+
+    def rows_for(self, name):
+        return [row for row, bone in enumerate(self.names) if bone == name]
+
+    def nearest(self, point, k: int = 1):
+        """
+        Rows of the k bones closest to `point`: distance to each bone's bounding box
+        (0 inside it), ties broken by distance to the surface centroid.
+        """
+        point = np.asarray(point, dtype=np.float64)
+        outside = np.maximum(np.maximum(self.bounds[:, 0::2] - point, point - self.bounds[:, 1::2]), 0)
+        box_distance = np.linalg.norm(outside, axis=1)
+        centroid_distance = np.linalg.norm(self.centroids - point, axis=1)
+        return np.lexsort((centroid_distance, box_distance))[:k].tolist()
+
+    # --- Persistence (an .npz next to the MeshCache buffers) ---
+    def save(self, path: str):
+        np.savez(path, **{name: np.asarray(getattr(self, name)) for name in INDEX_ARRAYS})
+
+    @classmethod
+    def load(cls, path: str):
+        with np.load(path, allow_pickle=False) as data:
+            return cls(*(data[name] for name in INDEX_ARRAYS))
@@ -0,0 +1,251 @@
+# model/instancing.py
+import itertools
+
+import numpy as np
+import vtk
+from vtk.util import numpy_support
+
+from model.mesh_store import ID_DTYPE, MeshStore
+
+# Max vertex deviation for two groups to share geometry, as a fraction of the group's RMS radius
+DEFAULT_INSTANCE_TOLERANCE = 1e-4
+# Query rows per block in the brute-force nearest-neighbour match (bounds the distance matrix)
+MATCH_BLOCK_ROWS = 1024
+INSTANCE_ARRAYS = ("prototypes", "matrices", "tolerance")
+
+
+def _principal_frames(store: MeshStore):
+    """
+    Canonical frame per group, vectorised over the shared vertex buffer:
+    vertex centroid, principal axes (columns, ascending variance) and the
+    RMS extent along each axis. Returns (centroids, axes, extents).
+    """
+    n = len(store)
+    vertices = np.asarray(store.vertices, dtype=np.float64)
+    counts = store.vertex_ranges[:, 1] - store.vertex_ranges[:, 0]
+    vertex_groups = np.repeat(np.arange(n), counts)
+    safe_counts = np.maximum(counts, 1)[:, None]
+
+    centroids = np.stack([np.bincount(vertex_groups, weights=vertices[:, i], minlength=n) for i in range(3)], axis=1)
+    centroids /= safe_counts
+    centered = vertices - centroids[vertex_groups]
+    covariance = np.empty((n, 3, 3))
+    for i, j in itertools.combinations_with_replacement(range(3), 2):
+        covariance[:, i, j] = covariance[:, j, i] = np.bincount(
+            vertex_groups, weights=centered[:, i] * centered[:, j], minlength=n)
+    covariance /= safe_counts[:, :, None]
+    variances, axes = np.linalg.eigh(covariance)
+    return centroids, axes, np.sqrt(np.maximum(variances, 0))
+
+
+def _nearest(queries, points):
+    """Index of the nearest row of `points` for every query (blocked brute force)."""
+    indices = np.empty(len(queries), dtype=ID_DTYPE)
+    points_sq = (points ** 2).sum(axis=1)
+    for start in range(0, len(queries), MATCH_BLOCK_ROWS):
+        block = queries[start:start + MATCH_BLOCK_ROWS]
+        squared = (block ** 2).sum(axis=1)[:, None] - 2 * block @ points.T + points_sq
+        indices[start:start + len(block)] = squared.argmin(axis=1)
+    return indices
+
+
+def _reverse_faces(offsets, connectivity):
+    """Connectivity with every face's corners reversed: corner k of a face of size s → corner s - 1 - k."""
+    sizes = np.diff(offsets)
+    within = np.arange(len(connectivity)) - np.repeat(offsets[:-1], sizes)
+    return connectivity[np.repeat(offsets[1:] - 1, sizes) - within]
+
+
+def _oriented_faces(offsets, connectivity):
+    """Faces as rows keyed independently of their start corner, per face size: {size: sorted (m, size) rows}."""
+    offsets = np.asarray(offsets, dtype=ID_DTYPE)
+    connectivity = np.asarray(connectivity, dtype=ID_DTYPE)
+    sizes = np.diff(offsets)
+    faces = {}
+    for size in np.unique(sizes):
+        rows = connectivity[offsets[:-1][sizes == size][:, None] + np.arange(size)]
+        # Rotate each face so its smallest id comes first (keeps the winding)
+        shift = rows.argmin(axis=1)[:, None]
+        rows = np.take_along_axis(rows, (shift + np.arange(size)) % size, axis=1)
+        faces[int(size)] = rows[np.lexsort(rows.T[::-1])]
+    return faces
+
+
+def _same_topology(prototype, group, correspondence, mirrored):
+    """
+    True if `group`'s faces, renamed to prototype vertex ids, are the prototype's
+    faces with the winding the transform produces (mirrors reverse it), so
+    instanced back-face culling shows the same side as the group's own mesh.
+    """
+    to_prototype = np.empty_like(correspondence)
+    to_prototype[correspondence] = np.arange(len(correspondence))
+    expected = _oriented_faces(prototype.offsets, prototype.connectivity)
+    offsets = np.asarray(group.offsets, dtype=ID_DTYPE)
+    connectivity = to_prototype[np.asarray(group.connectivity, dtype=ID_DTYPE)]
+    if mirrored:
+        connectivity = _reverse_faces(offsets, connectivity)
+    actual = _oriented_faces(offsets, connectivity)
+    return expected.keys() == actual.keys() and all(np.array_equal(expected[k], actual[k]) for k in expected)
+
+
+def match_transform(prototype, group, frames, rows, tolerance: float = DEFAULT_INSTANCE_TOLERANCE):
+    """
+    Finds the rigid or mirrored transform that maps `prototype` onto `group`:
+    the two canonical frames are aligned under each of the 8 axis sign choices,
+    vertices are paired by nearest neighbour, and the pairing is accepted if it
+    is one-to-one, the refitted (orthogonal Procrustes) transform keeps every
+    vertex within tolerance × RMS radius and the faces agree.
+    rows: (prototype row, group row) into frames = _principal_frames(store)
+    Returns: 4x4 matrix (prototype → group coordinates), or None.
+    """
+    centroids, axes, extents = frames
+    p_row, g_row = rows
+    scale = float(np.linalg.norm(extents[p_row]))
+    if scale == 0:
+        return None
+    limit = tolerance * scale
+    source = np.asarray(prototype.vertices, dtype=np.float64) - centroids[p_row]
+    target = np.asarray(group.vertices, dtype=np.float64) - centroids[g_row]
+    source_local = source @ axes[p_row]
+    target_local = target @ axes[g_row]
+
+    for signs in itertools.product((1.0, -1.0), repeat=3):
+        correspondence = _nearest(source_local * signs, target_local)
+        if len(np.unique(correspondence)) != len(correspondence):
+            continue
+        # Refit on the pairing: orthogonal (rotation or reflection) least squares
+        u, _, vt = np.linalg.svd(source.T @ target[correspondence])
+        rotation = (u @ vt).T
+        residual = np.linalg.norm(source @ rotation.T - target[correspondence], axis=1).max()
+        mirrored = np.linalg.det(rotation) < 0
+        if residual <= limit and _same_topology(prototype, group, correspondence, mirrored):
+            matrix = np.eye(4)
+            matrix[:3, :3] = rotation
+            matrix[:3, 3] = centroids[g_row] - rotation @ centroids[p_row]
+            return matrix
+    return None
+
+
+def reverse_winding(polydata):
+    """
+    Copy of a polygonal mesh with every face's corners in reverse order. Points
+    and point data are the same VTK arrays, so the GPU vertex buffers are shared
+    (the VBO cache is keyed on the array); only the index buffer is new.
+    """
+    polys = polydata.GetPolys()
+    offsets = numpy_support.vtk_to_numpy(polys.GetOffsetsArray()).astype(ID_DTYPE)
+    connectivity = numpy_support.vtk_to_numpy(polys.GetConnectivityArray()).astype(ID_DTYPE)
+    reversed_ids = _reverse_faces(offsets, connectivity)
+
+    cells = vtk.vtkCellArray()
+    cells.SetData(numpy_support.numpy_to_vtk(offsets, deep=True, array_type=vtk.VTK_TYPE_INT64),
+                  numpy_support.numpy_to_vtk(reversed_ids, deep=True, array_type=vtk.VTK_TYPE_INT64))
+    mirrored = vtk.vtkPolyData()
+    mirrored.SetPoints(polydata.GetPoints())
+    mirrored.GetPointData().ShallowCopy(polydata.GetPointData())
+    mirrored.SetPolys(cells)
+    return mirrored
+
+
+class InstanceTable:
+    """
+    Which bones are rigid or mirrored copies of another bone (left/right pairs,
+    vertebrae, phalanges, ribs), one row per group in load order:
+    prototypes[row] is the row whose geometry is drawn (row itself if unique),
+    matrices[row] the 4x4 transform from the prototype's coordinates to the bone's.
+    Persisted in the MeshCache next to the bone index.
+    """
+
+    def __init__(self, prototypes, matrices, tolerance=DEFAULT_INSTANCE_TOLERANCE):
+        self.prototypes = np.asarray(prototypes, dtype=ID_DTYPE)
+        self.matrices = np.asarray(matrices, dtype=np.float64).reshape(-1, 4, 4)
+        self.tolerance = float(tolerance)
+
+    @classmethod
+    def from_groups(cls, groups, tolerance: float = DEFAULT_INSTANCE_TOLERANCE):
+        """
+        Compares canonicalised geometry signatures (point/cell counts and the RMS
+        extents along the principal axes); only signature matches go on to the
+        full vertex-by-vertex check in match_transform.
+        """
+        store = groups if isinstance(groups, MeshStore) else MeshStore.from_groups(groups)
+        n = len(store)
+        prototypes = np.arange(n, dtype=ID_DTYPE)
+        matrices = np.tile(np.eye(4), (n, 1, 1))
+        if n < 2:
+            return cls(prototypes, matrices, tolerance)
+
+        frames = _principal_frames(store)
+        extents = frames[2]
+        buckets = {}  # (points, cells, corners) → prototype rows seen so far
+        for row in range(n):
+            group = store[row]
+            if group.n_cells == 0:
+                continue
+            key = (group.n_points, group.n_cells, len(group.connectivity))
+            candidates = buckets.setdefault(key, [])
+            limit = tolerance * np.linalg.norm(extents[row])
+            for candidate in candidates:
+                if np.abs(extents[candidate] - extents[row]).max() > limit:
+                    continue
+                matrix = match_transform(store[candidate], group, frames, (candidate, row), tolerance)
+                if matrix is not None:
+                    prototypes[row] = candidate
+                    matrices[row] = matrix
+                    break
+            else:
+                candidates.append(row)
+        return cls(prototypes, matrices, tolerance)
+
+    def __len__(self):
+        return len(self.prototypes)
+
+    def is_instance(self, row) -> bool:
+        return bool(self.prototypes[row] != row)
+
+    def is_mirrored(self, row) -> bool:
+        return bool(np.linalg.det(self.matrices[row, :3, :3]) < 0)
+
+    @property
+    def instance_rows(self):
+        return np.flatnonzero(self.prototypes != np.arange(len(self.prototypes)))
+
+    @property
+    def prototype_rows(self):
+        return np.flatnonzero(self.prototypes == np.arange(len(self.prototypes)))
+
+    def user_matrix(self, row):
+        """vtkMatrix4x4 for vtkActor.SetUserMatrix."""
+        matrix = vtk.vtkMatrix4x4()
+        for i in range(4):
+            for j in range(4):
+                matrix.SetElement(i, j, self.matrices[row, i, j])
+        return matrix
+
+    def shared_polydata(self, polydata):
+        """
+        The polydata each row should draw, row-aligned with `polydata`: its own
+        for unique bones, the prototype's for rigid copies, and one reversed-winding
+        twin of the prototype for all of its mirrored copies (VTK does not flip
+        front faces for a negative-determinant UserMatrix).
+        """
+        shared = list(polydata)
+        mirrored = {}
+        for row in self.instance_rows:
+            prototype = int(self.prototypes[row])
+            if self.is_mirrored(row):
+                if prototype not in mirrored:
+                    mirrored[prototype] = reverse_winding(polydata[prototype])
+                shared[row] = mirrored[prototype]
+            else:
+                shared[row] = polydata[prototype]
+        return shared
+
+    # --- Persistence (an .npz next to the MeshCache buffers) ---
+    def save(self, path: str):
+        np.savez(path, prototypes=self.prototypes, matrices=self.matrices, tolerance=np.float64(self.tolerance))
+
+    @classmethod
+    def load(cls, path: str):
+        with np.load(path, allow_pickle=False) as data:
+            return cls(*(data[name] for name in INSTANCE_ARRAYS))
@@ -0,0 +1,78 @@
+# model/lod.py
+import numpy as np
+import vtk
+from vtk.util import numpy_support
+
+from model.mesh_store import ID_DTYPE, MeshGroup, build_polydata, fan_triangles
+from model.preprocess import compute_normals
+
+# Fraction of triangles removed for LOD tiers 1, 2, ... (tier 0 is the full mesh)
+LOD_REDUCTIONS = (0.75, 0.93)
+
+
+def polydata_to_arrays(polydata):
+    """Copies a triangle vtkPolyData back into (vertices, offsets, connectivity) numpy buffers."""
+    vertices = numpy_support.vtk_to_numpy(polydata.GetPoints().GetData()).astype(np.float32)
+    polys = polydata.GetPolys()
+    offsets = numpy_support.vtk_to_numpy(polys.GetOffsetsArray()).astype(ID_DTYPE)
+    connectivity = numpy_support.vtk_to_numpy(polys.GetConnectivityArray()).astype(ID_DTYPE)
+    return vertices, offsets, connectivity
+
+
+def proper_triangles(offsets, connectivity):
+    """
+    Fan-triangulates the cells (quadric decimation only accepts triangles) and drops
+    degenerate ones with a repeated corner, which crash vtkQuadricDecimation.
+    Returns (offsets, connectivity) of the remaining triangles.
+    """
+    offsets = np.asarray(offsets, dtype=ID_DTYPE)
+    _, corners = fan_triangles(offsets[:-1], np.diff(offsets))
+    triangles = np.asarray(connectivity, dtype=ID_DTYPE)[corners]
+    triangles = triangles[(triangles[:, 0] != triangles[:, 1]) & (triangles[:, 1] != triangles[:, 2])
+                          & (triangles[:, 0] != triangles[:, 2])]
+    return np.arange(0, triangles.size + 1, 3, dtype=ID_DTYPE), triangles.ravel()
+
+
+def decimate_group(vertices, offsets, connectivity, reduction):
+    """Quadric decimation of one group. Returns (vertices, offsets, connectivity)."""
+    triangle_offsets, triangles = proper_triangles(offsets, connectivity)
+    if not len(triangles):
+        return vertices, offsets, connectivity
+
+    decimate = vtk.vtkQuadricDecimation()
+    decimate.SetInputData(build_polydata(vertices, triangle_offsets, triangles))
+    decimate.SetTargetReduction(reduction)
+    decimate.VolumePreservationOn()
+    decimate.Update()
+
+    output = decimate.GetOutput()
+    if output.GetNumberOfCells() == 0:
+        # Tiny bones can collapse completely; keep them at full detail instead
+        return vertices, offsets, connectivity
+    return polydata_to_arrays(output)
+
+
+def load_lod_tiers(loader, reductions=LOD_REDUCTIONS, base=None):
+    """
+    Returns [tier0_groups, tier1_groups, ...] where tier 0 is the loaded model and
+    each later tier is decimated by the matching reduction. Decimated tiers are
+    read from / written to the loader's MeshCache as variants, so they are built once.
+    base: the model's groups if already loaded (default: loader.load_groups())
+    """
+    if base is None:
+        base = loader.load_groups()
+    cache = loader.cache
+    tiers = [base]
+    for level, reduction in enumerate(reductions, 1):
+        variant = f"lod{level}-{reduction:g}"
+        if loader.variant:
+            variant = f"{loader.variant}-{variant}"
+        groups = cache.load(loader.path, variant) if cache is not None else None
+        if groups is None:
+            groups = [MeshGroup(name, *decimate_group(v, o, c, reduction)) for name, v, o, c in base]
+            if loader.normals:
+                groups = compute_normals(groups)
+            if cache is not None:
+                cache.store(loader.path, groups, variant)
+        tiers.append(groups)
+    return tiers
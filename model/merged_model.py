@@ -0,0 +1,107 @@
+# model/merged_model.py
+import numpy as np
+import vtk
+from vtk.util import numpy_support
+
+from model.bone_index import BoneIndex
+from model.obj_loader import ID_DTYPE, build_polydata
+
+DEFAULT_COLOR = (1, 1, 1)
+
+
+class MergedBone:
+    """
+    Stand-in for a per-bone actor when the whole model is one vtkActor.
+    Used as the key in actor_name_map, so picking/zooming code can treat it like an actor.
+    """
+
+    def __init__(self, model, bone_id, bounds):
+        self.model = model
+        self.bone_id = bone_id
+        self.bounds = bounds
+
+    def GetBounds(self):
+        return self.bounds
+
+    def set_color(self, rgb):
+        self.model.set_bone_color(self.bone_id, rgb)
+
+
+class MergedModel:
+    """
+    All groups appended into one vtkPolyData rendered by a single mapper/actor
+    (one draw call instead of one per bone). Cell data carries a 'bone_id'
+    array and an RGB 'colors' array used for highlighting.
+    """
+
+    def __init__(self, groups, bone_index=None):
+        """
+        groups: list of (name, vertices, offsets, connectivity) from ObjLoader
+        bone_index: the model's BoneIndex (bone bounds); computed from groups if None
+        """
+        self.names = [name for name, _, _, _ in groups]
+
+        vertex_counts = np.array([len(v) for _, v, _, _ in groups], dtype=ID_DTYPE)
+        cell_counts = np.array([len(o) - 1 for _, _, o, _ in groups], dtype=ID_DTYPE)
+        conn_counts = np.array([len(c) for _, _, _, c in groups], dtype=ID_DTYPE)
+        vertex_base = np.concatenate(([0], np.cumsum(vertex_counts)[:-1])).astype(ID_DTYPE)
+        conn_base = np.concatenate(([0], np.cumsum(conn_counts)[:-1])).astype(ID_DTYPE)
+        # cell_starts[i]:cell_starts[i+1] are the cells of bone i
+        self.cell_starts = np.concatenate(([0], np.cumsum(cell_counts))).astype(ID_DTYPE)
+
+        vertices = np.concatenate([v for _, v, _, _ in groups]) if groups else np.empty((0, 3), np.float32)
+        connectivity = np.concatenate(
+            [c + base for (_, _, _, c), base in zip(groups, vertex_base)]
+        ) if groups else np.empty(0, ID_DTYPE)
+        offsets = np.concatenate(
+            [o[:-1] + base for (_, _, o, _), base in zip(groups, conn_base)] + [[conn_counts.sum()]]
+        ).astype(ID_DTYPE)
+
+        normals = None
+        if groups and all(getattr(group, "normals", None) is not None for group in groups):
+            normals = np.concatenate([group.normals for group in groups])
+        self.polydata = build_polydata(vertices, offsets, connectivity, normals)
+
+        # Per-cell bone ids (for picking) and colours (for highlighting)
+        self.bone_ids = np.repeat(np.arange(len(groups), dtype=np.int32), cell_counts)
+        bone_id_array = numpy_support.numpy_to_vtk(self.bone_ids, deep=False)
+        bone_id_array.SetName("bone_id")
+        self.polydata.GetCellData().AddArray(bone_id_array)
+
+        self.colors = np.empty((len(self.bone_ids), 3), dtype=np.uint8)
+        self.colors[:] = np.asarray(DEFAULT_COLOR) * 255
+        self.color_array = numpy_support.numpy_to_vtk(self.colors, deep=False)
+        self.color_array.SetName("colors")
+        self.polydata.GetCellData().SetScalars(self.color_array)
+
+        mapper = vtk.vtkPolyDataMapper()
+        mapper.SetInputData(self.polydata)
+        mapper.SetScalarModeToUseCellData()
+        mapper.SetColorModeToDirectScalars()
+
+        self.actor = vtk.vtkActor()
+        self.actor.SetMapper(mapper)
+        self.actor.SetPickable(True)
+        self.actor.GetProperty().BackfaceCullingOn()
+
+        # Per-bone bounds from the precomputed index
+        self.bone_index = bone_index if bone_index is not None else BoneIndex.from_groups(groups)
+        self.bones = [
+            MergedBone(self, bone_id, tuple(float(b) for b in bounds))
+            for bone_id, bounds in enumerate(self.bone_index.bounds)
+        ]
+
+    def name_map(self):
+        """{MergedBone: name}, the merged-mode equivalent of ObjLoader's actor_to_name_map."""
+        return {bone: name for bone, name in zip(self.bones, self.names)}
+
+    def bone_for_cell(self, cell_id):
+        """Maps a vtkCellPicker cell id on self.actor back to its MergedBone."""
+        if cell_id < 0 or cell_id >= len(self.bone_ids):
+            return None
+        return self.bones[self.bone_ids[cell_id]]
+
+    def set_bone_color(self, bone_id, rgb):
+        start, end = self.cell_starts[bone_id], self.cell_starts[bone_id + 1]
+        self.colors[start:end] = np.asarray(rgb) * 255
+        self.color_array.Modified()
@@ -0,0 +1,243 @@
+# model/mesh_cache.py
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from model.bone_index import BoneIndex
+from model.instancing import InstanceTable
+from model.mesh_store import MeshStore
+from model.obj_loader import VIEWER_LOAD_OPTIONS, ObjLoader
+
+CACHE_VERSION = 1
+CACHE_DIR_NAME = ".mesh_cache"
+META_FILE = "meta.json"
+ARRAY_FILES = ("vertices", "offsets", "connectivity")
+# Written only when the loader's preprocessing produced them (parallel to vertices)
+OPTIONAL_ARRAY_FILES = ("normals",)
+INDEX_FILE = "bone_index.npz"
+INSTANCES_FILE = "instances.npz"
+
+
+# Digests already computed in this process: abspath → ((size, mtime_ns), sha256)
+_digest_memo = {}
+
+
+def _sha256(path: str) -> str:
+    """SHA-256 of a file, read in 1 MB blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def file_digest(path: str) -> str:
+    """
+    SHA-256 of a file, hashed once per (size, mtime) in this process: a warm start
+    validates the mesh entry and each derived table against the same source file.
+    """
+    stat = os.stat(path)
+    path = os.path.abspath(path)
+    stamp = (stat.st_size, stat.st_mtime_ns)
+    memo = _digest_memo.get(path)
+    if memo is not None and memo[0] == stamp:
+        return memo[1]
+    digest = _sha256(path)
+    _digest_memo[path] = (stamp, digest)
+    return digest
+
+
+class MeshCache:
+    """
+    Binary on-disk cache of parsed OBJ groups.
+
+    Each model gets a directory holding one .npy file per buffer (all groups
+    concatenated) plus a meta.json with the cache key and per-group slices.
+    Reloads memory-map the .npy files, so a warm start never touches the OBJ text.
+    Derived meshes of the same model (e.g. decimated LOD tiers) are stored as
+    named variants, keyed on the same source file.
+    """
+
+    def __init__(self, cache_dir: str = None):
+        # None → a ".mesh_cache" folder next to each model
+        self.cache_dir = cache_dir
+
+    def entry_dir(self, obj_path: str, variant: str = None) -> str:
+        base_dir = self.cache_dir or os.path.join(os.path.dirname(os.path.abspath(obj_path)), CACHE_DIR_NAME)
+        name = os.path.basename(obj_path)
+        return os.path.join(base_dir, f"{name}@{variant}" if variant else name)
+
+    # --- Cache key ---
+    def _source_key(self, obj_path: str, with_digest: bool = True) -> dict:
+        stat = os.stat(obj_path)
+        key = {
+            "version": CACHE_VERSION,
+            "path": os.path.abspath(obj_path),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+        if with_digest:
+            key["sha256"] = file_digest(obj_path)
+        return key
+
+    def _read_meta(self, obj_path: str, variant: str = None):
+        meta_path = os.path.join(self.entry_dir(obj_path, variant), META_FILE)
+        if not os.path.exists(meta_path):
+            return None
+        try:
+            with open(meta_path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def is_valid(self, obj_path: str, variant: str = None) -> bool:
+        meta = self._read_meta(obj_path, variant)
+        if meta is None:
+            return False
+        # Cheap stat check first, content hash only if that still matches
+        cached_key = meta["key"]
+        quick_key = self._source_key(obj_path, with_digest=False)
+        if any(cached_key.get(k) != v for k, v in quick_key.items()):
+            return False
+        return cached_key.get("sha256") == file_digest(obj_path)
+
+    # --- Load / store ---
+    def load(self, obj_path: str, variant: str = None):
+        """
+        Returns the cached groups as a MeshStore over the memory-mapped buffers,
+        or None if the cache is missing or stale.
+        """
+        if not self.is_valid(obj_path, variant):
+            return None
+
+        entry = self.entry_dir(obj_path, variant)
+        meta = self._read_meta(obj_path, variant)
+        try:
+            # Copy-on-write maps: pages are shared with the OS cache, VTK can still wrap them
+            arrays = {name: np.load(os.path.join(entry, name + ".npy"), mmap_mode="c") for name in ARRAY_FILES}
+            for name in OPTIONAL_ARRAY_FILES:
+                path = os.path.join(entry, name + ".npy")
+                arrays[name] = np.load(path, mmap_mode="c") if os.path.exists(path) else None
+        except (OSError, ValueError):
+            return None
+
+        ranges = {key: np.array([group[key] for group in meta["groups"]], dtype=np.int64).reshape(-1, 2)
+                  for key in ARRAY_FILES}
+        return MeshStore(
+            [group["name"] for group in meta["groups"]],
+            arrays["vertices"], arrays["offsets"], arrays["connectivity"],
+            ranges["vertices"], ranges["offsets"], ranges["connectivity"], arrays["normals"],
+        )
+
+    def store(self, obj_path: str, groups, variant: str = None):
+        """
+        Writes a MeshStore (or list of groups) to the cache, replacing any previous entry atomically.
+        Safe against concurrent writers of the same entry (e.g. the menu prewarmer and the
+        viewer's background loader): each writes its own temporary folder and the last one in wins.
+        """
+        entry = self.entry_dir(obj_path, variant)
+        base_dir = os.path.dirname(entry)
+        os.makedirs(base_dir, exist_ok=True)
+        tmp_entry = tempfile.mkdtemp(prefix=os.path.basename(entry) + ".", suffix=".tmp", dir=base_dir)
+
+        store = groups if isinstance(groups, MeshStore) else MeshStore.from_groups(groups)
+        meta_groups = [
+            {"name": name, "vertices": v.tolist(), "offsets": o.tolist(), "connectivity": c.tolist()}
+            for name, v, o, c in zip(store.names, store.vertex_ranges, store.offset_ranges, store.connectivity_ranges)
+        ]
+        for key in ARRAY_FILES + OPTIONAL_ARRAY_FILES:
+            if getattr(store, key) is not None:
+                np.save(os.path.join(tmp_entry, key + ".npy"), getattr(store, key))
+
+        meta = {"key": self._source_key(obj_path), "groups": meta_groups}
+        with open(os.path.join(tmp_entry, META_FILE), "w", encoding="utf-8") as file:
+            json.dump(meta, file, indent=1)
+
+        # A directory can only replace an empty one; a concurrent writer may re-create the entry in between
+        for _ in range(3):
+            shutil.rmtree(entry, ignore_errors=True)
+            try:
+                os.replace(tmp_entry, entry)
+                return
+            except OSError:
+                continue
+        shutil.rmtree(tmp_entry, ignore_errors=True)  # the other writer's entry holds the same data
+
+    # --- Derived tables: bone index, instances (live in the mesh entry, so re-storing the mesh drops them) ---
+    def _load_table(self, obj_path: str, variant: str, filename: str, table_class):
+        path = os.path.join(self.entry_dir(obj_path, variant), filename)
+        if not os.path.exists(path) or not self.is_valid(obj_path, variant):
+            return None
+        try:
+            return table_class.load(path)
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _store_table(self, obj_path: str, variant: str, filename: str, table):
+        """Adds the table to an existing mesh entry (written atomically)."""
+        entry = self.entry_dir(obj_path, variant)
+        if not os.path.isdir(entry):
+            return
+        try:
+            handle, tmp_path = tempfile.mkstemp(prefix=filename + ".", suffix=".tmp.npz", dir=entry)
+            os.close(handle)
+            table.save(tmp_path)
+            os.replace(tmp_path, os.path.join(entry, filename))
+        except OSError:
+            pass  # the entry was replaced meanwhile (concurrent store); the table is rebuilt on next load
+
+    def load_index(self, obj_path: str, variant: str = None):
+        """Returns the cached BoneIndex, or None if it (or the mesh entry) is missing or stale."""
+        return self._load_table(obj_path, variant, INDEX_FILE, BoneIndex)
+
+    def store_index(self, obj_path: str, index: BoneIndex, variant: str = None):
+        self._store_table(obj_path, variant, INDEX_FILE, index)
+
+    def load_instances(self, obj_path: str, variant: str = None):
+        """Returns the cached InstanceTable, or None if it (or the mesh entry) is missing or stale."""
+        return self._load_table(obj_path, variant, INSTANCES_FILE, InstanceTable)
+
+    def store_instances(self, obj_path: str, instances: InstanceTable, variant: str = None):
+        self._store_table(obj_path, variant, INSTANCES_FILE, instances)
+
+    def clear(self, obj_path: str, variant: str = None):
+        shutil.rmtree(self.entry_dir(obj_path, variant), ignore_errors=True)
+
+
+def prebuild_directory(model_dir: str, cache: MeshCache = None, force: bool = False, workers: int = 1):
+    """Builds the viewer's cache entries (mesh buffers, bone index, instance table) for every .obj under model_dir."""
+    cache = cache or MeshCache()
+    for root, dirs, files in os.walk(model_dir):
+        dirs[:] = [d for d in dirs if d != CACHE_DIR_NAME]
+        for filename in sorted(files):
+            if not filename.lower().endswith(".obj"):
+                continue
+            path = os.path.join(root, filename)
+            loader = ObjLoader(path, workers=workers, **VIEWER_LOAD_OPTIONS)
+            if not force and cache.is_valid(path, loader.variant):
+                print(f"[MeshCache] Up to date: {path}")
+                continue
+            groups = loader.apply_preprocessing(loader.apply_segmentation(loader.parse_groups()))
+            cache.store(path, groups, loader.variant)
+            cache.store_index(path, BoneIndex.from_groups(groups), loader.variant)
+            cache.store_instances(path, InstanceTable.from_groups(groups, loader.instance_tolerance), loader.variant)
+            print(f"[MeshCache] Cached {len(groups)} groups: {path}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Prebuild binary mesh caches for OBJ models.")
+    parser.add_argument("model_dir", nargs="?", default="models", help="directory to scan for .obj files")
+    parser.add_argument("--cache-dir", default=None, help="store caches here instead of next to each model")
+    parser.add_argument("--force", action="store_true", help="rebuild even if the cache is up to date")
+    parser.add_argument("--workers", type=int, default=1, help="processes used to decode OBJ groups")
+    args = parser.parse_args(argv)
+    prebuild_directory(args.model_dir, MeshCache(args.cache_dir), force=args.force, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
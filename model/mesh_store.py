@@ -0,0 +1,199 @@
+# model/mesh_store.py
+import numpy as np
+import vtk
+from vtk.util import numpy_support
+
+# Cell index dtype: vtkCellArray's 64-bit storage, so buffers are used as-is (no conversion copy)
+ID_DTYPE = np.dtype(np.int64)
+VERTEX_DTYPE = np.dtype(np.float32)
+
+
+def build_polydata(vertices, offsets, connectivity, normals=None):
+    """
+    Wraps contiguous numpy buffers as vtkPolyData without per-element copies.
+    normals: optional (n, 3) float32 per-vertex normals (the mapper then skips computing its own)
+    """
+    points = vtk.vtkPoints()
+    points.SetData(numpy_support.numpy_to_vtk(np.ascontiguousarray(vertices), deep=False))
+
+    # vtkTypeInt64Array is stored by vtkCellArray directly; a vtkIdTypeArray would be
+    # shallow-copied into a new object, dropping the reference that keeps numpy's buffer alive
+    polys = vtk.vtkCellArray()
+    polys.SetData(
+        numpy_support.numpy_to_vtk(np.ascontiguousarray(offsets, dtype=ID_DTYPE), deep=False,
+                                   array_type=vtk.VTK_TYPE_INT64),
+        numpy_support.numpy_to_vtk(np.ascontiguousarray(connectivity, dtype=ID_DTYPE), deep=False,
+                                   array_type=vtk.VTK_TYPE_INT64),
+    )
+
+    polydata = vtk.vtkPolyData()
+    polydata.SetPoints(points)
+    polydata.SetPolys(polys)
+    if normals is not None:
+        normal_array = numpy_support.numpy_to_vtk(np.ascontiguousarray(normals, dtype=VERTEX_DTYPE), deep=False)
+        normal_array.SetName("Normals")
+        polydata.GetPointData().SetNormals(normal_array)
+    return polydata
+
+
+def fan_triangles(cell_starts, sizes):
+    """
+    Fan-triangulates polygon cells given as (start, size) in a connectivity array.
+    Returns (cell of each triangle, (m, 3) connectivity positions of its corners).
+    """
+    counts = np.maximum(sizes - 2, 0)
+    cells = np.repeat(np.arange(len(sizes), dtype=ID_DTYPE), counts)
+    # k-th triangle of a cell: (first, first + k + 1, first + k + 2)
+    k = np.arange(len(cells), dtype=ID_DTYPE) - np.repeat(np.cumsum(counts) - counts, counts)
+    first = cell_starts[cells]
+    return cells, np.stack([first, first + k + 1, first + k + 2], axis=1)
+
+
+class MeshGroup:
+    """
+    One named mesh in vtkCellArray's layout: (n, 3) float32 vertices, and cells
+    as offsets (n_cells + 1) into a flat connectivity array. Optional (n, 3)
+    float32 per-vertex normals come from the preprocessing stage.
+    Unpacks like a (name, vertices, offsets, connectivity) tuple.
+    """
+
+    __slots__ = ("name", "vertices", "offsets", "connectivity", "normals")
+
+    def __init__(self, name, vertices, offsets, connectivity, normals=None):
+        self.name = name
+        self.vertices = vertices
+        self.offsets = offsets
+        self.connectivity = connectivity
+        self.normals = normals
+
+    def __iter__(self):
+        return iter((self.name, self.vertices, self.offsets, self.connectivity))
+
+    @property
+    def n_points(self) -> int:
+        return len(self.vertices)
+
+    @property
+    def n_cells(self) -> int:
+        return max(len(self.offsets) - 1, 0)
+
+    @property
+    def nbytes(self) -> int:
+        normals = self.normals.nbytes if self.normals is not None else 0
+        return self.vertices.nbytes + self.offsets.nbytes + self.connectivity.nbytes + normals
+
+    def to_polydata(self):
+        """Zero-copy vtkPolyData over this group's buffers."""
+        return build_polydata(self.vertices, self.offsets, self.connectivity, self.normals)
+
+
+class MeshStore:
+    """
+    All groups of a model in three contiguous buffers. Groups are views into
+    them, addressed by per-group [start, end) rows of the three range tables.
+    This is the layout the mesh cache writes to disk and memory-maps back.
+    normals, if present, is parallel to vertices (same ranges).
+    """
+
+    __slots__ = ("names", "vertices", "offsets", "connectivity",
+                 "vertex_ranges", "offset_ranges", "connectivity_ranges", "normals")
+
+    def __init__(self, names, vertices, offsets, connectivity, vertex_ranges, offset_ranges, connectivity_ranges,
+                 normals=None):
+        self.names = names
+        self.vertices = vertices
+        self.offsets = offsets
+        self.connectivity = connectivity
+        self.vertex_ranges = vertex_ranges
+        self.offset_ranges = offset_ranges
+        self.connectivity_ranges = connectivity_ranges
+        self.normals = normals
+
+    @classmethod
+    def from_groups(cls, groups):
+        """Packs MeshGroups (or equivalent tuples) into one store (copies into the shared buffers)."""
+        groups = [group if isinstance(group, MeshGroup) else MeshGroup(*group) for group in groups]
+
+        def pack(arrays, empty):
+            lengths = np.array([len(a) for a in arrays], dtype=ID_DTYPE)
+            ends = np.cumsum(lengths)
+            ranges = np.stack([ends - lengths, ends], axis=1) if len(arrays) else np.empty((0, 2), ID_DTYPE)
+            return (np.concatenate(arrays) if arrays else empty), ranges
+
+        vertices, vertex_ranges = pack([g.vertices for g in groups], np.empty((0, 3), VERTEX_DTYPE))
+        offsets, offset_ranges = pack([g.offsets for g in groups], np.empty(0, ID_DTYPE))
+        connectivity, connectivity_ranges = pack([g.connectivity for g in groups], np.empty(0, ID_DTYPE))
+        normals = None
+        if groups and all(g.normals is not None for g in groups):
+            normals = pack([g.normals for g in groups], np.empty((0, 3), VERTEX_DTYPE))[0]
+        return cls([g.name for g in groups], vertices, offsets, connectivity,
+                   vertex_ranges, offset_ranges, connectivity_ranges, normals)
+
+    @classmethod
+    def from_cells(cls, names, vertices, vertex_counts, cell_counts, cell_sizes, connectivity, normals=None):
+        """
+        Packs cells that are already ordered by group: group g owns vertex_counts[g]
+        vertices and cell_counts[g] cells; cell_sizes and the group-local vertex
+        ids in connectivity run over all cells in that order.
+        """
+        n = len(names)
+        vertex_counts = np.asarray(vertex_counts, dtype=ID_DTYPE)
+        cell_counts = np.asarray(cell_counts, dtype=ID_DTYPE)
+        cell_sizes = np.asarray(cell_sizes, dtype=ID_DTYPE)
+        cell_groups = np.repeat(np.arange(n), cell_counts)
+        connectivity_counts = np.bincount(cell_groups, weights=cell_sizes, minlength=n).astype(ID_DTYPE)
+
+        # Each group's offsets restart at 0 and end with a closing entry
+        connectivity_starts = np.cumsum(connectivity_counts) - connectivity_counts
+        offsets = np.empty(len(cell_sizes) + n, dtype=ID_DTYPE)
+        offsets[np.arange(len(cell_sizes)) + cell_groups + 1] = (
+            np.cumsum(cell_sizes) - connectivity_starts[cell_groups])
+        offsets[np.cumsum(cell_counts) - cell_counts + np.arange(n)] = 0
+
+        def ranges(counts):
+            ends = np.cumsum(counts).astype(ID_DTYPE)
+            return np.stack([ends - counts, ends], axis=1)
+
+        return cls(list(names), np.ascontiguousarray(vertices, dtype=VERTEX_DTYPE), offsets,
+                   np.asarray(connectivity, dtype=ID_DTYPE),
+                   ranges(vertex_counts), ranges(cell_counts + 1), ranges(connectivity_counts), normals)
+
+    def global_cells(self):
+        """
+        Every cell of every group in terms of the shared buffers.
+        Returns (cell_starts, sizes, cell_groups, point_ids): cell i is
+        point_ids[cell_starts[i]:cell_starts[i] + sizes[i]], rows of self.vertices.
+        """
+        n = len(self)
+        offset_counts = self.offset_ranges[:, 1] - self.offset_ranges[:, 0]
+        connectivity_counts = self.connectivity_ranges[:, 1] - self.connectivity_ranges[:, 0]
+        # Group-local offsets and vertex ids → positions in the shared connectivity / vertex buffers
+        offsets = self.offsets + np.repeat(self.connectivity_ranges[:, 0], offset_counts)
+        point_ids = self.connectivity + np.repeat(self.vertex_ranges[:, 0], connectivity_counts)
+        # Every offset except each group's closing one starts a cell; the next entry ends it
+        opens = np.ones(len(offsets), dtype=bool)
+        opens[self.offset_ranges[offset_counts > 0, 1] - 1] = False
+        open_at = np.flatnonzero(opens)
+        cell_starts = offsets[open_at]
+        sizes = offsets[open_at + 1] - cell_starts
+        cell_groups = np.repeat(np.arange(n), np.maximum(offset_counts - 1, 0))
+        return cell_starts, sizes, cell_groups, point_ids
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, index) -> MeshGroup:
+        v0, v1 = self.vertex_ranges[index]
+        o0, o1 = self.offset_ranges[index]
+        c0, c1 = self.connectivity_ranges[index]
+        normals = self.normals[v0:v1] if self.normals is not None else None
+        return MeshGroup(self.names[index], self.vertices[v0:v1], self.offsets[o0:o1], self.connectivity[c0:c1],
+                         normals)
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    @property
+    def nbytes(self) -> int:
+        normals = self.normals.nbytes if self.normals is not None else 0
+        return self.vertices.nbytes + self.offsets.nbytes + self.connectivity.nbytes + normals
@@ -0,0 +1,142 @@
+# model/model_registry.py
+import os
+from collections import OrderedDict
+
+from model.actor_registry import ActorRegistry
+from model.bone_index import BoneIndex
+from model.mesh_cache import MeshCache
+from model.obj_loader import VIEWER_LOAD_OPTIONS, ObjLoader, make_actors
+
+# Names the menu modules may use instead of a path; anything else is treated as an OBJ path
+DEFAULT_MODELS = {
+    "skeleton_female": "models/female_human_skeleton.obj",
+}
+# Resident geometry budget (CPU buffers + estimated GPU buffers) — leaves room on 4 GB PCs
+DEFAULT_MEMORY_BUDGET = 1536 << 20
+
+
+def _vertex_bytes(group) -> int:
+    """GPU vertex buffer size of one group: float32 positions, plus float32 normals if it has them."""
+    return group.n_points * (24 if group.normals is not None else 12)
+
+
+def _triangle_indices(group) -> int:
+    """Index count once the group's polygons are fanned into triangles."""
+    n_cells = len(group.offsets) - 1
+    return 3 * (len(group.connectivity) - 2 * n_cells)
+
+
+class LoadedModel:
+    """One resident model: parsed buffers, bone index, instance table and the vtkPolyData shared by every viewer."""
+
+    def __init__(self, key, path, groups, polydata, bone_index, instances=None):
+        self.key = key
+        self.path = path
+        self.groups = groups
+        self.polydata = polydata
+        self.bone_index = bone_index
+        self.instances = instances
+        self.names = [group.name for group in groups]
+
+        # CPU: the numpy buffers VTK wraps zero-copy (cache-backed ones are memory-mapped), normals included
+        self.cpu_bytes = sum(group.nbytes for group in groups)
+        # GPU estimate for the geometry actually drawn (instances: the table the actors were built
+        # with; copies reuse their prototype's buffers, mirrored ones add one index buffer):
+        # float32 xyz positions (+ normals when present) and a 32-bit index buffer of fan triangles
+        drawn = list(range(len(groups))) if instances is None else instances.prototype_rows.tolist()
+        vertex_bytes = sum(_vertex_bytes(groups[row]) for row in drawn)
+        n_indices = sum(_triangle_indices(groups[row]) for row in drawn)
+        if instances is not None:
+            mirrored = {int(instances.prototypes[row]) for row in instances.instance_rows if instances.is_mirrored(row)}
+            n_indices += sum(_triangle_indices(groups[row]) for row in mirrored)
+        self.gpu_bytes = vertex_bytes + n_indices * 4
+
+    @property
+    def memory_bytes(self):
+        return self.cpu_bytes + self.gpu_bytes
+
+    def make_actors(self, instanced: bool = True):
+        """Fresh actors (own colour/visibility) over the shared polydata. Returns (actors, ActorRegistry)."""
+        actors = make_actors(self.polydata, self.instances if instanced else None)
+        return actors, ActorRegistry(dict(zip(actors, self.names)))
+
+
+class ModelRegistry:
+    """
+    Loads models on demand and keeps them resident, least recently used first
+    out once the memory budget is exceeded. The model just requested is never
+    evicted, even if it alone is over budget.
+
+    Models are keyed by absolute OBJ path; names from DEFAULT_MODELS (or
+    register()) and relative paths resolve to the same key, so a model is never
+    resident twice.
+    Eviction only drops the registry's reference: the memory comes back once
+    no scene holds actors over the model's polydata any more.
+    Models load with the viewer's options (VIEWER_LOAD_OPTIONS) unless
+    loader_options is given.
+    """
+
+    def __init__(self, memory_budget: int = DEFAULT_MEMORY_BUDGET, cache: MeshCache = None, models: dict = None,
+                 loader_options: dict = None):
+        self.memory_budget = memory_budget
+        self.cache = cache or MeshCache()
+        self.loader_options = dict(VIEWER_LOAD_OPTIONS if loader_options is None else loader_options)
+        self.paths = dict(DEFAULT_MODELS if models is None else models)
+        self.loaded = OrderedDict()  # key → LoadedModel, least recently used first
+
+    def register(self, key: str, path: str):
+        self.paths[key] = path
+
+    def path_of(self, key: str) -> str:
+        """The registry key of a model name or path: its absolute OBJ path."""
+        return os.path.abspath(self.paths.get(key, key))
+
+    def is_loaded(self, key: str) -> bool:
+        return self.path_of(key) in self.loaded
+
+    def get(self, key: str) -> LoadedModel:
+        """Returns the resident model, loading it (cache first) if needed."""
+        path = self.path_of(key)
+        model = self.loaded.get(path)
+        if model is None:
+            loader = ObjLoader(path, cache=self.cache, **self.loader_options)
+            groups = loader.load_groups()
+            return self.adopt(path, groups, bone_index=loader.load_bone_index(groups),
+                              instances=loader.load_instances(groups))
+        self.loaded.move_to_end(path)
+        return model
+
+    def adopt(self, key: str, groups, polydata=None, bone_index=None, instances=None) -> LoadedModel:
+        """
+        Registers groups loaded elsewhere (e.g. progressively), reusing their polydata/index if given.
+        instances: the InstanceTable the existing actors were built with; None if they are not instanced.
+        """
+        path = self.path_of(key)
+        if polydata is None:
+            polydata = [group.to_polydata() for group in groups]
+        if bone_index is None:
+            bone_index = BoneIndex.from_groups(groups)
+        model = LoadedModel(path, path, groups, polydata, bone_index, instances)
+        self.loaded[path] = model
+        self.loaded.move_to_end(path)
+        self._enforce_budget()
+        return model
+
+    def evict(self, key: str):
+        """Forgets a model; its buffers are freed once no scene's actors use them."""
+        path = self.path_of(key)
+        model = self.loaded.pop(path, None)
+        if model is not None:
+            print(f"[ModelRegistry] Evicted {path} ({model.memory_bytes / (1 << 20):.1f} MB)")
+
+    def _enforce_budget(self):
+        while len(self.loaded) > 1 and self.memory_used > self.memory_budget:
+            self.evict(next(iter(self.loaded)))
+
+    @property
+    def memory_used(self) -> int:
+        return sum(model.memory_bytes for model in self.loaded.values())
+
+    def report(self):
+        """[(key, cpu_bytes, gpu_bytes)] from least to most recently used."""
+        return [(key, model.cpu_bytes, model.gpu_bytes) for key, model in self.loaded.items()]
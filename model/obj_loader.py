@@ -1,102 +1,470 @@
 # model/obj_loader.py
-import vtk
+import mmap
 import os
+import re
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import vtk
+
+from model.bone_index import BoneIndex
+from model.instancing import DEFAULT_INSTANCE_TOLERANCE, InstanceTable
+from model.mesh_store import ID_DTYPE, MeshGroup, MeshStore, build_polydata  # noqa: F401  (re-exported)
+from model.preprocess import preprocess_groups
+from model.segmentation import (DEFAULT_MIN_FRAGMENT_FACES, default_name_map_path, load_name_map,
+                                name_map_digest, segment_groups)
+from utils.profiler import profiler
+
+SUFFIXES_TO_REMOVE = ["male human skeleton", "female human skeleton"]
+
+# Whole-file record patterns (one regex pass instead of a Python loop per line)
+_GROUP_RE = re.compile(rb"^[ \t]*g[ \t]+(\S[^\r\n]*)", re.MULTILINE)
+_VERTEX_RE = re.compile(rb"^[ \t]*v[ \t]+([^\r\n]*)", re.MULTILINE)
+_FACE_RE = re.compile(rb"^[ \t]*f[ \t]+([^\r\n]*)", re.MULTILINE)
+_INDEX_SUFFIX_RE = re.compile(rb"/\S*")  # "12/5/7" -> "12"
+
+# Streaming reader: bytes read from disk per step
+DEFAULT_CHUNK_SIZE = 8 << 20
+
+# Loader options the viewer opts into (smooth shading); prewarm and prebuild build the same cache variant
+VIEWER_LOAD_OPTIONS = {"normals": True}
+
+
+def clean_group_name(raw_name: str) -> str:
+    """Turn a raw 'g' record name into a readable bone name."""
+    group_name = raw_name.strip().replace("_", " ")
+
+    # Remove everything after first dot
+    if "." in group_name:
+        group_name = group_name.split(".", 1)[0].strip()
+
+    # Remove known suffixes
+    for suffix in SUFFIXES_TO_REMOVE:
+        if suffix.lower() in group_name.lower():
+            group_name = group_name.lower().replace(suffix.lower(), "").strip()
+
+    return group_name
+
+
+def _tokenize_lines(blob, n_lines, dtype):
+    """
+    Parses whitespace separated numbers from newline-joined record payloads at once.
+    Returns: (values, counts) where counts[i] is the number of values on line i.
+    """
+    buf = np.frombuffer(blob, dtype=np.uint8)
+    is_space = (buf == 0x20) | (buf == 0x09) | (buf == 0x0A)
+    token_start = ~is_space
+    token_start[1:] &= is_space[:-1]
+    line_ids = np.cumsum(buf == 0x0A)
+    counts = np.bincount(line_ids[token_start], minlength=n_lines)
+    values = np.fromstring(blob, dtype=dtype, sep=" ")
+    return values, counts
+
+
+def parse_vertices(payloads) -> np.ndarray:
+    """Returns an (n, 3) float32 array from 'v' record payloads."""
+    if not payloads:
+        return np.empty((0, 3), dtype=np.float32)
+    # Parse as double first so rounding matches vtkPoints.InsertNextPoint
+    values, counts = _tokenize_lines(b"\n".join(payloads), len(payloads), np.float64)
+    if values.size == 3 * len(payloads):
+        xyz = values.reshape(-1, 3)
+    else:
+        # Extra components (w, vertex colours) are ignored
+        line_starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        xyz = values[line_starts[:, None] + np.arange(3)]
+    return np.ascontiguousarray(xyz, dtype=np.float32)
+
+
+def parse_faces(payloads):
+    """
+    Returns (offsets, indices) from 'f' record payloads, in vtkCellArray layout.
+    Indices are zero-based into the global vertex table.
+    """
+    if not payloads:
+        return np.zeros(1, dtype=ID_DTYPE), np.empty(0, dtype=ID_DTYPE)
+    blob = b"\n".join(payloads)
+    if b"/" in blob:
+        blob = _INDEX_SUFFIX_RE.sub(b"", blob)
+    values, counts = _tokenize_lines(blob, len(payloads), np.int64)
+    offsets = np.zeros(np.count_nonzero(counts) + 1, dtype=ID_DTYPE)
+    np.cumsum(counts[counts > 0], out=offsets[1:])
+    return offsets, (values - 1).astype(ID_DTYPE, copy=False)
+
+
+def remap_group(global_vertices, indices):
+    """
+    Gathers the vertices used by one group and renumbers its indices locally.
+    Vertices keep first-use order, so output matches the old per-face dict remap.
+    """
+    unique, first_seen, inverse = np.unique(indices, return_index=True, return_inverse=True)
+    order = np.argsort(first_seen, kind="stable")
+    rank = np.empty_like(order)
+    rank[order] = np.arange(order.size)
+    vertices = global_vertices[unique[order]]
+    connectivity = rank[inverse.ravel()].astype(ID_DTYPE, copy=False)
+    return vertices, connectivity
+
+
+class _VertexTable:
+    """Global (n, 3) float32 vertex table that grows by doubling, without Python lists."""
+
+    def __init__(self, capacity: int = 1 << 16):
+        self._data = np.empty((capacity, 3), dtype=np.float32)
+        self._size = 0
+
+    def append(self, xyz):
+        needed = self._size + len(xyz)
+        if needed > len(self._data):
+            grown = np.empty((max(needed, 2 * len(self._data)), 3), dtype=np.float32)
+            grown[:self._size] = self._data[:self._size]
+            self._data = grown
+        self._data[self._size:needed] = xyz
+        self._size = needed
+
+    def view(self):
+        return self._data[:self._size]
+
+
+def make_actor(polydata, mapper=None):
+    """Creates the standard pickable white bone actor for a polydata (or over an existing, shared mapper)."""
+    if mapper is None:
+        mapper = vtk.vtkPolyDataMapper()
+        mapper.SetInputData(polydata)
+
+    actor = vtk.vtkActor()
+    actor.SetMapper(mapper)
+    actor.SetPickable(True)  # Important for picker/hover
+    actor.GetProperty().SetColor(1, 1, 1)
+    actor.GetProperty().BackfaceCullingOn()
+    return actor
+
+
+def make_actors(polydata, instances: InstanceTable = None):
+    """
+    One actor per bone, row-aligned with `polydata`. With an InstanceTable, copies
+    draw through their prototype's mapper, placed by SetUserMatrix, so repeated
+    geometry is uploaded once; every bone keeps its own actor, hence its own
+    colour, visibility, picking and name.
+    """
+    if instances is not None:
+        polydata = instances.shared_polydata(polydata)
+    mappers = {}  # polydata address → the mapper already drawing it (VTK datasets are not hashable)
+    actors = []
+    for row, data in enumerate(polydata):
+        key = data.GetAddressAsString("vtkPolyData")
+        actor = make_actor(data, mappers.get(key))
+        mappers[key] = actor.GetMapper()
+        if instances is not None and instances.is_instance(row):
+            actor.SetUserMatrix(instances.user_matrix(row))
+        actors.append(actor)
+    return actors
+
+
+def instance_actors(actors, polydata, instances: InstanceTable):
+    """
+    Applies an InstanceTable to per-bone actors that already exist (row-aligned
+    with `polydata`, their own meshes), e.g. once a streamed model has finished
+    loading: copies switch to their prototype's mapper (mirrored copies to one
+    shared reversed-winding mapper) and get their UserMatrix.
+    Returns: the actors whose mapper changed
+    """
+    shared = instances.shared_polydata(polydata)
+    mappers = {}  # polydata address → the mapper already drawing it
+    changed = []
+    for row, (actor, data) in enumerate(zip(actors, shared)):
+        key = data.GetAddressAsString("vtkPolyData")
+        if not instances.is_instance(row):
+            mappers[key] = actor.GetMapper()
+            continue
+        mapper = mappers.get(key)
+        if mapper is None:  # first mirrored copy of its prototype
+            mapper = vtk.vtkPolyDataMapper()
+            mapper.SetInputData(data)
+            mappers[key] = mapper
+        actor.SetMapper(mapper)
+        actor.SetUserMatrix(instances.user_matrix(row))
+        changed.append(actor)
+    return changed
+
+
+def _parse_vertex_range(path, start, end):
+    """Worker: parses the 'v' records in path[start:end] into an (n, 3) float32 array."""
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        return parse_vertices(_VERTEX_RE.findall(data, start, end))
+
+
+def _decode_group_range(path, start, end, vertex_file):
+    """
+    Worker: parses the faces in path[start:end] and remaps them against the
+    shared global vertex table (a memory-mapped .npy written by the parent).
+    Returns: (vertices, offsets, connectivity) or None if the range has no faces
+    """
+    global_vertices = np.load(vertex_file, mmap_mode="r")
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        payloads = _FACE_RE.findall(data, start, end)
+    if not payloads:
+        return None
+    offsets, indices = parse_faces(payloads)
+    vertices, connectivity = remap_group(global_vertices, indices)
+    return vertices, offsets, connectivity
 
 
 class ObjLoader:
-    def __init__(self, path: str):
+    def __init__(self, path: str, cache=None, workers: int = 1, segment: bool = True,
+                 min_fragment_faces: int = DEFAULT_MIN_FRAGMENT_FACES, name_map_path: str = None,
+                 normals: bool = False, clean: bool = False, clean_tolerance: float = 0.0,
+                 instance_tolerance: float = DEFAULT_INSTANCE_TOLERANCE):
+        """
+        path: OBJ file to load
+        cache: optional MeshCache; parsed groups are read from / written to it
+        workers: >1 decodes groups in that many processes (see parse_groups_parallel)
+        segment: split single-group models into one group per connected component (see model.segmentation)
+        min_fragment_faces: smaller components are merged into their nearest neighbour (0 = keep all)
+        name_map_path: segment names; defaults to <model>.bones.json when that file exists
+        normals: compute per-vertex normals once (cached) for smooth shading; off = the mapper's flat shading
+        clean: merge duplicate points (within clean_tolerance) and drop collapsed cells
+        instance_tolerance: max deviation (fraction of a bone's RMS radius) for bones to share geometry
+        """
         if not os.path.exists(path):
             raise FileNotFoundError(f"OBJ file not found: {path}")
         self.path = path
+        self.cache = cache
+        self.workers = workers
+        self.segment = segment
+        self.min_fragment_faces = min_fragment_faces
+        if name_map_path is None and os.path.exists(default_name_map_path(path)):
+            name_map_path = default_name_map_path(path)
+        self.name_map_path = name_map_path if segment else None
+        self.normals = normals
+        self.clean = clean
+        self.clean_tolerance = clean_tolerance
+        self.instance_tolerance = instance_tolerance
 
-    def load_grouped_obj(self):
+        # Cache entry of the loader's output, keyed on the stages that shaped it
+        stages = []
+        if segment:
+            stages.append(f"segments-{min_fragment_faces}")
+            if self.name_map_path:
+                stages.append(name_map_digest(self.name_map_path))
+        if clean:
+            stages.append(f"clean{clean_tolerance:g}")
+        if normals:
+            stages.append("normals")
+        self.variant = "-".join(stages) or None
+
+    def iter_groups(self, chunk_size: int = DEFAULT_CHUNK_SIZE, on_progress=None):
         """
-        Loads an OBJ file with 'g' groups.
-        Returns: (actors_list, actor_to_name_map)
+        Streams the OBJ in fixed-size byte chunks and yields each group as soon
+        as its 'g' record is closed (by the next 'g' or end of file).
+        Yields: MeshGroup (unpacks as name, vertices, offsets, connectivity)
+
+        Peak memory is bounded by what OBJ semantics force us to keep, not by
+        the file size:
+            ~4 x chunk_size               raw chunk + record payloads being tokenized
+          + 24 B x total vertex count    global float32 vertex table (capacity up to 2x the count)
+                                         36 B while it grows: old and doubled buffers coexist
+          + 16 B x open group's indices  parsed face indices/counts of the current group
+        plus whatever the caller keeps from previously yielded groups.
+        chunk_size=None reads the whole file as one chunk.
+        on_progress: optional callable(bytes_read, total_bytes), called after every chunk.
         """
-        current_vertices = []
-        current_faces = []
-        current_group_name = None
-        actors_list = []
-
-        with open(self.path, "r", encoding="utf-8") as file:
-            lines = file.readlines()
-
-        global_vertices = []
-        vertex_map = {}
-
-        for line in lines:
-            line = line.strip()
-
-            if line.startswith("v "):
-                global_vertices.append([float(p) for p in line.split()[1:]])
-
-            elif line.startswith("g "):
-                # Save previous group if valid
-                if current_group_name and current_faces:
-                    actors_list.append((current_group_name, current_vertices, current_faces))
-
-                # New group
-                group_name = line[2:].strip()
-                group_name = group_name.replace("_", " ")
-
-                # Remove everything after first dot
-                if "." in group_name:
-                    group_name = group_name.split(".", 1)[0].strip()
-
-                # Remove known suffixes
-                suffixes_to_remove = ["male human skeleton", "female human skeleton"]
-                for suffix in suffixes_to_remove:
-                    if suffix.lower() in group_name.lower():
-                        group_name = group_name.lower().replace(suffix.lower(), "").strip()
-
-                current_group_name = group_name
-                current_vertices = []
-                current_faces = []
-                vertex_map = {}
-
-            elif line.startswith("f "):
-                face = []
-                for p in line[2:].split():
-                    idx = int(p.split("/")[0]) - 1
-                    if idx not in vertex_map:
-                        vertex_map[idx] = len(current_vertices)
-                        current_vertices.append(global_vertices[idx])
-                    face.append(vertex_map[idx])
-                current_faces.append(face)
-
-        # Final group
-        if current_group_name and current_faces:
-            actors_list.append((current_group_name, current_vertices, current_faces))
+        vertex_table = _VertexTable()
+        group = None  # [name, [counts...], [indices...]] of the open group
+        carry = b""
+        total_bytes = os.path.getsize(self.path)
+        bytes_read = 0
 
-        vtk_actors = []
-        actor_to_name_map = {}
+        with open(self.path, "rb") as file:
+            while True:
+                chunk = file.read(chunk_size) if chunk_size else file.read()
+                at_eof = not chunk
+                if at_eof:
+                    data, carry = carry + b"\n", b""
+                else:
+                    # Only complete lines are parsed, the tail waits for the next chunk
+                    data = carry + chunk
+                    cut = data.rfind(b"\n") + 1
+                    data, carry = data[:cut], data[cut:]
 
-        for name, verts, faces in actors_list:
-            points = vtk.vtkPoints()
-            for v in verts:
-                points.InsertNextPoint(v)
+                pos = 0
+                for match in _GROUP_RE.finditer(data):
+                    self._consume_segment(data, pos, match.start(), vertex_table, group)
+                    if group is not None and group[1]:
+                        yield self._close_group(group, vertex_table)
+                    group = [clean_group_name(match.group(1).decode("utf-8")), [], []]
+                    pos = match.end()
+                self._consume_segment(data, pos, len(data), vertex_table, group)
 
-            polys = vtk.vtkCellArray()
-            for f in faces:
-                polys.InsertNextCell(len(f))
-                for idx in f:
-                    polys.InsertCellPoint(idx)
+                bytes_read += len(chunk)
+                if on_progress is not None:
+                    on_progress(bytes_read, total_bytes)
+                if at_eof or not chunk_size:
+                    break
 
-            polydata = vtk.vtkPolyData()
-            polydata.SetPoints(points)
-            polydata.SetPolys(polys)
+        if group is not None and group[1]:
+            yield self._close_group(group, vertex_table)
 
-            mapper = vtk.vtkPolyDataMapper()
-            mapper.SetInputData(polydata)
+    @staticmethod
+    def _consume_segment(data, start, end, vertex_table, group):
+        """Parses the v/f records of data[start:end] into the running state."""
+        vertex_payloads = _VERTEX_RE.findall(data, start, end)
+        if vertex_payloads:
+            vertex_table.append(parse_vertices(vertex_payloads))
+        del vertex_payloads
+
+        # Faces outside any (named) group are dropped, like the original loader
+        if group is None or not group[0]:
+            return
+        face_payloads = _FACE_RE.findall(data, start, end)
+        if face_payloads:
+            offsets, indices = parse_faces(face_payloads)
+            group[1].append(np.diff(offsets))
+            group[2].append(indices)
+
+    @staticmethod
+    def _close_group(group, vertex_table):
+        name, counts, indices = group
+        counts = np.concatenate(counts)
+        offsets = np.zeros(counts.size + 1, dtype=ID_DTYPE)
+        np.cumsum(counts, out=offsets[1:])
+        vertices, connectivity = remap_group(vertex_table.view(), np.concatenate(indices))
+        group[1], group[2] = [], []  # release the parsed indices early
+        return MeshGroup(name, vertices, offsets, connectivity)
+
+    def parse_groups(self):
+        """
+        Parses the OBJ into numpy buffers, one entry per non-empty 'g' group.
+        Returns: list of MeshGroup
+        """
+        if self.workers > 1:
+            return self.parse_groups_parallel(self.workers)
+        return list(self.iter_groups(chunk_size=None))
+
+    def parse_groups_parallel(self, workers: int):
+        """
+        Multi-process variant of parse_groups.
+        1. Scans the memory-mapped file for 'g' byte offsets.
+        2. Parses the global vertex table in line-aligned slices, concatenated in order.
+        3. Shares the table with workers as a memory-mapped .npy (no per-worker copy).
+        4. Decodes each group's faces in the same pool, merged back in file order.
+        """
+        if os.path.getsize(self.path) == 0:
+            return []
+
+        with open(self.path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            group_matches = list(_GROUP_RE.finditer(data))
+            names = [clean_group_name(m.group(1).decode("utf-8")) for m in group_matches]
+            size = len(data)
+            # Line-aligned slices for the vertex pass, a few per worker for load balance
+            cuts = [0]
+            for i in range(1, workers * 4):
+                newline = data.find(b"\n", max(size * i // (workers * 4), cuts[-1]))
+                if newline < 0:
+                    break
+                cuts.append(newline + 1)
+            cuts.append(size)
+
+        bounds = [m.end() for m in group_matches]
+        ends = [m.start() for m in group_matches[1:]] + [size]
+        jobs = [(name, start, end) for name, start, end in zip(names, bounds, ends) if name]
+
+        tmp_dir = tempfile.mkdtemp(prefix="obj_vertices_")
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                vertex_parts = pool.map(_parse_vertex_range, [self.path] * (len(cuts) - 1), cuts[:-1], cuts[1:])
+                vertex_file = os.path.join(tmp_dir, "vertices.npy")
+                np.save(vertex_file, np.concatenate(list(vertex_parts)))
 
-            actor = vtk.vtkActor()
-            actor.SetMapper(mapper)
-            actor.SetPickable(True)  # Important for picker/hover
-            actor.GetProperty().SetColor(1, 1, 1)
-            actor.GetProperty().BackfaceCullingOn()
+                futures = [pool.submit(_decode_group_range, self.path, start, end, vertex_file)
+                           for _, start, end in jobs]
+                groups = []
+                for (name, _, _), future in zip(jobs, futures):
+                    result = future.result()
+                    if result is not None:
+                        groups.append(MeshGroup(name, *result))
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        return groups
 
+    def apply_segmentation(self, groups):
+        """The load-time segmentation stage (a no-op for multi-group models or segment=False)."""
+        if not self.segment:
+            return groups
+        name_map = load_name_map(self.name_map_path) if self.name_map_path else None
+        with profiler.span("load.segment"):
+            return segment_groups(groups, self.min_fragment_faces, name_map)
+
+    def apply_preprocessing(self, groups):
+        """The preprocessing stage (point cleaning, normals); returns groups unchanged if both are off."""
+        if not (self.clean or self.normals):
+            return groups
+        with profiler.span("load.preprocess"):
+            return preprocess_groups(groups, self.clean, self.normals, self.clean_tolerance)
+
+    def load_groups(self):
+        """Returns parsed, segmented and preprocessed groups, served from the binary cache when it is fresh."""
+        if self.cache is None:
+            with profiler.span("load.parse"):
+                groups = self.parse_groups()
+            return self.apply_preprocessing(self.apply_segmentation(groups))
+
+        with profiler.span("load.cache"):
+            groups = self.cache.load(self.path, self.variant)
+        if groups is None:
+            with profiler.span("load.parse"):
+                groups = self.parse_groups()
+            groups = self.apply_preprocessing(self.apply_segmentation(groups))
+            with profiler.span("load.store"):
+                self.cache.store(self.path, groups, self.variant)
+        return groups
+
+    def load_bone_index(self, groups=None) -> BoneIndex:
+        """
+        Returns the per-bone metadata index, from the cache when it is fresh.
+        groups: already loaded groups to compute it from (default: load_groups())
+        """
+        index = self.cache.load_index(self.path, self.variant) if self.cache is not None else None
+        if index is None:
+            with profiler.span("load.index"):
+                index = BoneIndex.from_groups(self.load_groups() if groups is None else groups)
+            if self.cache is not None:
+                self.cache.store_index(self.path, index, self.variant)
+        return index
+
+    def load_instances(self, groups=None) -> InstanceTable:
+        """
+        Returns the table of rigid/mirrored copies (see model.instancing), from the
+        cache when it is fresh and was built with the same tolerance.
+        groups: already loaded groups to compute it from (default: load_groups())
+        """
+        instances = self.cache.load_instances(self.path, self.variant) if self.cache is not None else None
+        if instances is None or instances.tolerance != self.instance_tolerance:
+            with profiler.span("load.instances"):
+                groups = self.load_groups() if groups is None else groups
+                instances = InstanceTable.from_groups(groups, self.instance_tolerance)
+            if self.cache is not None:
+                self.cache.store_instances(self.path, instances, self.variant)
+        return instances
+
+    def load_grouped_obj(self):
+        """
+        Loads an OBJ file with 'g' groups.
+        Returns: (actors_list, actor_to_name_map)
+        """
+        vtk_actors = []
+        actor_to_name_map = {}
+
+        for group in self.load_groups():
+            actor = make_actor(group.to_polydata())
             vtk_actors.append(actor)
-            actor_to_name_map[actor] = name
+            actor_to_name_map[actor] = group.name
 
         return vtk_actors, actor_to_name_map
+
+    def iter_actors(self, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """Yields (actor, name) pairs while the file is still being read (raw groups: no stages applied)."""
+        for group in self.iter_groups(chunk_size):
+            yield make_actor(group.to_polydata()), group.name
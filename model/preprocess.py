@@ -0,0 +1,85 @@
+# model/preprocess.py
+import numpy as np
+
+from model.mesh_store import ID_DTYPE, VERTEX_DTYPE, MeshStore, fan_triangles
+
+
+def clean_points(groups, tolerance: float = 0.0) -> MeshStore:
+    """
+    Merges duplicate points inside each group and drops the cells that collapse
+    to fewer than 3 distinct points. Vectorised over all groups at once.
+    tolerance: 0 merges bit-identical points only; > 0 snaps to a grid of that spacing first
+    """
+    store = groups if isinstance(groups, MeshStore) else MeshStore.from_groups(groups)
+    n = len(store)
+    vertex_counts = store.vertex_ranges[:, 1] - store.vertex_ranges[:, 0]
+    vertex_groups = np.repeat(np.arange(n, dtype=ID_DTYPE), vertex_counts)
+    if tolerance > 0:
+        coords = np.round(np.asarray(store.vertices, dtype=np.float64) / tolerance).astype(ID_DTYPE)
+    else:
+        coords = np.ascontiguousarray(store.vertices).view(np.int32).astype(ID_DTYPE)
+    keys = np.column_stack([vertex_groups, coords])
+
+    # Keep the first occurrence of every point, in first-use order (so groups stay contiguous)
+    _, first_seen, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    order = np.argsort(first_seen, kind="stable")
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    new_ids = rank[inverse.ravel()]
+    kept_rows = first_seen[order]
+    new_vertex_counts = np.bincount(vertex_groups[kept_rows], minlength=n)
+    new_vertex_starts = np.cumsum(new_vertex_counts) - new_vertex_counts
+
+    # --- Drop degenerate cells: count distinct ids per cell after the merge ---
+    # (cells tile the connectivity buffer in order, so corner k belongs to cell corner_cells[k])
+    _, sizes, cell_groups, point_ids = store.global_cells()
+    corner_cells = np.repeat(np.arange(len(sizes)), sizes)
+    corner_ids = new_ids[point_ids]
+    by_cell = np.lexsort((corner_ids, corner_cells))
+    sorted_cells, sorted_ids = corner_cells[by_cell], corner_ids[by_cell]
+    new_value = np.ones(len(sorted_ids), dtype=bool)
+    new_value[1:] = (sorted_cells[1:] != sorted_cells[:-1]) | (sorted_ids[1:] != sorted_ids[:-1])
+    distinct = np.bincount(sorted_cells[new_value], minlength=len(sizes))
+    keep = distinct >= 3
+
+    kept_corners = np.repeat(keep, sizes)
+    connectivity = corner_ids[kept_corners] - new_vertex_starts[np.repeat(cell_groups, sizes)[kept_corners]]
+    return MeshStore.from_cells(
+        store.names, np.asarray(store.vertices)[kept_rows], new_vertex_counts,
+        np.bincount(cell_groups[keep], minlength=n), sizes[keep], connectivity,
+    )
+
+
+def compute_normals(groups) -> MeshStore:
+    """
+    Adds area-weighted per-vertex normals (the sum of the adjacent faces' cross
+    products, normalised), for all groups in one pass. Winding follows the OBJ.
+    """
+    store = groups if isinstance(groups, MeshStore) else MeshStore.from_groups(groups)
+    vertices = np.asarray(store.vertices, dtype=np.float64)
+    cell_starts, sizes, _, point_ids = store.global_cells()
+    _, positions = fan_triangles(cell_starts, sizes)
+    corners = point_ids[positions]
+    a, b, c = (vertices[corners[:, i]] for i in range(3))
+    # Cross product length is twice the triangle area, so big faces weigh more
+    face_normals = np.cross(b - a, c - a)
+
+    flat_corners = corners.ravel()
+    normals = np.stack([
+        np.bincount(flat_corners, weights=np.repeat(face_normals[:, i], 3), minlength=len(vertices))
+        for i in range(3)
+    ], axis=1)
+    lengths = np.linalg.norm(normals, axis=1)
+    normals[lengths > 0] /= lengths[lengths > 0, None]  # unused points keep a zero normal
+    return MeshStore(store.names, store.vertices, store.offsets, store.connectivity, store.vertex_ranges,
+                     store.offset_ranges, store.connectivity_ranges, normals.astype(VERTEX_DTYPE))
+
+
+def preprocess_groups(groups, clean: bool = True, normals: bool = True, tolerance: float = 0.0):
+    """The loader's preprocessing stage: optional point cleaning, then normals. Returns a MeshStore."""
+    store = groups if isinstance(groups, MeshStore) else MeshStore.from_groups(groups)
+    if clean:
+        store = clean_points(store, tolerance)
+    if normals:
+        store = compute_normals(store)
+    return store
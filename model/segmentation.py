@@ -0,0 +1,175 @@
+# model/segmentation.py
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from model.bone_index import BoneIndex
+from model.mesh_store import ID_DTYPE, MeshStore
+
+# Components with fewer faces than this are merged into the nearest larger one (0 = keep all)
+DEFAULT_MIN_FRAGMENT_FACES = 32
+# Optional sidecar next to the OBJ naming the segments: <model>.bones.json
+NAME_MAP_SUFFIX = ".bones.json"
+# Fragment-to-host distances are computed this many (fragment, host) pairs at a time
+MERGE_BLOCK_PAIRS = 1 << 18
+
+
+def connected_components(n_points: int, offsets, connectivity):
+    """
+    Vertex labels of the face-connected components of a mesh, via a vectorised
+    union-find: every round hooks the larger root of each edge onto the smaller
+    one (np.minimum.at) and then compresses paths by pointer jumping. A round is
+    O(edges) numpy work plus O(n) per jumping step, with O(log depth) steps for
+    the forest it built. Labels spread at least one edge per round, so rounds
+    are bounded by the largest component's diameter (O(n) on a long chain with
+    unlucky vertex order); meshes in file order typically settle in a few.
+    Returns: int64 array, labels[v] = smallest vertex id of v's component.
+    """
+    offsets = np.asarray(offsets, dtype=ID_DTYPE)
+    connectivity = np.asarray(connectivity, dtype=ID_DTYPE)
+    sizes = np.diff(offsets)
+    # A star per cell (first vertex ↔ every other vertex) connects the cell
+    edges_a = np.repeat(connectivity[offsets[:-1]], sizes)
+    edges_b = connectivity
+    keep = edges_a != edges_b
+    edges_a, edges_b = edges_a[keep], edges_b[keep]
+
+    parent = np.arange(n_points, dtype=ID_DTYPE)
+    while True:
+        root_a, root_b = parent[edges_a], parent[edges_b]
+        differ = root_a != root_b
+        if not differ.any():
+            return parent
+        root_a, root_b = root_a[differ], root_b[differ]
+        np.minimum.at(parent, np.maximum(root_a, root_b), np.minimum(root_a, root_b))
+        # Pointer jumping until every vertex points at its root
+        while True:
+            grand = parent[parent]
+            if np.array_equal(grand, parent):
+                break
+            parent = grand
+        # Only edges that still straddle two components need another round
+        edges_a, edges_b = edges_a[differ], edges_b[differ]
+
+
+def _merge_fragments(face_labels, vertices, connectivity, offsets, min_faces):
+    """Relabels faces of components smaller than min_faces to the component with the nearest centroid."""
+    components, face_component, face_counts = np.unique(face_labels, return_inverse=True, return_counts=True)
+    small = face_counts < min_faces
+    if not small.any() or small.all():
+        return face_labels
+
+    # Component centroids from their faces' first vertices (cheap, good enough to pick a host)
+    points = vertices[connectivity[offsets[:-1]]].astype(np.float64)
+    centroids = np.stack([np.bincount(face_component, weights=points[:, i]) for i in range(3)], axis=1)
+    centroids /= face_counts[:, None]
+
+    large = np.flatnonzero(~small)
+    fragments = np.flatnonzero(small)
+    host = np.arange(len(components))
+    # Nearest large centroid per fragment, in blocks so the distance matrix stays small
+    block = max(1, MERGE_BLOCK_PAIRS // len(large))
+    for start in range(0, len(fragments), block):
+        rows = fragments[start:start + block]
+        offsets_to_large = centroids[rows, None, :] - centroids[None, large, :]
+        host[rows] = large[np.argmin(np.einsum("ijk,ijk->ij", offsets_to_large, offsets_to_large), axis=1)]
+    return components[host][face_component]
+
+
+def segment_group(group, min_fragment_faces: int = DEFAULT_MIN_FRAGMENT_FACES):
+    """
+    Splits one group into its connected components (optionally merging fragments
+    below min_fragment_faces into their nearest neighbour).
+    Returns a MeshStore with one group per component, largest first, named
+    "<group name> <n>" until a name map assigns real bone names.
+    """
+    name, vertices, offsets, connectivity = group
+    offsets = np.asarray(offsets, dtype=ID_DTYPE)
+    connectivity = np.asarray(connectivity, dtype=ID_DTYPE)
+    sizes = np.diff(offsets)
+
+    labels = connected_components(len(vertices), offsets, connectivity)
+    face_labels = labels[connectivity[offsets[:-1]]]
+    if min_fragment_faces > 0:
+        face_labels = _merge_fragments(face_labels, vertices, connectivity, offsets, min_fragment_faces)
+
+    # Components ordered by face count (largest first), then first appearance
+    components, first_face, face_component, face_counts = np.unique(
+        face_labels, return_index=True, return_inverse=True, return_counts=True)
+    order = np.lexsort((first_face, -face_counts))
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    face_component = rank[face_component]
+    n_components = len(components)
+
+    # --- Faces grouped by component (stable, so faces keep their file order) ---
+    face_order = np.argsort(face_component, kind="stable")
+    sorted_sizes = sizes[face_order]
+    cell_counts = np.bincount(face_component, minlength=n_components)
+    starts = np.repeat(offsets[:-1][face_order], sorted_sizes)
+    within = np.arange(len(starts), dtype=ID_DTYPE) - np.repeat(np.cumsum(sorted_sizes) - sorted_sizes, sorted_sizes)
+    old_ids = connectivity[starts + within]
+    corner_component = np.repeat(face_component[face_order], sorted_sizes)
+
+    # --- Vertices renumbered per component, in first-use order (keyed by (component, vertex)) ---
+    keys = corner_component * len(vertices) + old_ids
+    unique_keys, first_use, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    use_order = np.argsort(first_use, kind="stable")
+    new_rank = np.empty_like(use_order)
+    new_rank[use_order] = np.arange(len(use_order))
+    packed_vertex_ids = unique_keys[use_order] % len(vertices)
+    vertex_component = unique_keys[use_order] // len(vertices)
+    vertex_counts = np.bincount(vertex_component, minlength=n_components)
+    vertex_starts = np.cumsum(vertex_counts) - vertex_counts
+    packed_connectivity = new_rank[inverse.ravel()] - vertex_starts[corner_component]
+
+    names = [f"{name} {i + 1}" for i in range(n_components)]
+    return MeshStore.from_cells(names, np.asarray(vertices)[packed_vertex_ids], vertex_counts,
+                                cell_counts, sorted_sizes, packed_connectivity)
+
+
+# --- Naming ---
+def default_name_map_path(obj_path: str) -> str:
+    return os.path.splitext(obj_path)[0] + NAME_MAP_SUFFIX
+
+
+def load_name_map(path: str):
+    """
+    Reads a name map: {"bones": [{"name": "Skull", "point": [x, y, z]}, ...]}.
+    Each name goes to the segment nearest to its landmark point, so the map
+    survives re-exports that reorder faces. Returns [(name, point)].
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+    return [(entry["name"], entry["point"]) for entry in data.get("bones", [])]
+
+
+def name_map_digest(path: str) -> str:
+    """Short content hash, part of the cache variant so editing the map re-names the segments."""
+    with open(path, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()[:12]
+
+
+def apply_name_map(store: MeshStore, name_map, bone_index) -> MeshStore:
+    """Renames segments from [(name, point)] using bone_index.nearest (unmatched segments keep their names)."""
+    for name, point in name_map:
+        row = bone_index.nearest(point)[0]
+        store.names[row] = name
+    return store
+
+
+def segment_groups(groups, min_fragment_faces: int = DEFAULT_MIN_FRAGMENT_FACES, name_map=None):
+    """
+    Load-time segmentation stage: a model that came out as a single group is
+    split into connected components; multi-group models are returned unchanged.
+    name_map: [(name, point)] from load_name_map, applied to the segments
+    """
+    groups = list(groups)
+    if len(groups) != 1:
+        return groups
+    store = segment_group(groups[0], min_fragment_faces)
+    if name_map:
+        apply_name_map(store, name_map, BoneIndex.from_groups(store))
+    return store
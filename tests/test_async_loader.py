@@ -0,0 +1,50 @@
+# tests/test_async_loader.py
+"""AsyncModelLoader on a small synthetic model, polled the way the viewer's load timer does."""
+import pytest
+
+from benchmarks.synthetic_models import write_synthetic_obj
+from model.async_loader import AsyncModelLoader
+from model.lod import LOD_REDUCTIONS
+from model.mesh_cache import MeshCache
+from model.obj_loader import ObjLoader
+
+GROUPS = 4
+
+
+@pytest.fixture
+def obj_path(tmp_path):
+    path = str(tmp_path / "synthetic.obj")
+    write_synthetic_obj(path, groups=GROUPS, vertices_per_group=200, faces_per_group=400)
+    return path
+
+
+def _drain(loader):
+    assert loader._done.wait(30)
+    groups = []
+    while not loader.finished:
+        groups.extend(loader.poll(8))
+    return groups
+
+
+@pytest.mark.parametrize("warm", [False, True])
+def test_lod_tiers_are_built_with_the_model(obj_path, tmp_path, warm):
+    cache = MeshCache(str(tmp_path / "cache"))
+    if warm:
+        _drain(AsyncModelLoader(ObjLoader(obj_path, cache=cache), lod_reductions=LOD_REDUCTIONS).start())
+
+    loader = AsyncModelLoader(ObjLoader(obj_path, cache=cache), lod_reductions=LOD_REDUCTIONS).start()
+    groups = _drain(loader)
+
+    assert loader.error is None
+    assert [group.name for group in groups] == [f"Bone {g:04d}" for g in range(GROUPS)]
+    assert len(loader.bone_index) == GROUPS and len(loader.instances) == GROUPS
+    assert len(loader.lod_tiers) == len(LOD_REDUCTIONS)
+    for tier in loader.lod_tiers:
+        assert [group.name for group in tier] == [group.name for group in groups]
+        assert all(low.n_cells < full.n_cells for low, full in zip(tier, groups))
+
+
+def test_no_lod_tiers_unless_asked(obj_path):
+    loader = AsyncModelLoader(ObjLoader(obj_path)).start()
+    _drain(loader)
+    assert loader.error is None and loader.lod_tiers is None
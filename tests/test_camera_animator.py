@@ -0,0 +1,168 @@
+# tests/test_camera_animator.py
+"""CameraAnimator driven headless: fake clock, fake interactor, tick() called directly."""
+import numpy as np
+import pytest
+import vtk
+
+from camera.camera_animator import CameraAnimator, apply_camera_state, capture_camera_state
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeInteractor:
+    """Records timers and observers instead of running an event loop."""
+
+    def __init__(self):
+        self.timers = set()
+        self.destroyed = []
+        self.observers = {}
+        self._next_id = 1
+
+    def AddObserver(self, event, callback):
+        tag = self._next_id
+        self._next_id += 1
+        self.observers[tag] = (event, callback)
+        return tag
+
+    def RemoveObserver(self, tag):
+        del self.observers[tag]
+
+    def CreateRepeatingTimer(self, interval_ms):
+        timer_id = self._next_id
+        self._next_id += 1
+        self.timers.add(timer_id)
+        return timer_id
+
+    def DestroyTimer(self, timer_id):
+        self.timers.remove(timer_id)
+        self.destroyed.append(timer_id)
+
+    def GetDesiredUpdateRate(self):
+        return 15.0
+
+    def GetStillUpdateRate(self):
+        return 0.0001
+
+
+def _state(x, view_angle=30.0):
+    return {"position": (x, 0.0, 10.0), "focal_point": (x, 0.0, 0.0), "view_up": (0.0, 1.0, 0.0),
+            "view_angle": view_angle}
+
+
+@pytest.fixture
+def scene():
+    renderer = vtk.vtkRenderer()
+    window = vtk.vtkRenderWindow()
+    window.SetOffScreenRendering(1)
+    window.AddRenderer(renderer)
+    apply_camera_state(renderer.GetActiveCamera(), _state(0.0))
+    clock = FakeClock()
+    interactor = FakeInteractor()
+    frames = []
+    animator = CameraAnimator(renderer, interactor, clock=clock, render=lambda: frames.append(clock()))
+    yield animator, clock, interactor, frames
+    window.Finalize()  # the renderer only holds a weak reference, so the window lives until here
+
+
+def _position(animator):
+    return np.array(animator.camera.GetPosition())
+
+
+@pytest.mark.parametrize("ticks", [1, 3, 60])
+def test_end_state_reached_after_duration_regardless_of_ticks(scene, ticks):
+    animator, clock, interactor, frames = scene
+    finished = []
+    animator.animate_to(_state(10.0, view_angle=20.0), duration=1.0, on_finish=lambda: finished.append(True))
+    for i in range(1, ticks + 1):
+        clock.now = i / ticks
+        animator.tick()
+
+    assert not animator.active
+    assert finished == [True]
+    assert len(frames) == ticks
+    np.testing.assert_allclose(_position(animator), (10.0, 0.0, 10.0), atol=1e-9)
+    assert animator.camera.GetViewAngle() == pytest.approx(20.0)
+
+
+def test_skipped_frames_jump_ahead(scene):
+    animator, clock, _, frames = scene
+    animator.animate_to(_state(10.0), duration=1.0, easing="linear")
+    clock.now = 0.1
+    animator.tick()
+    assert _position(animator)[0] == pytest.approx(1.0)
+
+    # One slow frame: the next tick lands where the wall clock says, not one step later
+    clock.now = 0.7
+    animator.tick()
+    assert _position(animator)[0] == pytest.approx(7.0)
+    assert animator.active and len(frames) == 2
+
+
+def test_retarget_mid_flight_starts_from_interpolated_state(scene):
+    animator, clock, _, _ = scene
+    animator.animate_to(_state(10.0), duration=1.0, easing="linear")
+    # No tick since the start: retargeting must still catch up to t = 0.5 first
+    clock.now = 0.5
+    animator.animate_to(_state(-10.0), duration=1.0, easing="linear")
+    assert animator.start_state["position"] == pytest.approx((5.0, 0.0, 10.0))
+    assert animator.start_time == 0.5
+
+    clock.now = 1.0
+    animator.tick()
+    assert _position(animator)[0] == pytest.approx(-2.5)
+    clock.now = 1.5
+    animator.tick()
+    assert _position(animator)[0] == pytest.approx(-10.0)
+    assert not animator.active
+
+
+def test_retarget_keeps_a_single_timer(scene):
+    animator, clock, interactor, _ = scene
+    animator.animate_to(_state(10.0), duration=1.0)
+    clock.now = 0.3
+    animator.animate_to(_state(5.0), duration=1.0)
+    assert interactor.timers == {animator.timer_id}
+
+
+def test_timer_destroyed_on_finish(scene):
+    animator, clock, interactor, _ = scene
+    animator.animate_to(_state(10.0), duration=1.0)
+    timer_id = animator.timer_id
+    assert interactor.timers == {timer_id}
+
+    clock.now = 2.0
+    animator.tick()
+    assert animator.timer_id is None
+    assert interactor.timers == set()
+    assert interactor.destroyed == [timer_id]
+
+
+def test_timer_destroyed_on_stop_and_camera_frozen(scene):
+    animator, clock, interactor, _ = scene
+    finished = []
+    animator.animate_to(_state(10.0), duration=1.0, easing="linear", on_finish=lambda: finished.append(True))
+    clock.now = 0.25
+    animator.stop()
+
+    assert not animator.active
+    assert interactor.timers == set() and animator.timer_id is None
+    assert capture_camera_state(animator.camera)["position"] == pytest.approx((2.5, 0.0, 10.0))
+    # A stopped animation neither finishes nor moves on later ticks
+    clock.now = 2.0
+    animator.tick()
+    assert finished == []
+    assert _position(animator)[0] == pytest.approx(2.5)
+
+
+def test_shutdown_removes_observer(scene):
+    animator, _, interactor, _ = scene
+    assert len(interactor.observers) == 1
+    animator.animate_to(_state(10.0), duration=1.0)
+    animator.shutdown()
+    assert interactor.observers == {} and interactor.timers == set()
@@ -0,0 +1,62 @@
+# tests/test_culling_manager.py
+"""Frustum culling against an offscreen window (no interactor, so no occlusion pass)."""
+import pytest
+import vtk
+
+from camera.culling_manager import CullingManager
+from ui.frame_scheduler import frame_scheduler_for
+
+
+def _sphere_actor(center):
+    sphere = vtk.vtkSphereSource()
+    sphere.SetCenter(*center)
+    mapper = vtk.vtkPolyDataMapper()
+    mapper.SetInputConnection(sphere.GetOutputPort())
+    mapper.Update()
+    actor = vtk.vtkActor()
+    actor.SetMapper(mapper)
+    return actor
+
+
+@pytest.fixture
+def scene():
+    renderer = vtk.vtkRenderer()
+    window = vtk.vtkRenderWindow()
+    window.SetOffScreenRendering(1)
+    window.SetSize(64, 64)
+    window.AddRenderer(renderer)
+    actors = [_sphere_actor((0, 0, 0)), _sphere_actor((50, 0, 0))]
+    for actor in actors:
+        renderer.AddActor(actor)
+    camera = renderer.GetActiveCamera()
+    camera.SetPosition(0, 0, 5)
+    camera.SetFocalPoint(0, 0, 0)
+    yield window, renderer, actors
+    window.Finalize()
+
+
+def test_frustum_mask(scene):
+    window, renderer, actors = scene
+    culling = CullingManager(renderer)
+    culling.add_actors(actors)
+    assert culling.frustum_mask().tolist() == [True, False]
+
+
+def test_render_hides_actors_outside_the_frustum(scene):
+    window, renderer, actors = scene
+    culling = CullingManager(renderer)
+    culling.add_actors(actors)
+    version = frame_scheduler_for(window).scene_version
+
+    window.Render()
+    assert [actor.GetVisibility() for actor in actors] == [1, 0]
+    assert [actor.GetPickable() for actor in actors] == [1, 0]
+    assert frame_scheduler_for(window).scene_version > version
+    stats = culling.report()
+    assert (stats["frames"], stats["drawn"], stats["frustum_culled"]) == (1, 1.0, 1.0)
+
+    # Turning the camera towards the second actor swaps them
+    renderer.GetActiveCamera().SetPosition(50, 0, 5)
+    renderer.GetActiveCamera().SetFocalPoint(50, 0, 0)
+    window.Render()
+    assert [actor.GetVisibility() for actor in actors] == [0, 1]
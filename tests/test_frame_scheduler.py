@@ -0,0 +1,73 @@
+# tests/test_frame_scheduler.py
+"""FrameScheduler counters against an offscreen window (no interactor: requests render right away)."""
+import pytest
+import vtk
+
+from ui.frame_scheduler import FrameScheduler
+from ui.pick_backends import HardwarePickBackend
+
+
+@pytest.fixture
+def window():
+    sphere = vtk.vtkSphereSource()
+    mapper = vtk.vtkPolyDataMapper()
+    mapper.SetInputConnection(sphere.GetOutputPort())
+    actor = vtk.vtkActor()
+    actor.SetMapper(mapper)
+    renderer = vtk.vtkRenderer()
+    renderer.AddActor(actor)
+    window = vtk.vtkRenderWindow()
+    window.SetOffScreenRendering(1)
+    window.SetSize(64, 64)
+    window.AddRenderer(renderer)
+    renderer.ResetCamera()
+    yield window
+    window.Finalize()
+
+
+def test_batch_renders_once(window):
+    scheduler = FrameScheduler(window)
+    with scheduler.batch():
+        for _ in range(5):
+            scheduler.request()
+    assert (scheduler.requested, scheduler.rendered) == (5, 1)
+
+
+def test_selection_pass_is_not_a_frame(window):
+    scheduler = FrameScheduler(window)
+    with scheduler.batch():
+        scheduler.request()
+        with scheduler.selection_pass():
+            window.Render()
+        # The pending request survives the pass
+        assert scheduler.rendered == 0 and scheduler._dirty
+    assert (scheduler.requested, scheduler.rendered) == (1, 1)
+    assert not scheduler._dirty
+
+
+def test_hardware_pick_does_not_count_as_render(window, monkeypatch):
+    scheduler = FrameScheduler(window)
+    monkeypatch.setattr("ui.pick_backends.frame_scheduler_for", lambda render_window: scheduler)
+    backend = HardwarePickBackend(window.GetRenderers().GetFirstRenderer())
+    with scheduler.batch():
+        scheduler.request()
+        actor, _ = backend.pick(32, 32)
+        assert actor is not None
+        assert scheduler.rendered == 0 and scheduler._dirty
+    assert scheduler.rendered == 1
+
+
+def test_hardware_pick_buffers_follow_scene_version(window, monkeypatch):
+    scheduler = FrameScheduler(window)
+    monkeypatch.setattr("ui.pick_backends.frame_scheduler_for", lambda render_window: scheduler)
+    renderer = window.GetRenderers().GetFirstRenderer()
+    backend = HardwarePickBackend(renderer)
+    captures = []
+    monkeypatch.setattr(backend.selector, "CaptureBuffers", lambda: captures.append(1) or True, raising=False)
+    backend.pick(32, 32)
+    backend.pick(30, 30)
+    assert len(captures) == 1
+
+    scheduler.scene_changed()
+    backend.pick(32, 32)
+    assert len(captures) == 2
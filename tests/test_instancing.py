@@ -0,0 +1,72 @@
+# tests/test_instancing.py
+"""InstanceTable on a synthetic model of repeated bones, and applying it to existing actors."""
+import numpy as np
+import pytest
+from vtk.util import numpy_support
+
+from benchmarks.synthetic_models import write_repeated_obj
+from model.obj_loader import ObjLoader, instance_actors, make_actor, make_actors
+from ui.pick_backends import CellPickBackend
+
+GROUPS, COPIES = 3, 2
+
+
+@pytest.fixture
+def repeated(tmp_path):
+    obj_path = str(tmp_path / "repeated.obj")
+    write_repeated_obj(obj_path, groups=GROUPS, copies=COPIES, vertices_per_group=60, faces_per_group=100)
+    loader = ObjLoader(obj_path)
+    groups = loader.load_groups()
+    return groups, loader.load_instances(groups)
+
+
+def _world_points(actor):
+    """The actor's mesh vertices placed by its matrix (UserMatrix included)."""
+    points = numpy_support.vtk_to_numpy(actor.GetMapper().GetInput().GetPoints().GetData()).astype(np.float64)
+    matrix = np.array([[actor.GetMatrix().GetElement(i, j) for j in range(4)] for i in range(4)])
+    return points @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+def _assert_same_points(actual, expected, tolerance=1e-3):
+    """Same point set in any order."""
+    assert actual.shape == expected.shape
+    distances = np.linalg.norm(actual[:, None, :] - expected[None, :, :], axis=2)
+    assert distances.min(axis=1).max() < tolerance
+
+
+def test_copies_are_found(repeated):
+    groups, instances = repeated
+    assert len(instances) == GROUPS * (COPIES + 1)
+    assert list(instances.prototype_rows) == [g * (COPIES + 1) for g in range(GROUPS)]
+    # write_repeated_obj alternates mirrored and rigid copies
+    assert instances.is_mirrored(1) and not instances.is_mirrored(2)
+
+
+def test_instanced_actors_keep_each_bones_placement(repeated):
+    groups, instances = repeated
+    plain = [make_actor(group.to_polydata()) for group in groups]
+    instanced = make_actors([group.to_polydata() for group in groups], instances)
+
+    assert len({actor.GetMapper() for actor in instanced}) == 2 * GROUPS  # prototype + its mirrored twin
+    for own, shared in zip(plain, instanced):
+        _assert_same_points(_world_points(shared), _world_points(own))
+
+
+def test_instance_actors_matches_make_actors(repeated):
+    groups, instances = repeated
+    polydata = [group.to_polydata() for group in groups]
+    actors = [make_actor(data) for data in polydata]
+    backend = CellPickBackend(renderer=None)
+    backend.register_actors(actors)
+    assert len(backend._data_locators) == len(actors)
+
+    changed = instance_actors(actors, polydata, instances)
+    assert changed == [actors[row] for row in instances.instance_rows]
+    reference = make_actors(polydata, instances)
+    assert len({actor.GetMapper() for actor in actors}) == len({actor.GetMapper() for actor in reference})
+    for actor, expected in zip(actors, reference):
+        np.testing.assert_allclose(_world_points(actor), _world_points(expected), atol=1e-9)
+
+    # Re-registering moves the copies onto shared locators and drops the ones left unused
+    backend.register_actors(changed)
+    assert len(backend._data_locators) == 2 * GROUPS
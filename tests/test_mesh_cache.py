@@ -0,0 +1,72 @@
+# tests/test_mesh_cache.py
+import hashlib
+import os
+
+import pytest
+
+from model import mesh_cache
+from model.mesh_cache import MeshCache
+from model.obj_loader import ObjLoader
+
+SMALL_OBJ = """\
+v 0 0 0
+v 1 0 0
+v 1 1 0
+v 0 1 0
+g Patella_L
+f 1 2 3
+f 1 3 4
+g Patella_R
+f 4 3 2
+"""
+
+
+@pytest.fixture
+def hash_calls(monkeypatch):
+    """Paths passed to the real SHA-256 pass, in call order."""
+    calls = []
+    sha256 = mesh_cache._sha256
+    monkeypatch.setattr(mesh_cache, "_digest_memo", {})
+    monkeypatch.setattr(mesh_cache, "_sha256", lambda path: calls.append(path) or sha256(path))
+    return calls
+
+
+def test_warm_start_hashes_source_once(tmp_path, hash_calls):
+    obj_path = str(tmp_path / "small.obj")
+    with open(obj_path, "w", encoding="utf-8") as file:
+        file.write(SMALL_OBJ)
+    cache = MeshCache(str(tmp_path / "cache"))
+    loader = ObjLoader(obj_path, cache=cache)
+    groups = loader.load_groups()
+    loader.load_bone_index(groups)
+    loader.load_instances(groups)
+    # A new process: nothing memoized yet
+    mesh_cache._digest_memo.clear()
+    hash_calls.clear()
+
+    # Mesh entry, bone index and instance table all validate against the one digest
+    store = cache.load(obj_path, loader.variant)
+    assert store is not None and len(store) == 2
+    assert cache.load_index(obj_path, loader.variant) is not None
+    assert cache.load_instances(obj_path, loader.variant) is not None
+    assert hash_calls == [os.path.abspath(obj_path)]
+
+
+def test_modified_source_is_rehashed(tmp_path, hash_calls):
+    obj_path = str(tmp_path / "small.obj")
+    with open(obj_path, "w", encoding="utf-8") as file:
+        file.write(SMALL_OBJ)
+    cache = MeshCache(str(tmp_path / "cache"))
+    cache.store(obj_path, ObjLoader(obj_path).parse_groups())
+    assert cache.is_valid(obj_path)
+    old_digest = mesh_cache.file_digest(obj_path)
+
+    # Same size, different content, newer mtime
+    modified = SMALL_OBJ.replace("f 4 3 2", "f 2 3 4")
+    with open(obj_path, "w", encoding="utf-8") as file:
+        file.write(modified)
+    stat = os.stat(obj_path)
+    os.utime(obj_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert not cache.is_valid(obj_path)
+    assert mesh_cache.file_digest(obj_path) == hashlib.sha256(modified.encode("utf-8")).hexdigest() != old_digest
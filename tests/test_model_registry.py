@@ -0,0 +1,62 @@
+# tests/test_model_registry.py
+import os
+
+import pytest
+
+from model.mesh_cache import MeshCache
+from model.model_registry import DEFAULT_MODELS, ModelRegistry
+from model.obj_loader import ObjLoader
+
+QUAD_OBJ = """\
+v 0 0 0
+v 1 0 0
+v 1 1 0
+v 0 1 0
+v 0 0 1
+g Sternum
+f 1 2 3 4
+g Hyoid
+f 1 2 5
+"""
+
+
+@pytest.fixture
+def obj_path(tmp_path):
+    path = tmp_path / "quad.obj"
+    path.write_text(QUAD_OBJ, encoding="utf-8")
+    return str(path)
+
+
+def test_default_models_exist():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    for path in DEFAULT_MODELS.values():
+        assert os.path.exists(os.path.join(root, path)), path
+
+
+def test_name_and_paths_share_one_entry(obj_path, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    registry = ModelRegistry(cache=MeshCache(str(tmp_path / "cache")), models={"quad": obj_path})
+    model = registry.get("quad")
+    assert registry.get("quad.obj") is model
+    assert registry.get(obj_path) is model
+    assert registry.is_loaded("quad") and registry.is_loaded("quad.obj")
+    assert len(registry.loaded) == 1
+
+    registry.evict("quad.obj")
+    assert not registry.is_loaded("quad")
+
+
+def test_memory_estimate_follows_the_drawn_buffers(obj_path):
+    groups = ObjLoader(obj_path, segment=False, normals=False).load_groups()
+    with_normals = ObjLoader(obj_path, segment=False, normals=True).load_groups()
+    registry = ModelRegistry(memory_budget=1 << 30)
+
+    plain = registry.adopt(obj_path, groups)
+    # 4 + 3 positions; the quad fans into 2 triangles, plus 1 triangle
+    assert plain.gpu_bytes == 7 * 12 + 9 * 4
+    assert plain.instances is None
+
+    shaded = registry.adopt(obj_path, with_normals)
+    assert shaded.gpu_bytes == 7 * 24 + 9 * 4
+    assert shaded.cpu_bytes == plain.cpu_bytes + 7 * 12
+    assert len(registry.loaded) == 1
@@ -0,0 +1,48 @@
+# tests/test_obj_loader_memory.py
+"""
+Peak memory of ObjLoader.iter_groups against the bound in its docstring. The
+multi-hundred-MB case is opt-in: RUN_SLOW_TESTS=1 python -m pytest tests
+"""
+import os
+import tracemalloc
+
+import pytest
+
+from benchmarks.synthetic_models import write_synthetic_obj
+from model.obj_loader import ObjLoader
+
+# Allocations the docstring bound does not itemise (regex/match objects, the yielded group)
+BOUND_SLACK_BYTES = 4 << 20
+
+
+def _iter_groups_peak(obj_path, chunk_size):
+    """Peak traced bytes while streaming every group and dropping it right away."""
+    tracemalloc.start()
+    try:
+        n_groups = sum(1 for _ in ObjLoader(obj_path).iter_groups(chunk_size))
+        return n_groups, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _documented_bound(chunk_size, n_vertices, faces_per_group):
+    return 4 * chunk_size + 36 * n_vertices + 16 * 4 * faces_per_group + BOUND_SLACK_BYTES
+
+
+@pytest.mark.parametrize("groups, vertices_per_group, faces_per_group, chunk_size", [
+    (40, 2000, 4000, 256 << 10),
+    pytest.param(200, 20000, 40000, 8 << 20, marks=pytest.mark.skipif(
+        not os.environ.get("RUN_SLOW_TESTS"), reason="writes a ~300 MB OBJ; set RUN_SLOW_TESTS=1")),
+])
+def test_iter_groups_peak_memory_is_bounded(tmp_path, groups, vertices_per_group, faces_per_group, chunk_size):
+    obj_path = str(tmp_path / "synthetic.obj")
+    n_vertices, _ = write_synthetic_obj(obj_path, groups, vertices_per_group, faces_per_group)
+    file_size = os.path.getsize(obj_path)
+
+    n_groups, peak = _iter_groups_peak(obj_path, chunk_size)
+
+    assert n_groups == groups
+    bound = _documented_bound(chunk_size, n_vertices, faces_per_group)
+    assert peak <= bound, f"peak {peak / 2**20:.1f} MB > bound {bound / 2**20:.1f} MB"
+    # The point of streaming: the file is never held whole
+    assert peak < file_size
@@ -0,0 +1,125 @@
+# tests/test_obj_loader_parity.py
+"""
+ObjLoader and skeleton_model.load_obj_groups against the frozen legacy loader
+(benchmarks/legacy_loader.py) on a small synthetic OBJ.
+"""
+import numpy as np
+import pytest
+from vtk.util import numpy_support
+
+from benchmarks.legacy_loader import load_obj_groups as legacy_load_obj_groups
+from benchmarks.synthetic_models import write_synthetic_obj
+from model.obj_loader import ObjLoader, build_polydata, make_actor
+from skeleton_model import load_obj_groups
+
+# Covers slash indices, quads, a group whose name cleans to nothing, a bare 'g'
+# record, repeated names, the male/female suffix and group-local vertex order
+PARITY_OBJ = """\
+# synthetic parity model
+v 0 0 0
+v 1 0 0
+v 1 1 0
+v 0 1 0
+v 0 0 1
+v 1 0 1
+v 1 1 1
+v 0 1 1
+vt 0 0
+vn 0 0 1
+g Femur_L_female_human_skeleton
+f 1/1/1 2/1/1 3/1/1
+f 1//1 3//1 4//1
+g .003
+f 5 6 7
+g Rib.012
+f 8 7 6 5
+f 2/1 6/1 7/1 3/1
+g
+f 4 3 7
+g Rib.013
+f 7 6 2
+v 2 2 2
+g Skull
+f 9 1 5
+f 4 8 9 1
+"""
+
+
+def _summary(actors, name_map):
+    """Per actor: (name, points (n, 3), cells as tuples of point ids, point data array names)."""
+    rows = []
+    for actor in actors:
+        polydata = actor.GetMapper().GetInput()
+        points = numpy_support.vtk_to_numpy(polydata.GetPoints().GetData()).astype(np.float64)
+        polys = polydata.GetPolys()
+        offsets = numpy_support.vtk_to_numpy(polys.GetOffsetsArray())
+        connectivity = numpy_support.vtk_to_numpy(polys.GetConnectivityArray())
+        cells = [tuple(connectivity[offsets[i]:offsets[i + 1]]) for i in range(len(offsets) - 1)]
+        point_data = polydata.GetPointData()
+        arrays = tuple(point_data.GetArrayName(i) for i in range(point_data.GetNumberOfArrays()))
+        rows.append((name_map[actor], points, cells, arrays))
+    return rows
+
+
+@pytest.fixture
+def parity_obj(tmp_path):
+    path = tmp_path / "parity.obj"
+    path.write_text(PARITY_OBJ, encoding="utf-8")
+    return str(path)
+
+
+def _assert_same_groups(actual, expected):
+    assert [row[0] for row in actual] == [row[0] for row in expected]
+    for (name, points, cells, arrays), (_, expected_points, expected_cells, expected_arrays) in zip(actual, expected):
+        assert points.shape == expected_points.shape, name
+        assert len(cells) == len(expected_cells), name
+        np.testing.assert_array_equal(points, expected_points, err_msg=name)
+        assert cells == expected_cells, name
+        assert arrays == expected_arrays, name
+
+
+def test_load_grouped_obj_matches_legacy_loader(parity_obj):
+    expected = _summary(*legacy_load_obj_groups(parity_obj))
+    actual = _summary(*ObjLoader(parity_obj, segment=False, normals=False).load_grouped_obj())
+
+    # ".003" cleans to an empty name and is dropped; the bare 'g' keeps the open group
+    assert len(expected) == 4
+    assert [row[0] for row in expected][1:] == ["Rib", "Rib", "Skull"]
+    _assert_same_groups(actual, expected)
+
+
+@pytest.mark.parametrize("chunk_size", [7, 64])
+def test_streamed_groups_match_legacy_loader(parity_obj, chunk_size):
+    # Small chunks make group, vertex and face records straddle chunk boundaries
+    expected = _summary(*legacy_load_obj_groups(parity_obj))
+    name_map = {make_actor(build_polydata(vertices, offsets, connectivity)): name
+                for name, vertices, offsets, connectivity in ObjLoader(parity_obj).iter_groups(chunk_size)}
+    _assert_same_groups(_summary(list(name_map), name_map), expected)
+
+
+
+def _assert_same_buffers(actual, expected):
+    assert [group.name for group in actual] == [group.name for group in expected]
+    for group, expected_group in zip(actual, expected):
+        np.testing.assert_array_equal(group.vertices, expected_group.vertices, err_msg=group.name)
+        np.testing.assert_array_equal(group.offsets, expected_group.offsets, err_msg=group.name)
+        np.testing.assert_array_equal(group.connectivity, expected_group.connectivity, err_msg=group.name)
+
+
+def test_parallel_decode_matches_serial(parity_obj, tmp_path):
+    synthetic_obj = str(tmp_path / "synthetic.obj")
+    write_synthetic_obj(synthetic_obj, groups=12, vertices_per_group=50, faces_per_group=80)
+    for path in (parity_obj, synthetic_obj):
+        expected = ObjLoader(path).parse_groups()
+        _assert_same_buffers(ObjLoader(path, workers=2).parse_groups(), expected)
+
+
+def test_skeleton_model_load_obj_groups_matches_both_loaders(parity_obj):
+    expected = _summary(*legacy_load_obj_groups(parity_obj))
+    loader_result = _summary(*ObjLoader(parity_obj, segment=False, normals=False).load_grouped_obj())
+
+    # First call fills the MeshCache next to the model, the second is served from it
+    for _ in range(2):
+        actual = _summary(*load_obj_groups(parity_obj))
+        _assert_same_groups(actual, expected)
+        _assert_same_groups(actual, loader_result)
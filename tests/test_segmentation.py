@@ -0,0 +1,59 @@
+# tests/test_segmentation.py
+"""Connected-component segmentation of single-group models, including fragment merging."""
+import numpy as np
+import pytest
+
+from model import segmentation
+from model.segmentation import connected_components, segment_group
+
+
+def _strip(n_quads, origin):
+    """A triangle strip of 2 * n_quads faces starting at origin: (vertices, faces)."""
+    xs = np.arange(n_quads + 1, dtype=np.float32)
+    vertices = np.concatenate([np.stack([xs, np.zeros_like(xs), np.zeros_like(xs)], axis=1),
+                               np.stack([xs, np.ones_like(xs), np.zeros_like(xs)], axis=1)]) + origin
+    top = n_quads + 1
+    faces = [(i, i + 1, top + i) for i in range(n_quads)] + [(i + 1, top + i + 1, top + i) for i in range(n_quads)]
+    return vertices, np.array(faces)
+
+
+def _group(*parts):
+    """One group ("model") holding every (vertices, faces) part, vertex ids offset per part."""
+    vertices, faces, base = [], [], 0
+    for part_vertices, part_faces in parts:
+        vertices.append(part_vertices)
+        faces.append(part_faces + base)
+        base += len(part_vertices)
+    faces = np.concatenate(faces)
+    offsets = np.arange(len(faces) + 1, dtype=np.int64) * 3
+    return "model", np.concatenate(vertices), offsets, faces.ravel().astype(np.int64)
+
+
+def test_chain_in_reverse_order_is_one_component():
+    n = 1000
+    path = np.arange(n)[::-1]
+    connectivity = np.stack([path[:-1], path[1:]], axis=1).ravel()
+    offsets = np.arange(n, dtype=np.int64) * 2
+    labels = connected_components(n, offsets, connectivity)
+    assert (labels == 0).all()
+
+
+@pytest.fixture
+def two_bones_and_a_chip():
+    # 40-face bone at x=0, 20-face bone at x=100, and a 2-face chip just past the second bone
+    return _group(_strip(20, (0, 0, 0)), _strip(10, (100, 0, 0)), _strip(1, (112, 0, 0)))
+
+
+def test_components_largest_first(two_bones_and_a_chip):
+    store = segment_group(two_bones_and_a_chip, min_fragment_faces=0)
+    assert [group.n_cells for group in store] == [40, 20, 2]
+    assert store.names == ["model 1", "model 2", "model 3"]
+    assert [group.n_points for group in store] == [42, 22, 4]
+
+
+@pytest.mark.parametrize("block_pairs", [1, segmentation.MERGE_BLOCK_PAIRS])
+def test_fragment_merges_into_nearest_component(two_bones_and_a_chip, monkeypatch, block_pairs):
+    monkeypatch.setattr(segmentation, "MERGE_BLOCK_PAIRS", block_pairs)
+    store = segment_group(two_bones_and_a_chip, min_fragment_faces=10)
+    assert [group.n_cells for group in store] == [40, 22]
+    assert np.asarray(store[1].vertices)[:, 0].max() == pytest.approx(113)
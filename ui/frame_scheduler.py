@@ -0,0 +1,123 @@
+# ui/frame_scheduler.py
+import time
+from contextlib import contextmanager
+
+DEFAULT_MAX_FPS = 60.0
+
+
+class FrameScheduler:
+    """
+    Render-on-demand scheduler shared by everything drawing into one window.
+
+    Components call request() to mark the scene dirty instead of calling Render().
+    At most one Render() happens per display frame: a request in a free frame slot
+    renders right away, later requests in the same slot are folded into a single
+    one-shot timer at the start of the next slot. Nothing is scheduled while the
+    scene is clean, so an idle viewer does no work at all.
+    Inside a batch() block requests only mark the window dirty; the outermost
+    block requests once when it exits.
+    Renders inside a selection_pass() block (vtkHardwareSelector id passes) are
+    not frames: they neither count nor satisfy a pending request.
+    `scene_version` is bumped by scene_changed() whenever actors are shown,
+    hidden or re-meshed, so caches of rendered ids can key on it cheaply.
+
+    Counters: `requested` (request() calls) vs `rendered` (actual window renders,
+    including the ones VTK's interactor styles trigger themselves).
+    """
+
+    def __init__(self, render_window, max_fps: float = DEFAULT_MAX_FPS, clock=time.perf_counter):
+        self.render_window = render_window
+        self.frame_interval = 1.0 / max_fps
+        self.clock = clock
+        self._depth = 0
+        self._selection_depth = 0
+        self._dirty = False
+        self._last_render = float("-inf")
+        self._timer_id = None
+        self._timer_interactor = None
+
+        self.requested = 0
+        self.rendered = 0
+        self.scene_version = 0
+        render_window.AddObserver("EndEvent", self._on_render_end)
+
+    # --- Requests ---
+    def request(self):
+        self.requested += 1
+        self._dirty = True
+        if self._depth or self._timer_id is not None:
+            return  # flushed when the batch exits / the pending frame fires
+
+        wait = self._last_render + self.frame_interval - self.clock()
+        if wait <= 0 or not self._schedule(wait):
+            self.flush()
+
+    def flush(self):
+        """Renders now if anything is dirty."""
+        if self._dirty:
+            self.render_window.Render()
+
+    @contextmanager
+    def batch(self):
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+            if self._depth == 0 and self._dirty:
+                self.requested -= 1  # the batch's own request isn't a new one
+                self.request()
+
+    @contextmanager
+    def selection_pass(self):
+        """Wraps offscreen selection renders; a frame still owed afterwards is re-requested."""
+        self._selection_depth += 1
+        try:
+            yield self
+        finally:
+            self._selection_depth -= 1
+            if self._selection_depth == 0 and self._depth == 0 and self._dirty and self._timer_id is None:
+                self.requested -= 1  # still the request made before the pass
+                self.request()
+
+    def scene_changed(self):
+        """Records that the drawn actors changed (culling, LOD swaps); does not request a frame."""
+        self.scene_version += 1
+
+    # --- Deferred frames ---
+    def _schedule(self, wait: float) -> bool:
+        """Arms a one-shot timer for the next frame slot. False if no running interactor."""
+        interactor = self.render_window.GetInteractor()
+        if interactor is None or not interactor.GetInitialized():
+            return False
+        if interactor is not self._timer_interactor:
+            interactor.AddObserver("TimerEvent", self._on_timer)
+            self._timer_interactor = interactor
+        self._timer_id = interactor.CreateOneShotTimer(max(1, int(wait * 1000)))
+        return bool(self._timer_id)
+
+    def _on_timer(self, obj, event):
+        if self._timer_id is not None and obj.GetTimerEventId() == self._timer_id:
+            self._timer_id = None
+            self.flush()
+
+    def _on_render_end(self, obj, event):
+        if self._selection_depth:
+            return
+        self._dirty = False
+        self._last_render = self.clock()
+        self.rendered += 1
+
+    def report(self):
+        saved = self.requested - self.rendered
+        print(f"[FrameScheduler] {self.requested} render requests → {self.rendered} renders ({saved} saved)")
+
+
+_schedulers = {}
+
+
+def frame_scheduler_for(render_window) -> FrameScheduler:
+    """Returns the shared FrameScheduler of a render window (one per window)."""
+    if render_window not in _schedulers:
+        _schedulers[render_window] = FrameScheduler(render_window)
+    return _schedulers[render_window]
@@ -1,19 +1,27 @@
-import vtk
-from viewer_app import SkeletonViewerApp
+# Only the VTK modules the menu needs; the viewer stack is imported on demand
+from vtkmodules.vtkRenderingCore import vtkTextActor
+import vtkmodules.vtkInteractionStyle  # noqa: F401  (default interactor style)
+import vtkmodules.vtkRenderingFreeType  # noqa: F401  (text rendering)
+import vtkmodules.vtkRenderingOpenGL2  # noqa: F401  (OpenGL render window backend)
+
 from language.language import t
+from ui.scene_manager import Scene, SceneManager
 from ui.settings_menu_point import SettingsMenu
+from utils.prewarm import Prewarmer
 
+# The shipped model (same as skeleton_model.py and the registry's "skeleton_female")
+SKELETON_MODEL_PATH = "models/female_human_skeleton.obj"
 
-class MainMenu:
-    def __init__(self):
-        # Renderer setup
-        self.renderer = vtk.vtkRenderer()
-        self.render_window = vtk.vtkRenderWindow()
-        self.render_window.AddRenderer(self.renderer)
-        self.render_window.FullScreenOn()  # fullscreen
 
-        self.interactor = vtk.vtkRenderWindowInteractor()
-        self.interactor.SetRenderWindow(self.render_window)
+class MainMenu(Scene):
+    def __init__(self, scene_manager=None, viewer_options=None):
+        """viewer_options: extra SkeletonViewerApp keyword arguments (e.g. lod, target_frame_time)"""
+        # One fullscreen window for the whole app; menu, settings and viewer are scenes in it
+        super().__init__(scene_manager or SceneManager())
+        self.manager.add("menu", self)
+        self.viewer_options = dict(viewer_options or {})
+        self.models = None  # ModelRegistry, created with the first 3D module
+        self.prewarmer = Prewarmer(SKELETON_MODEL_PATH)
 
         # Menu items
         self.menu_items = [
@@ -25,7 +33,9 @@ class MainMenu:
         self.text_actors = []
         self.highlighted = None
 
-        # Build menu and interaction
+    def on_enter(self):
+        # Rebuilt on every visit: the language may have changed in the settings
+        self.highlighted = None
         self._build_menu()
         self._setup_interaction()
 
@@ -50,7 +60,7 @@ class MainMenu:
         self.text_actors.clear()
 
         for i, label in enumerate(self.menu_items):
-            text_actor = vtk.vtkTextActor()
+            text_actor = vtkTextActor()
             text_actor.SetInput(label)
             prop = text_actor.GetTextProperty()
             prop.SetFontSize(font_size)
@@ -62,11 +72,11 @@ class MainMenu:
             self.text_actors.append(text_actor)
 
         self.renderer.SetBackground(0.05, 0.05, 0.07)
-        self.render_window.Render()
+        self.scheduler.request()
 
     def _setup_interaction(self):
-        self.interactor.AddObserver("MouseMoveEvent", self._on_hover)
-        self.interactor.AddObserver("LeftButtonPressEvent", self._on_click)
+        self.listen("MouseMoveEvent", self._on_hover)
+        self.listen("LeftButtonPressEvent", self._on_click)
 
     def _pick_text_actor(self, x, y):
         """Adaptive click detection based on font size and display position"""
@@ -94,39 +104,41 @@ class MainMenu:
             if picked:
                 picked.GetTextProperty().SetColor(0.3, 0.8, 1.0)
             self.highlighted = picked
-            self.render_window.Render()
+            self.scheduler.request()
 
     def _on_click(self, obj, event):
         x, y = self.interactor.GetEventPosition()
         picked = self._pick_text_actor(x, y)
         if picked:
             label = self.menu_items[self.text_actors.index(picked)]
-            self.handle_selection(label)
+            with self.scheduler.batch():
+                self.handle_selection(label)
 
     def handle_selection(self, label):
         print(f"[Menu] Selected: {label}")
         if label == t("menu_quit"):
-            self.interactor.TerminateApp()
+            self.manager.quit()
         elif label == t("menu_skeleton"):  # <- use translation
             self._launch_skeleton_viewer()
         elif label == t("menu_muscle"):  # <- use translation
             print("Muscle Anatomy viewer not implemented yet.")
         elif label == t("menu_settings"):  # <- use translation
-            def back_to_main():
-                for actor in self.renderer.GetActors2D():
-                    self.renderer.RemoveActor(actor)
-                self._build_menu()
-                self._setup_interaction()
-
-            SettingsMenu(renderer=self.renderer, render_window=self.render_window, on_exit_callback=back_to_main)
+            if "settings" not in self.manager.scenes:
+                SettingsMenu(self.manager, on_exit_callback=lambda: self.manager.switch_soon("menu"))
+            self.manager.switch_soon("settings")
 
     def _launch_skeleton_viewer(self):
-        # Close menu first
-        self.interactor.TerminateApp()
-        # Launch skeleton viewer in a new window
-        viewer = SkeletonViewerApp("models/male_human_skeleton.obj")
-        viewer.run()
+        # Created once; later visits reuse the loaded model (imports are warm if the pre-warm finished)
+        if "viewer" not in self.manager.scenes:
+            from model.model_registry import ModelRegistry
+            from viewer_app import SkeletonViewerApp
+            self.models = self.models or ModelRegistry()
+            SkeletonViewerApp(SKELETON_MODEL_PATH, scene_manager=self.manager, registry=self.models,
+                              **self.viewer_options)
+        self.manager.switch_soon("viewer")
 
     def run(self):
-        self.render_window.Render()
-        self.interactor.Start()
+        self.manager.switch("menu")
+        # Menu is on screen → warm up the viewer while the user decides
+        self.prewarmer.start()
+        self.manager.start()
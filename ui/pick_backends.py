@@ -0,0 +1,128 @@
+# ui/pick_backends.py
+import vtk
+
+from ui.frame_scheduler import frame_scheduler_for
+
+
+def build_cell_locator(polydata):
+    """Static cell locator (uniform bins) for fast ray/cell intersection on one mesh."""
+    locator = vtk.vtkStaticCellLocator()
+    locator.SetDataSet(polydata)
+    locator.BuildLocator()
+    return locator
+
+
+class CellPickBackend:
+    """
+    CPU ray cast (vtkCellPicker).
+    Registered actors get a cell locator, so each pick costs O(log cells) per actor
+    whose bounding box the ray hits (vtkPicker already skips actors whose bounds it misses).
+    """
+
+    def __init__(self, renderer, use_locators=True):
+        self.renderer = renderer
+        self.use_locators = use_locators
+        self.locators = {}  # actor → locator
+        self._data_locators = {}  # polydata address → locator (instanced bones share one)
+        self.picker = vtk.vtkCellPicker()
+        self.picker.SetTolerance(0.0005)
+
+    def register_actors(self, actors):
+        """
+        Builds and attaches locators for newly loaded actors, or for actors whose
+        mesh changed (e.g. switched to an instanced prototype's mapper).
+        """
+        if not self.use_locators:
+            return
+        rekeyed = False
+        for actor in actors:
+            polydata = actor.GetMapper().GetInput()
+            if polydata is None:
+                continue
+            # Keyed on the C++ object: GetInput() returns a fresh wrapper each call, so id() is reused
+            key = polydata.GetAddressAsString("vtkPolyData")
+            locator = self._data_locators.get(key)
+            if locator is not None and self.locators.get(actor) is locator:
+                continue
+            rekeyed = rekeyed or actor in self.locators
+            if locator is None:
+                locator = build_cell_locator(polydata)
+                self._data_locators[key] = locator
+                self.picker.AddLocator(locator)
+            self.locators[actor] = locator
+        if rekeyed:
+            self._drop_unused_locators()
+
+    def _drop_unused_locators(self):
+        used = set(self.locators.values())
+        for key, locator in list(self._data_locators.items()):
+            if locator not in used:
+                self.picker.RemoveLocator(locator)
+                del self._data_locators[key]
+
+    def pick(self, x, y):
+        """Returns (actor, cell_id) under display position (x, y), or (None, -1)."""
+        self.picker.Pick(x, y, 0, self.renderer)
+        return self.picker.GetActor(), self.picker.GetCellId()
+
+    def invalidate(self):
+        pass
+
+
+class HardwarePickBackend:
+    """
+    GPU picking through vtkHardwareSelector.
+    The actor/cell id buffers are rendered once and cached; each hover is then a
+    pixel lookup. The cache is rebuilt lazily when the camera or window size
+    changes, when the window's FrameScheduler reports a scene change (culling,
+    LOD swaps), or after invalidate(), e.g. once new actors are registered.
+    """
+
+    def __init__(self, renderer):
+        self.renderer = renderer
+        self.selector = vtk.vtkHardwareSelector()
+        self.selector.SetRenderer(renderer)
+        self.selector.SetFieldAssociation(vtk.vtkDataObject.FIELD_ASSOCIATION_CELLS)
+        self.scheduler = frame_scheduler_for(renderer.GetRenderWindow())
+        self._buffer_key = None
+
+    def register_actors(self, actors):
+        self.invalidate()
+
+    def _scene_key(self):
+        # O(1) per hover: visibility changes are counted by the scheduler, not re-read per actor
+        return (self.scheduler.scene_version, self.renderer.GetActiveCamera().GetMTime(),
+                tuple(self.renderer.GetRenderWindow().GetSize()))
+
+    def _ensure_buffers(self):
+        key = self._scene_key()
+        if key == self._buffer_key:
+            return
+        width, height = self.renderer.GetRenderWindow().GetSize()
+        self.selector.SetArea(0, 0, width - 1, height - 1)
+        with self.scheduler.selection_pass():
+            self.selector.CaptureBuffers()
+        # Capturing renders the scene, which may touch the camera (clipping range): re-read the key
+        self._buffer_key = self._scene_key()
+
+    def pick(self, x, y):
+        """Returns (actor, cell_id) under display position (x, y), or (None, -1)."""
+        self._ensure_buffers()
+        selection = self.selector.GenerateSelection(x, y, x, y)
+        if selection is None or selection.GetNumberOfNodes() == 0:
+            return None, -1
+
+        node = selection.GetNode(0)
+        actor = node.GetProperties().Get(vtk.vtkSelectionNode.PROP())
+        ids = node.GetSelectionList()
+        cell_id = int(ids.GetTuple1(0)) if ids is not None and ids.GetNumberOfTuples() else -1
+        return actor, cell_id
+
+    def invalidate(self):
+        self._buffer_key = None
+
+
+PICK_BACKENDS = {
+    "cpu": CellPickBackend,
+    "hardware": HardwarePickBackend,
+}
@@ -1,44 +1,144 @@
 # ui/picker_handler.py
-import vtk
+import time
+
+from ui.pick_backends import PICK_BACKENDS
+from ui.frame_scheduler import frame_scheduler_for
+from utils.profiler import profiler
+
+# Hover coalescing: at most this many hover picks per second...
+MAX_PICK_RATE = 60.0
+# ...and none while the cursor stays within this many pixels of the last pick
+MIN_MOVE_PIXELS = 2
 
 
 class PickerHandler:
-    def __init__(self, interactor, renderer, actor_name_map, text_overlay_manager, camera_controller):
+    def __init__(self, interactor, renderer, actor_name_map, text_overlay_manager, camera_controller,
+                 merged_model=None, pick_backend="cpu",
+                 max_pick_rate=MAX_PICK_RATE, min_move_pixels=MIN_MOVE_PIXELS):
+        """
+        actor_name_map: {actor: bone name} or ActorRegistry ({MergedBone: bone name} in merged mode)
+        merged_model: MergedModel when the skeleton is rendered as a single actor
+        pick_backend: "cpu" (vtkCellPicker ray cast) or "hardware" (cached vtkHardwareSelector id buffer)
+        max_pick_rate / min_move_pixels: hover coalescing limits
+        """
         self.interactor = interactor
         self.renderer = renderer
         self.actor_name_map = actor_name_map
         self.text_overlay = text_overlay_manager
         self.camera_controller = camera_controller
+        self.merged_model = merged_model
         self.previous_actor = None
+        self.scheduler = frame_scheduler_for(renderer.GetRenderWindow())
+
+        # --- Hover coalescing state ---
+        self.min_pick_interval = 1.0 / max_pick_rate if max_pick_rate else 0.0
+        self.min_move_pixels = min_move_pixels
+        self.pending_hover_pos = None
+        self.last_pick_pos = None
+        self.last_pick_time = 0.0
+        self.last_pick_camera_mtime = None
+        self.hover_timer_id = None
 
-        self.picker = vtk.vtkCellPicker()
-        self.picker.SetTolerance(0.0005)
+        self.backend = PICK_BACKENDS[pick_backend](renderer)
+        self.register_actors([merged_model.actor] if merged_model is not None else list(actor_name_map))
 
         # Bind events
-        interactor.AddObserver("MouseMoveEvent", self.on_mouse_move)
-        interactor.AddObserver("LeftButtonPressEvent", self.on_left_button_press)
+        self._observer_tags = []
+        self.attach()
+
+    def attach(self):
+        """Adds the mouse/timer observers to the interactor."""
+        if not self._observer_tags:
+            self._observer_tags = [
+                self.interactor.AddObserver("MouseMoveEvent", self.on_mouse_move),
+                self.interactor.AddObserver("LeftButtonPressEvent", self.on_left_button_press),
+                self.interactor.AddObserver("TimerEvent", self.on_timer),
+            ]
+
+    def detach(self):
+        """Removes the observers again (the interactor is shared with other scenes)."""
+        for tag in self._observer_tags:
+            self.interactor.RemoveObserver(tag)
+        self._observer_tags = []
+        if self.hover_timer_id is not None:
+            self.interactor.DestroyTimer(self.hover_timer_id)
+            self.hover_timer_id = None
+        self.pending_hover_pos = None
+
+    def register_actors(self, actors):
+        """Prepares newly added actors for picking (e.g. builds their cell locators)."""
+        self.backend.register_actors(actors)
+
+    def _pick(self, x, y):
+        """Returns the bone under (x, y): its actor, or its MergedBone in merged mode."""
+        with profiler.span("pick"):
+            picked_actor, cell_id = self.backend.pick(x, y)
+        if self.merged_model is not None and picked_actor is self.merged_model.actor:
+            return self.merged_model.bone_for_cell(cell_id)
+        return picked_actor
+
+    def _set_color(self, bone, rgb):
+        if self.merged_model is not None:
+            bone.set_color(rgb)
+        else:
+            bone.GetProperty().SetColor(rgb)
 
     def on_mouse_move(self, obj, event):
-        x, y = self.interactor.GetEventPosition()
-        self.picker.Pick(x, y, 0, self.renderer)
-        picked_actor = self.picker.GetActor()
+        """Records the cursor; picks now, or once the rate limit allows (latest position wins)."""
+        self.pending_hover_pos = self.interactor.GetEventPosition()
+        wait = self.last_pick_time + self.min_pick_interval - time.perf_counter()
+        if wait <= 0:
+            self._process_hover()
+        elif self.hover_timer_id is None:
+            self.hover_timer_id = self.interactor.CreateOneShotTimer(max(1, int(wait * 1000)))
 
-        if self.previous_actor and self.previous_actor != picked_actor:
-            self.previous_actor.GetProperty().SetColor(1, 1, 1)
+    def on_timer(self, obj, event):
+        if self.hover_timer_id is not None and self.interactor.GetTimerEventId() == self.hover_timer_id:
+            self.hover_timer_id = None
+            self._process_hover()
 
-        if picked_actor and picked_actor in self.actor_name_map:
-            bone_name = self.actor_name_map[picked_actor]
-            self.text_overlay.set_hover_text(f"Hovered: {bone_name}")
-            picked_actor.GetProperty().SetColor(1, 1, 0)
+    def _process_hover(self):
+        pos = self.pending_hover_pos
+        if pos is None:
+            return
+        self.pending_hover_pos = None
+
+        # Skip cursor jitter, unless the camera moved under the cursor since the last pick
+        camera_mtime = self.renderer.GetActiveCamera().GetMTime()
+        if (self.last_pick_pos is not None and camera_mtime == self.last_pick_camera_mtime
+                and abs(pos[0] - self.last_pick_pos[0]) < self.min_move_pixels
+                and abs(pos[1] - self.last_pick_pos[1]) < self.min_move_pixels):
+            return
+        self.last_pick_pos = pos
+        self.last_pick_time = time.perf_counter()
+        self.last_pick_camera_mtime = camera_mtime
+
+        picked_actor = self._pick(*pos)
+        if picked_actor not in self.actor_name_map:
+            picked_actor = None
+        if picked_actor == self.previous_actor:
+            return  # same highlight → nothing to redraw
+
+        with self.scheduler.batch():
+            if self.previous_actor:
+                self._set_color(self.previous_actor, (1, 1, 1))
+
+            if picked_actor:
+                bone_name = self.actor_name_map[picked_actor]
+                self.text_overlay.set_hover_text(f"Hovered: {bone_name}")
+                self._set_color(picked_actor, (1, 1, 0))
+            else:
+                self.text_overlay.set_hover_text("")
             self.previous_actor = picked_actor
-        else:
-            self.text_overlay.set_hover_text("")
-            self.previous_actor = None
+            self.scheduler.request()
 
     def on_left_button_press(self, obj, event):
+        with self.scheduler.batch():
+            self._handle_click()
+
+    def _handle_click(self):
         x, y = self.interactor.GetEventPosition()
-        self.picker.Pick(x, y, 0, self.renderer)
-        picked_actor = self.picker.GetActor()
+        picked_actor = self._pick(x, y)
 
         if picked_actor and picked_actor in self.actor_name_map:
             # Clicked a bone
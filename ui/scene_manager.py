@@ -0,0 +1,134 @@
+# ui/scene_manager.py
+from vtkmodules.vtkInteractionStyle import vtkInteractorStyleUser
+from vtkmodules.vtkRenderingCore import vtkRenderer, vtkRenderWindow, vtkRenderWindowInteractor
+
+from ui.frame_scheduler import frame_scheduler_for
+from utils.helpers import quiet_style
+from utils.profiler import profiler
+
+
+class Scene:
+    """
+    One screen of the app (menu, settings, viewer) living in the shared window.
+
+    Each scene owns a renderer that stays in the window for the whole session;
+    only the active scene's renderer draws and receives interaction. Interactor
+    observers added through listen() in on_enter() are removed again on exit.
+    """
+
+    def __init__(self, manager):
+        self.manager = manager
+        self.render_window = manager.render_window
+        self.interactor = manager.interactor
+        self.scheduler = manager.scheduler
+        self.renderer = vtkRenderer()
+        self.renderer.DrawOff()
+        self.renderer.InteractiveOff()
+        self.render_window.AddRenderer(self.renderer)
+        self._observer_tags = []
+
+    def listen(self, event, callback):
+        """Adds an interactor observer that is active until the scene is left."""
+        self._observer_tags.append(self.interactor.AddObserver(event, callback))
+
+    def enter(self):
+        self.renderer.DrawOn()
+        self.renderer.InteractiveOn()
+        self.on_enter()
+
+    def exit(self):
+        self.on_exit()
+        for tag in self._observer_tags:
+            self.interactor.RemoveObserver(tag)
+        self._observer_tags.clear()
+        self.renderer.DrawOff()
+        self.renderer.InteractiveOff()
+
+    # --- Hooks ---
+    def on_enter(self):
+        pass
+
+    def on_exit(self):
+        pass
+
+    def on_shutdown(self):
+        """Called once when the event loop has ended (e.g. to print reports)."""
+        pass
+
+
+class SceneManager:
+    """
+    Keeps one render window, interactor and GL context for the whole session and
+    swaps scenes inside it, so switching screens never recreates the context,
+    recompiles shaders or reloads models.
+    """
+
+    def __init__(self, render_window=None, interactor=None, fullscreen=True):
+        if render_window is None:
+            render_window = vtkRenderWindow()
+            if fullscreen:
+                render_window.FullScreenOn()
+        if interactor is None:
+            interactor = vtkRenderWindowInteractor()
+            interactor.SetRenderWindow(render_window)
+        self.render_window = render_window
+        self.interactor = interactor
+        self.scheduler = frame_scheduler_for(render_window)
+        self.scenes = {}
+        self.current = None
+        self.current_name = None
+        self._pending = None
+        self._switch_timer_id = None
+        self.interactor.AddObserver("TimerEvent", self._on_timer)
+
+    def add(self, name, scene):
+        self.scenes[name] = scene
+        return scene
+
+    def switch(self, name):
+        """Leaves the current scene and enters `name`."""
+        with self.scheduler.batch():
+            if self.current is not None:
+                self.current.exit()
+            # Neutral style until the new scene installs its own
+            self.interactor.SetInteractorStyle(quiet_style(vtkInteractorStyleUser()))
+            self.current, self.current_name = self.scenes[name], name
+            self.current.enter()
+            self.scheduler.request()
+
+    def switch_soon(self, name):
+        """
+        Switches once the current event has been handled. Use this from event
+        callbacks: observers the new scene adds while an event is being
+        dispatched would otherwise receive that same event (e.g. the menu click
+        would also land in the viewer as a pick).
+        """
+        self._pending = name
+        if self._switch_timer_id is None:
+            self._switch_timer_id = self.interactor.CreateOneShotTimer(1)
+            if not self._switch_timer_id:  # no running event loop
+                self._switch_timer_id = None
+                self.switch(self._pending)
+
+    def _on_timer(self, obj, event):
+        if self._switch_timer_id is not None and obj.GetTimerEventId() == self._switch_timer_id:
+            self._switch_timer_id = None
+            name, self._pending = self._pending, None
+            if name is not None:
+                self.switch(name)
+
+    def start(self):
+        """Runs the event loop until quit()."""
+        self.interactor.Initialize()
+        self.scheduler.request()
+        self.interactor.Start()
+        for scene in self.scenes.values():
+            scene.on_shutdown()
+        if profiler.enabled:
+            self.scheduler.report()
+
+    def quit(self):
+        if self.current is not None:
+            self.current.exit()
+            self.current = self.current_name = None
+        self.interactor.TerminateApp()
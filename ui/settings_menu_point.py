@@ -1,12 +1,13 @@
-import vtk
+from vtkmodules.vtkRenderingCore import vtkTextActor
 
 from language.language import set_language, t
+from ui.scene_manager import Scene
 
 
-class SettingsMenu:
-    def __init__(self, renderer, render_window, on_exit_callback=None):
-        self.renderer = renderer
-        self.render_window = render_window
+class SettingsMenu(Scene):
+    def __init__(self, scene_manager, on_exit_callback=None):
+        super().__init__(scene_manager)
+        self.manager.add("settings", self)
         self.on_exit_callback = on_exit_callback  # called when leaving settings
 
         # Settings options
@@ -14,12 +15,15 @@ class SettingsMenu:
         self.text_actors = []
         self.highlighted = None
 
+    def on_enter(self):
+        self.settings_items = ["English", "Magyar", t("menu_quit")]
+        self.highlighted = None
         self._build_settings()
         self._setup_interaction()
 
     def _build_settings(self):
         # Remove previous actors first
-        for actor in self.renderer.GetActors2D():
+        for actor in self.text_actors:
             self.renderer.RemoveActor(actor)
         self.text_actors.clear()
 
@@ -30,7 +34,7 @@ class SettingsMenu:
         start_y = height - spacing * 2
 
         for i, label in enumerate(self.settings_items):
-            text_actor = vtk.vtkTextActor()
+            text_actor = vtkTextActor()
             text_actor.SetInput(label)
             prop = text_actor.GetTextProperty()
             prop.SetFontSize(font_size)
@@ -42,13 +46,12 @@ class SettingsMenu:
             self.text_actors.append(text_actor)
 
         self.renderer.SetBackground(0.05, 0.05, 0.07)
-        self.render_window.Render()
+        self.scheduler.request()
 
     def _setup_interaction(self):
-        # Remove previous observers to prevent duplicates
-        self.render_window.GetInteractor().RemoveObservers("LeftButtonPressEvent")
-        self.render_window.GetInteractor().AddObserver("LeftButtonPressEvent", self._on_click)
-        self.render_window.GetInteractor().AddObserver("MouseMoveEvent", self._on_hover)
+        # Scene observers are removed again when the settings are left
+        self.listen("LeftButtonPressEvent", self._on_click)
+        self.listen("MouseMoveEvent", self._on_hover)
 
     def _pick_text_actor(self, x, y):
         for actor in self.text_actors:
@@ -67,7 +70,7 @@ class SettingsMenu:
         return None
 
     def _on_hover(self, obj, event):
-        x, y = self.render_window.GetInteractor().GetEventPosition()
+        x, y = self.interactor.GetEventPosition()
         picked = self._pick_text_actor(x, y)
         if picked != self.highlighted:
             for t in self.text_actors:
@@ -75,14 +78,15 @@ class SettingsMenu:
             if picked:
                 picked.GetTextProperty().SetColor(0.3, 0.8, 1.0)
             self.highlighted = picked
-            self.render_window.Render()
+            self.scheduler.request()
 
     def _on_click(self, obj, event):
-        x, y = self.render_window.GetInteractor().GetEventPosition()
+        x, y = self.interactor.GetEventPosition()
         picked = self._pick_text_actor(x, y)
         if picked:
             label = self.settings_items[self.text_actors.index(picked)]
-            self.handle_selection(label)
+            with self.scheduler.batch():
+                self.handle_selection(label)
         return
 
     def handle_selection(self, label):
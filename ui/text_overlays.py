@@ -1,10 +1,13 @@
 # ui/text_overlays.py
 import vtk
 
+from ui.frame_scheduler import frame_scheduler_for
+
 
 class TextOverlayManager:
     def __init__(self, renderer):
         self.renderer = renderer
+        self.scheduler = frame_scheduler_for(renderer.GetRenderWindow())
 
         # Hover text
         self.hover_actor = vtk.vtkTextActor()
@@ -22,6 +25,26 @@ class TextOverlayManager:
         self.hint_actor.SetPosition(0.02, 0.7)
         renderer.AddActor2D(self.hint_actor)
 
+        # Status line (model loading progress)
+        self.status_actor = vtk.vtkTextActor()
+        self.status_actor.GetTextProperty().SetFontSize(22)
+        self.status_actor.GetTextProperty().SetColor(0.3, 0.8, 1.0)
+        self.status_actor.GetTextProperty().SetJustificationToCentered()
+        self.status_actor.GetPositionCoordinate().SetCoordinateSystemToNormalizedViewport()
+        self.status_actor.SetPosition(0.5, 0.05)
+        renderer.AddActor2D(self.status_actor)
+
+        # Profiler readout (top-right corner, only filled when profiling)
+        self.profile_actor = vtk.vtkTextActor()
+        self.profile_actor.GetTextProperty().SetFontSize(16)
+        self.profile_actor.GetTextProperty().SetFontFamilyToCourier()
+        self.profile_actor.GetTextProperty().SetColor(0.6, 1.0, 0.6)
+        self.profile_actor.GetTextProperty().SetJustificationToRight()
+        self.profile_actor.GetTextProperty().SetVerticalJustificationToTop()
+        self.profile_actor.GetPositionCoordinate().SetCoordinateSystemToNormalizedViewport()
+        self.profile_actor.SetPosition(0.98, 0.97)
+        renderer.AddActor2D(self.profile_actor)
+
         # Initial state
         self.update_hints(rotation_enabled=False)
 
@@ -42,12 +65,22 @@ class TextOverlayManager:
     • Press F → reset camera
     • Press Q → quit
     """)
-        self.renderer.GetRenderWindow().Render()
+        self.scheduler.request()
 
     def set_hover_text(self, text: str):
-        """Set the text shown on hover."""
+        """Set the text shown on hover (renders only if the text actually changed)."""
+        if (self.hover_actor.GetInput() or "") == text:
+            return
         self.hover_actor.SetInput(text)
-        self.renderer.GetRenderWindow().Render()
+        self.scheduler.request()
+
+    def set_status_text(self, text: str):
+        """Set the status line (e.g. loading progress). Rendered with the next frame."""
+        self.status_actor.SetInput(text)
+
+    def set_profile_text(self, text: str):
+        """Set the profiler readout. Rendered with the next frame."""
+        self.profile_actor.SetInput(text)
 
     def update_rotation_hint(self, enabled: bool):
         """Convenience method for KeyHandler to update only the rotation state."""
@@ -4,12 +4,15 @@ import math
 def get_actor_center(actor):
     """
     Returns the 3D geometric center of a VTK actor based on its bounds.
+    Non-actor bone handles (merged mode) only need to provide GetBounds().
     """
-    mapper = actor.GetMapper()
-    if not mapper or not mapper.GetInput():
-        return [0.0, 0.0, 0.0]
-
-    bounds = mapper.GetInput().GetBounds()
+    if hasattr(actor, "GetMapper"):
+        mapper = actor.GetMapper()
+        if not mapper or not mapper.GetInput():
+            return [0.0, 0.0, 0.0]
+        bounds = mapper.GetInput().GetBounds()
+    else:
+        bounds = actor.GetBounds()
     center = [
         (bounds[0] + bounds[1]) / 2.0,
         (bounds[2] + bounds[3]) / 2.0,
@@ -18,6 +21,15 @@ def get_actor_center(actor):
     return center
 
 
+def quiet_style(style):
+    """
+    Disables VTK's built-in key bindings on an interactor style ('q'/'e' exit,
+    'r'/'f' camera resets, 'w' wireframe...); the app handles its own keys.
+    """
+    style.AddObserver("CharEvent", lambda obj, event: None)
+    return style
+
+
 def vector_sub(v1, v2):
     """Subtract v2 from v1: v1 - v2"""
     return [v1[i] - v2[i] for i in range(3)]
@@ -0,0 +1,45 @@
+# utils/prewarm.py
+import importlib
+import os
+import threading
+
+# Viewer stack imported in the background (pulls in the full vtk package, numpy, loaders)
+VIEWER_MODULES = ("viewer_app",)
+
+
+class Prewarmer:
+    """
+    Warms up the viewer on a background thread while the menu sits idle:
+    imports the viewer modules and makes sure the model's binary mesh cache and
+    bone index are built, so choosing the viewer neither waits for imports nor parses the OBJ.
+    """
+
+    def __init__(self, model_path: str, modules=VIEWER_MODULES):
+        self.model_path = model_path
+        self.modules = modules
+        self.error = None
+        self.done = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="viewer-prewarm", daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self):
+        try:
+            for name in self.modules:
+                importlib.import_module(name)
+            if os.path.exists(self.model_path):
+                from model.mesh_cache import MeshCache
+                from model.obj_loader import VIEWER_LOAD_OPTIONS, ObjLoader
+                ObjLoader(self.model_path, cache=MeshCache(), **VIEWER_LOAD_OPTIONS).load_bone_index()
+        except Exception as exc:  # the viewer simply loads normally if warm-up failed
+            self.error = exc
+            print(f"[Prewarm] Failed: {exc}")
+        finally:
+            self.done.set()
+
+    def wait(self, timeout: float = None) -> bool:
+        return self.done.wait(timeout)
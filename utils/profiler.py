@@ -0,0 +1,162 @@
+# utils/profiler.py
+import atexit
+import json
+import os
+import threading
+import time
+from collections import deque
+
+# Set to "1" (default trace file) or to a trace file path to profile a session
+PROFILE_ENV_VAR = "SKELETON_PROFILE"
+DEFAULT_TRACE_PATH = "profile_trace.json"
+# Samples per span name kept for the rolling percentiles
+WINDOW = 512
+# Trace events kept for the dump (oldest dropped first on long sessions)
+MAX_TRACE_EVENTS = 200_000
+
+
+class _Span:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = self.profiler.clock()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, self.start, self.profiler.clock() - self.start)
+        return False
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Profiler:
+    """
+    Opt-in timing of load phases, picks, animation frames and renders.
+
+    Keeps a rolling window of durations per span name (for p50/p95/p99) and a
+    Chrome trace event list, written to a JSON file on exit. When disabled,
+    span() returns a shared no-op context manager.
+    """
+
+    def __init__(self, enabled: bool = False, trace_path: str = DEFAULT_TRACE_PATH,
+                 window: int = WINDOW, clock=time.perf_counter):
+        self.enabled = False
+        self.trace_path = trace_path
+        self.window = window
+        self.clock = clock
+        self.samples = {}
+        self.counters = {}  # counter name → latest {series: value}
+        self.events = deque(maxlen=MAX_TRACE_EVENTS)
+        self._origin = clock()
+        self._render_start = None
+        if enabled:
+            self.enable(trace_path)
+
+    def enable(self, trace_path: str = None):
+        if trace_path:
+            self.trace_path = trace_path
+        if not self.enabled:
+            self.enabled = True
+            atexit.register(self.dump)
+
+    # --- Recording ---
+    def span(self, name: str):
+        """with profiler.span("pick"): ... → one timed sample (no-op when disabled)."""
+        return _Span(self, name) if self.enabled else _NULL_SPAN
+
+    def record(self, name: str, start: float, duration: float):
+        if name not in self.samples:
+            self.samples[name] = deque(maxlen=self.window)
+        self.samples[name].append(duration)
+        self.events.append({
+            "name": name,
+            "cat": name.split(".", 1)[0],
+            "ph": "X",
+            "ts": (start - self._origin) * 1e6,
+            "dur": duration * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        })
+
+    def counter(self, name: str, **values):
+        """Per-frame counts (e.g. culled vs drawn actors): latest values + a trace counter track."""
+        if not self.enabled:
+            return
+        self.counters[name] = values
+        self.events.append({
+            "name": name,
+            "ph": "C",
+            "ts": (self.clock() - self._origin) * 1e6,
+            "pid": os.getpid(),
+            "args": values,
+        })
+
+    def attach_render_window(self, render_window):
+        """Times every Render() of the window, whoever triggers it."""
+        if self.enabled:
+            render_window.AddObserver("StartEvent", self._on_render_start)
+            render_window.AddObserver("EndEvent", self._on_render_end)
+
+    def _on_render_start(self, obj, event):
+        self._render_start = self.clock()
+
+    def _on_render_end(self, obj, event):
+        if self._render_start is not None:
+            self.record("render", self._render_start, self.clock() - self._render_start)
+            self._render_start = None
+
+    # --- Reporting ---
+    def summary(self) -> dict:
+        """{span name: {count, p50_ms, p95_ms, p99_ms}} over the rolling window."""
+        result = {}
+        for name, durations in sorted(self.samples.items()):
+            ordered = sorted(durations)
+            p50, p95, p99 = (ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000 for q in (0.50, 0.95, 0.99))
+            result[name] = {"count": len(durations), "p50_ms": p50, "p95_ms": p95, "p99_ms": p99}
+        return result
+
+    def overlay_text(self) -> str:
+        lines = ["span          p50    p95    p99 ms"]
+        for name, stats in self.summary().items():
+            lines.append(f"{name:<12} {stats['p50_ms']:6.2f} {stats['p95_ms']:6.2f} {stats['p99_ms']:6.2f}")
+        for name, values in sorted(self.counters.items()):
+            lines.append(f"{name:<12} " + " ".join(f"{key}={value}" for key, value in values.items()))
+        return "\n".join(lines)
+
+    def dump(self, path: str = None):
+        """Writes the trace (chrome://tracing / Perfetto format) plus the percentile summary."""
+        if not self.enabled:
+            return
+        path = path or self.trace_path
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({
+                "traceEvents": list(self.events),
+                "displayTimeUnit": "ms",
+                "summary": self.summary(),
+                "counters": self.counters,
+            }, file)
+        print(f"[Profiler] Trace written to {path}")
+
+
+def _from_env() -> Profiler:
+    value = os.environ.get(PROFILE_ENV_VAR, "")
+    if value in ("", "0"):
+        return Profiler()
+    return Profiler(enabled=True, trace_path=DEFAULT_TRACE_PATH if value == "1" else value)
+
+
+# Process-wide profiler; enabled via SKELETON_PROFILE or main.py --profile
+profiler = _from_env()
@@ -0,0 +1,243 @@
+# utils/thumbnails.py
+"""
+Headless batch renderer for bone thumbnails and per-view atlas sheets
+(handouts, web). Each worker process keeps one offscreen render window — one
+GL context — for all of its shots.
+
+    python -m utils.thumbnails models/female_human_skeleton.obj --out thumbnails
+    python -m utils.thumbnails MODEL --views front left --modes highlighted --size 256 --workers 4 --atlas
+"""
+import argparse
+import math
+import multiprocessing
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import vtk
+from vtk.util import numpy_support
+
+from camera.camera_animator import apply_camera_state
+from camera.camera_controller import zoom_target_state
+from model.mesh_cache import MeshCache
+from model.obj_loader import ObjLoader, make_actors
+
+# Canonical views: direction from the model towards the camera, and view-up (the model is Y-up)
+VIEWS = {
+    "front": ((0, 0, 1), (0, 1, 0)),
+    "back": ((0, 0, -1), (0, 1, 0)),
+    "right": ((1, 0, 0), (0, 1, 0)),
+    "left": ((-1, 0, 0), (0, 1, 0)),
+    "top": ((0, 1, 0), (0, 0, -1)),
+    "bottom": ((0, -1, 0), (0, 0, 1)),
+}
+# isolated: the bone alone, framed to fill the image; highlighted: in place on the skeleton, zoomed like the viewer
+MODES = ("isolated", "highlighted")
+DEFAULT_SIZE = 512
+VIEW_ANGLE = 30.0
+# Same colours as the viewer's hover highlight; the rest of the skeleton is dimmed behind it
+BONE_COLOR = (1, 1, 1)
+HIGHLIGHT_COLOR = (1, 1, 0)
+CONTEXT_COLOR = (0.45, 0.45, 0.45)
+
+
+def _slug(name):
+    return re.sub(r"[^A-Za-z0-9]+", "_", name).strip("_").lower() or "bone"
+
+
+def thumbnail_path(out_dir, mode, row, name, view):
+    return os.path.join(out_dir, mode, f"{row:03d}_{_slug(name)}_{view}.png")
+
+
+class ThumbnailRenderer:
+    """
+    Renders shots of one model through a single offscreen vtkRenderWindow.
+    Every bone gets its actor once; a shot only toggles visibility/colour and
+    moves the camera, so the GPU buffers are uploaded once per process.
+    """
+
+    def __init__(self, obj_path, size=DEFAULT_SIZE, cache_dir=None):
+        loader = ObjLoader(obj_path, cache=MeshCache(cache_dir))
+        groups = loader.load_groups()
+        self.bone_index = loader.load_bone_index(groups)
+        self.names = self.bone_index.names
+        self.actors = make_actors([group.to_polydata() for group in groups], loader.load_instances(groups))
+
+        self.renderer = vtk.vtkRenderer()
+        self.renderer.SetBackground(0, 0, 0)
+        self.renderer.SetBackgroundAlpha(0.0)
+        for actor in self.actors:
+            self.renderer.AddActor(actor)
+
+        self.window = vtk.vtkRenderWindow()
+        self.window.SetOffScreenRendering(1)
+        self.window.SetAlphaBitPlanes(1)
+        self.window.SetSize(size, size)
+        self.window.AddRenderer(self.renderer)
+
+        # Transparent background, so one PNG works on paper and on web pages
+        self.grabber = vtk.vtkWindowToImageFilter()
+        self.grabber.SetInput(self.window)
+        self.grabber.SetInputBufferTypeToRGBA()
+        self.grabber.ReadFrontBufferOff()
+        self.writer = vtk.vtkPNGWriter()
+        self.writer.SetInputConnection(self.grabber.GetOutputPort())
+
+        # Whole-model framing each view's zoom starts from (as the viewer's ResetCamera)
+        bounds = self.bone_index.bounds
+        lo, hi = bounds[:, 0::2].min(axis=0), bounds[:, 1::2].max(axis=0)
+        self.model_center = (lo + hi) / 2
+        radius = float(np.linalg.norm(hi - lo)) / 2
+        self.model_distance = radius / math.sin(math.radians(VIEW_ANGLE) / 2)
+
+    def reference_state(self, view):
+        direction, view_up = VIEWS[view]
+        return {
+            "position": tuple(self.model_center + np.asarray(direction) * self.model_distance),
+            "focal_point": tuple(self.model_center),
+            "view_up": view_up,
+            "view_angle": VIEW_ANGLE,
+        }
+
+    def _show(self, row, mode):
+        for index, actor in enumerate(self.actors):
+            if mode == "isolated":
+                actor.SetVisibility(index == row)
+                actor.GetProperty().SetColor(BONE_COLOR)
+            else:
+                actor.SetVisibility(True)
+                actor.GetProperty().SetColor(HIGHLIGHT_COLOR if index == row else CONTEXT_COLOR)
+
+    def render(self, row, view, mode, path):
+        """Renders one bone from one canonical view into a PNG."""
+        self._show(row, mode)
+        center = self.bone_index.center(row)
+        reference = self.reference_state(view)
+        if mode == "isolated":
+            state = zoom_target_state(center, reference, self.bone_index.framing_distance(row, VIEW_ANGLE))
+        else:
+            state = zoom_target_state(center, reference)
+        apply_camera_state(self.renderer.GetActiveCamera(), state)
+        self.renderer.ResetCameraClippingRange()
+        self.window.Render()
+
+        self.grabber.Modified()
+        self.writer.SetFileName(path)
+        self.writer.Write()
+        return path
+
+    def close(self):
+        self.window.Finalize()
+
+
+def _render_rows(obj_path, cache_dir, rows, views, modes, size, out_dir):
+    """Worker: one renderer (GL context) for all shots of these bones. Returns the written paths."""
+    renderer = ThumbnailRenderer(obj_path, size, cache_dir)
+    written = []
+    try:
+        for mode in modes:
+            for row in rows:
+                for view in views:
+                    path = thumbnail_path(out_dir, mode, row, renderer.names[row], view)
+                    written.append(renderer.render(row, view, mode, path))
+    finally:
+        renderer.close()
+    return written
+
+
+def build_atlas(paths, atlas_path, columns=None):
+    """Tiles equally sized RGBA PNGs into one sheet, row by row."""
+    images = []
+    for path in paths:
+        reader = vtk.vtkPNGReader()
+        reader.SetFileName(path)
+        reader.Update()
+        data = reader.GetOutput()
+        width, height, _ = data.GetDimensions()
+        pixels = numpy_support.vtk_to_numpy(data.GetPointData().GetScalars())
+        images.append(pixels.reshape(height, width, -1))
+    if not images:
+        return None
+
+    columns = columns or math.ceil(math.sqrt(len(images)))
+    rows = math.ceil(len(images) / columns)
+    height, width, channels = images[0].shape
+    sheet = np.zeros((rows * height, columns * width, channels), dtype=np.uint8)
+    # vtkImageData rows run bottom-up: place tile 0 at the top-left of the final image
+    for index, image in enumerate(images):
+        row, column = divmod(index, columns)
+        top = (rows - 1 - row) * height
+        sheet[top:top + height, column * width:(column + 1) * width] = image
+
+    image_data = vtk.vtkImageData()
+    image_data.SetDimensions(columns * width, rows * height, 1)
+    scalars = numpy_support.numpy_to_vtk(sheet.reshape(-1, channels), deep=True)
+    image_data.GetPointData().SetScalars(scalars)
+    writer = vtk.vtkPNGWriter()
+    writer.SetFileName(atlas_path)
+    writer.SetInputData(image_data)
+    writer.Write()
+    return atlas_path
+
+
+def render_thumbnails(obj_path, out_dir, views=tuple(VIEWS), modes=MODES, size=DEFAULT_SIZE,
+                      workers=1, rows=None, atlas=False, cache_dir=None):
+    """
+    Renders every (mode, bone, view) shot. Returns the written thumbnail paths.
+    workers: processes, each with its own offscreen context (bones are dealt out round-robin)
+    rows: bone index rows to render (default: all bones)
+    """
+    # Build the mesh cache, bone index and instance table once; workers only memory-map them
+    loader = ObjLoader(obj_path, cache=MeshCache(cache_dir))
+    groups = loader.load_groups()
+    bone_index = loader.load_bone_index(groups)
+    loader.load_instances(groups)
+    rows = list(range(len(bone_index))) if rows is None else list(rows)
+    for mode in modes:
+        os.makedirs(os.path.join(out_dir, mode), exist_ok=True)
+
+    start = time.perf_counter()
+    workers = max(1, min(workers, len(rows)))
+    if workers == 1:
+        paths = _render_rows(obj_path, cache_dir, rows, views, modes, size, out_dir)
+    else:
+        # Segments are sorted by size, so round-robin spreads the big bones across workers.
+        # "spawn": a fresh interpreter per worker, so no GL state is inherited through fork
+        chunks = [rows[i::workers] for i in range(workers)]
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            futures = [pool.submit(_render_rows, obj_path, cache_dir, chunk, views, modes, size, out_dir)
+                       for chunk in chunks]
+            paths = [path for future in futures for path in future.result()]
+    elapsed = time.perf_counter() - start
+    print(f"[Thumbnails] {len(paths)} shots in {elapsed:.1f} s "
+          f"({len(paths) / elapsed:.1f} shots/s, {workers} worker(s), {size}x{size})")
+
+    if atlas:
+        for mode in modes:
+            for view in views:
+                sheet = [thumbnail_path(out_dir, mode, row, bone_index.names[row], view) for row in rows]
+                atlas_path = build_atlas(sheet, os.path.join(out_dir, mode, f"atlas_{view}.png"))
+                print(f"[Thumbnails] Atlas: {atlas_path}")
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("obj_path", nargs="?", default="models/female_human_skeleton.obj")
+    parser.add_argument("--out", default="thumbnails", help="output directory (one folder per mode)")
+    parser.add_argument("--views", nargs="+", choices=tuple(VIEWS), default=tuple(VIEWS))
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=MODES)
+    parser.add_argument("--size", type=int, default=DEFAULT_SIZE, help="thumbnail width/height in pixels")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--bones", type=int, nargs="+", default=None, help="only these bone index rows")
+    parser.add_argument("--atlas", action="store_true", help="also tile each mode/view into atlas_<view>.png")
+    parser.add_argument("--cache-dir", default=None, help="mesh cache directory (default: next to the model)")
+    args = parser.parse_args(argv)
+    render_thumbnails(args.obj_path, args.out, args.views, args.modes, args.size,
+                      args.workers, args.bones, args.atlas, args.cache_dir)
+
+
+if __name__ == "__main__":
+    main()
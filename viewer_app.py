@@ -1,23 +1,83 @@
-import vtk
-from model.obj_loader import ObjLoader
+from model.obj_loader import VIEWER_LOAD_OPTIONS, ObjLoader, instance_actors, make_actor, make_actors
+from model.mesh_cache import MeshCache
+from model.async_loader import AsyncModelLoader
+from model.actor_registry import ActorRegistry
+from model.merged_model import MergedModel
+from model.lod import LOD_REDUCTIONS, load_lod_tiers
 from camera.camera_controller import CameraController
+from camera.culling_manager import CullingManager
+from camera.lod_manager import DEFAULT_TARGET_FRAME_TIME, LodManager
 from ui.picker_handler import PickerHandler
+from ui.scene_manager import Scene, SceneManager
 from ui.text_overlays import TextOverlayManager
+from utils.profiler import profiler
 
 
-class SkeletonViewerApp:
-    def __init__(self, obj_path):
-        # Core renderer setup
-        self.renderer = vtk.vtkRenderer()
-        self.render_window = vtk.vtkRenderWindow()
-        self.render_window.AddRenderer(self.renderer)
-        self.render_window.FullScreenOn()
+# Progressive loading: actors added per timer tick, and the tick interval in ms
+GROUPS_PER_FRAME = 8
+LOAD_TIMER_INTERVAL = 16
+# Profiler overlay refresh interval in ms (only when profiling)
+PROFILE_OVERLAY_INTERVAL = 500
 
-        self.interactor = vtk.vtkRenderWindowInteractor()
-        self.interactor.SetRenderWindow(self.render_window)
+
+class SkeletonViewerApp(Scene):
+    """The 3D skeleton viewer, as the "viewer" scene of a SceneManager."""
+
+    def __init__(self, obj_path, progressive=True, merged=False, pick_backend="cpu",
+                 lod=False, target_frame_time=DEFAULT_TARGET_FRAME_TIME, culling=True, occlusion=False,
+                 instancing=True, scene_manager=None, registry=None):
+        """
+        progressive: load in the background and add bones as they arrive
+        merged: render all bones through one actor (single draw call); loads synchronously
+        pick_backend: "cpu" or "hardware" hover/click picking (see ui.pick_backends)
+        lod: decimated tiers while rotating/animating, full detail when idle (progressive loading
+             adds the tiers once every bone has arrived)
+        target_frame_time: frame budget (seconds) the LOD manager aims for while interacting
+        culling: hide (and stop picking) bones outside the view frustum; per-bone actors only
+        occlusion: also hide bones fully covered by others once the camera settles
+        instancing: bones that are rigid/mirrored copies of another draw its geometry through a
+                    UserMatrix (see model.instancing); progressive loading applies it once every
+                    bone has arrived
+        scene_manager: the app's shared window (e.g. the menu's); None → own fullscreen window
+        registry: ModelRegistry shared between modules; resident models open instantly,
+                  and what this viewer loads is handed to it
+        """
+        super().__init__(scene_manager or SceneManager())
+        self.manager.add("viewer", self)
+        profiler.attach_render_window(self.render_window)
+        self.profile_timer_id = None
+
+        # Model state (filled synchronously, or progressively by the load timer)
+        self.obj_path = obj_path
+        self.registry = registry
+        self.instancing = instancing
+        self.actors = []
+        self.actor_map = ActorRegistry()
+        self.model_loader = None
+        self.load_timer_id = None
+        self.merged_model = None
+        self.lod_manager = None
+        self.culling_manager = None
+        self.bone_index = None  # BoneIndex; row i describes self.actors[i] (merged: bone i)
 
         # Load 3D model
-        self._load_model(obj_path)
+        if lod and not merged:
+            self.lod_manager = LodManager(self.render_window, self.interactor, target_frame_time)
+        if merged:
+            self._load_merged_model(obj_path)
+        elif registry is not None and registry.is_loaded(obj_path):
+            self._load_model(obj_path)
+        elif progressive:
+            self.model_loader = AsyncModelLoader(ObjLoader(obj_path, cache=MeshCache(), **VIEWER_LOAD_OPTIONS),
+                                                 lod_reductions=LOD_REDUCTIONS if lod else None).start()
+        elif lod:
+            self._load_lod_model(obj_path)
+        else:
+            self._load_model(obj_path)
+        if culling and not merged:
+            self.culling_manager = CullingManager(self.renderer, self.interactor, occlusion)
+            if self.actors:
+                self.culling_manager.add_actors(self.actors, self._actor_bounds())
 
         # Setup camera and UI
         self.text_mgr = TextOverlayManager(self.renderer)
@@ -25,42 +85,195 @@ class SkeletonViewerApp:
             self.renderer.GetActiveCamera(),
             self.renderer,
             self.interactor,
-            text_overlay_manager=self.text_mgr
+            text_overlay_manager=self.text_mgr,
+            on_quit=self.close
         )
         self.picker_handler = PickerHandler(
             self.interactor,
             self.renderer,
             self.actor_map,
             self.text_mgr,
-            self.camera_ctrl
+            self.camera_ctrl,
+            merged_model=self.merged_model,
+            pick_backend=pick_backend
         )
+        self._bind_bone_index()
+        # Camera/picking controls only listen while the viewer scene is active
+        self.camera_ctrl.detach()
+        self.picker_handler.detach()
+        self.started = False
+
+    def _bind_bone_index(self):
+        if self.bone_index is not None:
+            bones = self.merged_model.bones if self.merged_model is not None else self.actors
+            self.camera_ctrl.set_bone_index(self.bone_index, bones)
+
+    def _actor_bounds(self):
+        """Per-actor bounds from the bone index (already computed), else None (actors measure themselves)."""
+        if self.bone_index is not None and len(self.bone_index) == len(self.actors):
+            return self.bone_index.bounds
+        return None
+
+    def _load_merged_model(self, obj_path):
+        loader = ObjLoader(obj_path, cache=MeshCache(), **VIEWER_LOAD_OPTIONS)
+        groups = loader.load_groups()
+        self.bone_index = loader.load_bone_index(groups)
+        self.merged_model = MergedModel(groups, self.bone_index)
+        self.actors = [self.merged_model.actor]
+        self.actor_map = ActorRegistry(self.merged_model.name_map())
+        self.renderer.AddActor(self.merged_model.actor)
+        self.renderer.ResetCamera()
+
+    def _load_lod_model(self, obj_path):
+        loader = ObjLoader(obj_path, cache=MeshCache(), **VIEWER_LOAD_OPTIONS)
+        tiers = load_lod_tiers(loader)
+        self.bone_index = loader.load_bone_index(tiers[0])
+        instances = loader.load_instances(tiers[0]) if self.instancing else None
+        self.actors = make_actors([group.to_polydata() for group in tiers[0]], instances)
+        for actor, group in zip(self.actors, tiers[0]):
+            self.renderer.AddActor(actor)
+            self.actor_map[actor] = group.name
+        self._add_lod_tiers(tiers[1:], instances)
+        self.renderer.ResetCamera()
+
+    def _add_lod_tiers(self, tiers, instances=None):
+        """Hands each actor's decimated tiers ([tier1_groups, ...], row-aligned with self.actors) to the LOD manager."""
+        tier_polydata = [[group.to_polydata() for group in tier] for tier in tiers]
+        if instances is not None:
+            # Copies also draw their prototype's decimated tiers
+            tier_polydata = [instances.shared_polydata(polydata) for polydata in tier_polydata]
+        for index, actor in enumerate(self.actors):
+            self.lod_manager.add_actor(actor, [polydata[index] for polydata in tier_polydata])
 
     def _load_model(self, obj_path):
-        loader = ObjLoader(obj_path)
-        self.actors, self.actor_map = loader.load_grouped_obj()
+        if self.registry is not None:
+            model = self.registry.get(obj_path)
+            self.actors, self.actor_map = model.make_actors(self.instancing)
+            self.bone_index = model.bone_index
+            if self.lod_manager is not None:
+                tiers = load_lod_tiers(ObjLoader(obj_path, cache=MeshCache(), **VIEWER_LOAD_OPTIONS), base=model.groups)[1:]
+                self._add_lod_tiers(tiers, model.instances if self.instancing else None)
+        else:
+            loader = ObjLoader(obj_path, cache=MeshCache(), **VIEWER_LOAD_OPTIONS)
+            groups = loader.load_groups()
+            instances = loader.load_instances(groups) if self.instancing else None
+            self.actors = make_actors([group.to_polydata() for group in groups], instances)
+            self.actor_map = ActorRegistry({actor: group.name for actor, group in zip(self.actors, groups)})
+            self.bone_index = loader.load_bone_index(groups)
         for actor in self.actors:
             self.renderer.AddActor(actor)
         self.renderer.ResetCamera()
 
-    def run(self):
-        self.render_window.Render()
-        self.interactor.Start()
-        print("Viewer closed, returning to main menu.")
-
-    def load_viewer(self, obj_path):
-        loader = ObjLoader(obj_path)
-        actors, actor_map = loader.load_grouped_obj()
-        for actor in actors:
+    def _start_progressive_loading(self):
+        self.loaded_groups = []
+        self.text_mgr.set_status_text("Loading model... 0%")
+        self.interactor.Initialize()
+        self.interactor.AddObserver("TimerEvent", self._on_load_tick)
+        self.load_timer_id = self.interactor.CreateRepeatingTimer(LOAD_TIMER_INTERVAL)
+
+    def _on_load_tick(self, obj, event):
+        """Drains a few finished groups per frame into the scene."""
+        if self.load_timer_id is None or self.interactor.GetTimerEventId() != self.load_timer_id:
+            return
+
+        first_batch = not self.actors
+        groups = self.model_loader.poll(GROUPS_PER_FRAME)
+        new_actors = []
+        for group in groups:
+            actor = make_actor(group.to_polydata())
             self.renderer.AddActor(actor)
-        self.renderer.ResetCamera()
+            new_actors.append(actor)
+            self.actor_map[actor] = group.name  # shared with PickerHandler → pickable right away
+        self.actors.extend(new_actors)
+        self.loaded_groups.extend(groups)
+        self.picker_handler.register_actors(new_actors)
+        if self.culling_manager is not None:
+            self.culling_manager.add_actors(new_actors)
 
-        self.text_mgr = TextOverlayManager(self.renderer)
-        self.camera_ctrl = CameraController(self.renderer.GetActiveCamera(),
-                                            self.renderer,
-                                            self.interactor,
-                                            text_overlay_manager=self.text_mgr)
-        self.picker_handler = PickerHandler(self.interactor,
-                                            self.renderer,
-                                            actor_map,
-                                            self.text_mgr,
-                                            self.camera_ctrl)
+        if first_batch and groups:
+            self.renderer.ResetCamera()
+            self.camera_ctrl.save_initial_state()
+
+        if self.model_loader.finished:
+            self.interactor.DestroyTimer(self.load_timer_id)
+            self.load_timer_id = None
+            if self.model_loader.error is not None:
+                print(f"Model loading failed: {self.model_loader.error}")
+                self.text_mgr.set_status_text("Model loading failed")
+            else:
+                self.text_mgr.set_status_text("")
+                self.bone_index = self.model_loader.bone_index
+                self._bind_bone_index()
+                polydata = [actor.GetMapper().GetInput() for actor in self.actors]
+                instances = self.model_loader.instances if self.instancing else None
+                if instances is not None and len(instances) == len(self.actors):
+                    self.picker_handler.register_actors(instance_actors(self.actors, polydata, instances))
+                else:
+                    instances = None
+                if self.lod_manager is not None and self.model_loader.lod_tiers is not None:
+                    self._add_lod_tiers(self.model_loader.lod_tiers, instances)
+                if self.registry is not None:
+                    self.registry.adopt(self.obj_path, self.loaded_groups, polydata, self.bone_index, instances)
+                # Frame the complete model unless the user is already inspecting a bone
+                if not self.camera_ctrl.bone_zoom_state:
+                    self.renderer.ResetCamera()
+                    self.camera_ctrl.save_initial_state()
+            self.model_loader = None
+        elif groups or first_batch:
+            self.text_mgr.set_status_text(f"Loading model... {int(self.model_loader.progress * 100)}%")
+        else:
+            return  # nothing changed this tick
+        self.scheduler.request()
+
+    def _start_profile_overlay(self):
+        self.interactor.Initialize()
+        self.interactor.AddObserver("TimerEvent", self._on_profile_tick)
+        self.profile_timer_id = self.interactor.CreateRepeatingTimer(PROFILE_OVERLAY_INTERVAL)
+
+    def _on_profile_tick(self, obj, event):
+        if self.profile_timer_id is None or self.interactor.GetTimerEventId() != self.profile_timer_id:
+            return
+        text = profiler.overlay_text()
+        if text != (self.text_mgr.profile_actor.GetInput() or ""):
+            self.text_mgr.set_profile_text(text)
+            self.scheduler.request()
+
+    # --- Scene hooks ---
+    def on_enter(self):
+        self.camera_ctrl.attach()
+        self.picker_handler.attach()
+        if not self.started:
+            # Loading keeps running in the background if the user goes back to the menu
+            self.started = True
+            if self.model_loader is not None:
+                self._start_progressive_loading()
+            if profiler.enabled:
+                self._start_profile_overlay()
+
+    def on_exit(self):
+        self.camera_ctrl.detach()
+        self.picker_handler.detach()
+
+    def on_shutdown(self):
+        if profiler.enabled:
+            print(profiler.overlay_text())
+        if self.lod_manager is not None:
+            for tier, stats in self.lod_manager.report().items():
+                print(f"[LOD] tier {tier}: {stats['frames']} frames, mean {stats['mean_ms']:.2f} ms")
+        if profiler.enabled and self.culling_manager is not None and self.culling_manager.frames:
+            stats = self.culling_manager.report()
+            print(f"[Culling] {stats['frames']} frames, {stats['actors']} actors: mean drawn {stats['drawn']:.1f}, "
+                  f"frustum-culled {stats['frustum_culled']:.1f}, occluded {stats['occluded']:.1f}")
+
+    def close(self):
+        """'Q': back to the menu scene (model stays loaded), or quit when running standalone."""
+        if "menu" in self.manager.scenes:
+            print("Viewer closed, returning to main menu.")
+            self.manager.switch_soon("menu")
+        else:
+            self.manager.quit()
+
+    def run(self):
+        """Standalone use: show the viewer and run the event loop."""
+        self.manager.switch("viewer")
+        self.manager.start()